@@ -4,7 +4,9 @@ Created Date: 2025-07-19
 Programmer: Kwanju Eun
 Description: Base account classes for the bank system
 """
-from datetime import datetime, timedelta
+from fractions import Fraction
+from clock import get_default_clock
+from money import to_minor, interest_amount
 from exceptions import InvalidPasswordError, InvalidAmountError, ContractValueError
 
 
@@ -17,32 +19,48 @@ class BankAccount:
         self._bank_account_number = None  # Will be set by Bank
         self._interest_rate = interest_rate
         self._balance = 0
-        self._created_date = datetime.now()
+        self._opening_balance = 0
+        self._clock = get_default_clock()
+        self._created_date = self._clock.now()
         self._bank = None  # Reference to Bank
 
     def set_bank(self, bank):
-        """Set bank reference"""
+        """Set bank reference (account then follows the bank's clock and is created at its current time)"""
         self._bank = bank
+        self._clock = bank.get_clock()
+        self._set_created_date(self._clock.now())
+
+    def _set_created_date(self, created_date):
+        """Set creation date (and anything dated from it)"""
+        self._created_date = created_date
 
     def set_account_number(self, account_number):
         """Set account number (called by Bank)"""
         self._bank_account_number = account_number
 
+    def set_opening_balance(self, amount):
+        """Set balance carried over from another system (used by bulk import)"""
+        amount = to_minor(amount)
+        self._opening_balance = amount
+        self._balance = amount
+
     def _validate_password(self, password):
         """Validate password"""
         if password != self._password:
             raise InvalidPasswordError("Incorrect password.")
 
     def _validate_amount(self, amount):
-        """Validate amount for basic operations"""
+        """Validate amount for basic operations; returns it in minor units"""
+        amount = to_minor(amount)
         if amount <= 0:
             raise InvalidAmountError("Amount must be greater than 0.")
+        return amount
 
     def deposit(self, amount):
         """Deposit money to account"""
         try:
-            self._validate_amount(amount)
-            self._balance += amount
+            amount = self._validate_amount(amount)
+            self._apply_balance_change(amount)
             if self._bank:
                 self._bank.add_transaction(
                     self._bank_account_number, 
@@ -59,18 +77,32 @@ class BankAccount:
         finally:
             print("[Deposit Process Finished]")
 
-    def _check_withdrawal_allowed(self, amount):
-        """Check if withdrawal is allowed - can be overridden"""
-        if self._balance < amount:
+    def _before_change(self):
+        """Tell the bank this account is about to change (keeps open snapshots consistent)"""
+        if self._bank:
+            self._bank._before_account_change(self)
+
+    def _apply_balance_change(self, delta):
+        """Change balance by delta (all balance updates go through here)"""
+        self._before_change()
+        self._balance += delta
+        if self._bank:
+            self._bank._on_balance_change(self)
+
+    def _check_withdrawal_allowed(self, amount, balance=None):
+        """Check if withdrawal is allowed against balance (default: current balance) - can be overridden"""
+        if balance is None:
+            balance = self._balance
+        if balance < amount:
             raise InvalidAmountError("Insufficient balance.")
 
     def withdraw(self, amount, password):
         """Withdraw money from account"""
         try:
             self._validate_password(password)
-            self._validate_amount(amount)
+            amount = self._validate_amount(amount)
             self._check_withdrawal_allowed(amount)
-            self._balance -= amount
+            self._apply_balance_change(-amount)
             if self._bank:
                 self._bank.add_transaction(
                     self._bank_account_number,
@@ -87,6 +119,27 @@ class BankAccount:
         finally:
             print("[Withdrawal Process Finished]")
 
+    def _opening_details(self):
+        """Account settings recorded with the "Account Opened" ledger entry"""
+        return {"interest_rate": str(self._interest_rate)}
+
+    def _creation_arguments(self):
+        """Everything create_account is given for this account (idempotency fingerprint)"""
+        arguments = self._opening_details()
+        arguments.update(account_type=self.get_account_type(), username=self._username,
+                         password=self._password, opening_balance=self._opening_balance)
+        return arguments
+
+    def _projected_fields(self):
+        """State that can be rebuilt from the ledger (see projections.AccountState)"""
+        return {"account_type": self.get_account_type(), "balance": self._balance}
+
+    def _restore_projection(self, state):
+        """Set ledger-derived state from a projections.AccountState (disaster recovery)"""
+        self._before_change()
+        if state.get_balance() != self._balance:
+            self._apply_balance_change(state.get_balance() - self._balance)
+
     def _handle_exception(self, e):
         """Handle exceptions uniformly"""
         if isinstance(e, InvalidPasswordError):
@@ -102,6 +155,9 @@ class BankAccount:
     def get_balance(self):
         return self._balance
     
+    def get_opening_balance(self):
+        return self._opening_balance
+    
     def get_password(self):
         return self._password
     
@@ -136,16 +192,70 @@ class ContractAccount(BankAccount):
         super().__init__(username, password, interest_rate)
         self._is_terminated = False
         self._is_matured = False
+        self._contract_period = None  # timedelta from creation to contract end, set by subclasses
         self._contract_end_date = None
 
-    def _check_contract_status(self):
-        """Check if contract is still valid"""
+    def _set_created_date(self, created_date):
+        super()._set_created_date(created_date)
+        if self._contract_period is not None:
+            self._contract_end_date = created_date + self._contract_period
+
+    def _check_contract_status(self, allow_ended=False):
+        """Check if contract is still valid (allow_ended=True for settlement at maturity)"""
         if self._is_terminated or self._is_matured:
             raise ContractValueError("Contract is terminated or matured.")
         
-        if self._contract_end_date and datetime.now() > self._contract_end_date:
+        if not allow_ended and self._contract_end_date and self._clock.now() > self._contract_end_date:
             raise ContractValueError("Contract period has ended.")
 
-    def _calculate_interest(self, principal, rate, period_fraction):
-        """Calculate interest"""
-        return principal * rate * period_fraction
+    def _calculate_interest(self, principal, rate, period_fraction, rate_factor=Fraction(1)):
+        """Calculate interest in whole minor units (exact, rounded half to even)"""
+        return interest_amount(principal, rate, period_fraction, rate_factor)
+
+    def _settle_contract(self, password):
+        """Close contract and credit interest; returns (interest, total amount, outcome) - implemented by subclasses"""
+        raise NotImplementedError
+
+    def _opening_details(self):
+        details = super()._opening_details()
+        details["contract_end_date"] = (None if self._contract_end_date is None
+                                        else self._contract_end_date.isoformat())
+        return details
+
+    def _creation_arguments(self):
+        arguments = super()._creation_arguments()
+        del arguments["contract_end_date"]  # follows from the creation time, not the request
+        return arguments
+
+    def _projected_fields(self):
+        fields = super()._projected_fields()
+        fields.update(is_terminated=self._is_terminated, is_matured=self._is_matured)
+        return fields
+
+    def _restore_projection(self, state):
+        super()._restore_projection(state)
+        self._is_terminated = state.is_terminated()
+        self._is_matured = state.is_matured()
+
+    def _post_settlement(self, interest, outcome, converted=False):
+        """Record the single termination posting (interest credited on settlement)"""
+        if self._bank:
+            self._bank.add_transaction(
+                self._bank_account_number,
+                self._username,
+                self.__class__.__name__,
+                interest,
+                "Contract Termination",
+                details={"outcome": outcome, "converted": converted}
+            )
+
+    def to_normal_account(self):
+        """Build a normal BankAccount carrying over this account's number and balance"""
+        account = BankAccount(self._username, self._password, self._interest_rate)
+        account._bank_account_number = self._bank_account_number
+        account._balance = self._balance
+        account._opening_balance = self._opening_balance
+        account._created_date = self._created_date
+        account._bank = self._bank
+        account._clock = self._clock
+        return account
@@ -4,9 +4,15 @@ Created Date: 2025-07-19
 Programmer: Kwanju Eun
 Description: Specific account type implementations
 """
-from datetime import datetime, timedelta
+from datetime import timedelta
+from fractions import Fraction
 from accounts.base import BankAccount, ContractAccount
 from exceptions import InvalidPasswordError, InvalidAmountError, ContractValueError
+from money import to_minor
+
+
+# Early termination pays this fraction of the contract interest rate
+EARLY_TERMINATION_RATE_FACTOR = Fraction(1, 10)
 
 
 class SavingAccount(ContractAccount):
@@ -14,49 +20,81 @@ class SavingAccount(ContractAccount):
     
     def __init__(self, username, password, interest_rate, monthly_amount, contract_months):
         super().__init__(username, password, interest_rate)
-        self.__monthly_amount = monthly_amount
+        self.__monthly_amount = to_minor(monthly_amount)
         self.__contract_months = contract_months
-        self._contract_end_date = self._created_date + timedelta(days=contract_months * 30)
+        self._contract_period = timedelta(days=contract_months * 30)
+        self._contract_end_date = self._created_date + self._contract_period
         self.__total_deposited = 0
 
+    def set_opening_balance(self, amount):
+        """Opening balance counts as already deposited"""
+        super().set_opening_balance(amount)
+        self.__total_deposited = self._opening_balance
+
+    def _opening_details(self):
+        details = super()._opening_details()
+        details.update(monthly_amount=self.__monthly_amount, contract_months=self.__contract_months)
+        return details
+
+    def _projected_fields(self):
+        fields = super()._projected_fields()
+        fields["total_deposited"] = self.__total_deposited
+        return fields
+
+    def _restore_projection(self, state):
+        super()._restore_projection(state)
+        self.__total_deposited = state.get_total_deposited()
+
     def deposit(self, amount):
         """Deposit monthly amount only"""
         try:
+            amount = to_minor(amount)
             if amount != self.__monthly_amount:
                 raise InvalidAmountError(f"SavingAccount: Only monthly amount ({self.__monthly_amount}) is allowed.")
             self._check_contract_status()
             
+            self._before_change()
             self.__total_deposited += self.__monthly_amount
             return super().deposit(self.__monthly_amount)
         except (InvalidAmountError, ContractValueError) as e:
             self._handle_exception(e)
             return False
 
+    def _settle_contract(self, password):
+        """Close saving contract and credit interest; returns (interest, total, outcome)"""
+        self._validate_password(password)
+        self._check_contract_status(allow_ended=True)
+        self._before_change()
+        
+        if self._clock.now() < self._contract_end_date:
+            # Early termination
+            interest = self._calculate_interest(self.__total_deposited, self._interest_rate, Fraction(self.__contract_months, 12), EARLY_TERMINATION_RATE_FACTOR)
+            total_amount = self.__total_deposited + interest
+            self._is_terminated = True
+            outcome = "terminated"
+            print("Contract terminated early.")
+        else:
+            # Maturity
+            interest = self._calculate_interest(self.__total_deposited, self._interest_rate, Fraction(self.__contract_months, 12))
+            total_amount = self.__total_deposited + interest
+            self._is_matured = True
+            outcome = "matured"
+            print("Contract matured successfully!")
+        
+        print(f"Total deposited: {self.__total_deposited}")
+        print(f"Interest earned: {interest}")
+        print(f"Total amount available: {total_amount}")
+        
+        self._apply_balance_change(total_amount - self._balance)
+        return interest, total_amount, outcome
+
     def withdraw(self, amount, password):
         """Terminate saving account"""
         try:
-            self._validate_password(password)
-            self._check_contract_status()
-            
-            if datetime.now() < self._contract_end_date:
-                # Early termination
-                interest = self._calculate_interest(self.__total_deposited, self._interest_rate * 0.1, self.__contract_months / 12)
-                total_amount = self.__total_deposited + interest
-                self._is_terminated = True
-                print("Contract terminated early.")
-            else:
-                # Maturity
-                interest = self._calculate_interest(self.__total_deposited, self._interest_rate, self.__contract_months / 12)
-                total_amount = self.__total_deposited + interest
-                self._is_matured = True
-                print("Contract matured successfully!")
-            
-            print(f"Total deposited: {self.__total_deposited}")
-            print(f"Interest earned: {interest}")
-            print(f"Total amount available: {total_amount}")
+            interest, total_amount, outcome = self._settle_contract(password)
+            self._post_settlement(interest, outcome)
             
             # Process withdrawal through parent class
-            self._balance = total_amount  # Set balance for withdrawal
             return super().withdraw(total_amount, password)
             
         except (InvalidPasswordError, ContractValueError) as e:
@@ -78,45 +116,77 @@ class TimeDepositAccount(ContractAccount):
     def __init__(self, username, password, interest_rate, deposit_period=365):
         super().__init__(username, password, interest_rate)
         self.__deposit_period = deposit_period
-        self._contract_end_date = self._created_date + timedelta(days=deposit_period)
+        self._contract_period = timedelta(days=deposit_period)
+        self._contract_end_date = self._created_date + self._contract_period
         self.__initial_deposit = 0
 
+    def set_opening_balance(self, amount):
+        """Opening balance counts as the one-time deposit"""
+        super().set_opening_balance(amount)
+        self.__initial_deposit = self._opening_balance
+
+    def _opening_details(self):
+        details = super()._opening_details()
+        details["deposit_period"] = self.__deposit_period
+        return details
+
+    def _projected_fields(self):
+        fields = super()._projected_fields()
+        fields["total_deposited"] = self.__initial_deposit
+        return fields
+
+    def _restore_projection(self, state):
+        super()._restore_projection(state)
+        self.__initial_deposit = state.get_total_deposited()
+
     def deposit(self, amount):
         """Allow only one-time deposit"""
         try:
             if self._balance > 0:
                 raise InvalidAmountError("TimeDepositAccount: Only one-time deposit allowed.")
+            amount = self._validate_amount(amount)
+            self._before_change()
             self.__initial_deposit = amount
             return super().deposit(amount)
         except InvalidAmountError as e:
             self._handle_exception(e)
             return False
 
+    def _settle_contract(self, password):
+        """Close time deposit contract and credit interest; returns (interest, total, outcome)"""
+        self._validate_password(password)
+        self._check_contract_status(allow_ended=True)
+        self._before_change()
+        
+        if self._clock.now() < self._contract_end_date:
+            # Early termination
+            interest = self._calculate_interest(self.__initial_deposit, self._interest_rate, Fraction(self.__deposit_period, 365), EARLY_TERMINATION_RATE_FACTOR)
+            total_amount = self.__initial_deposit + interest
+            self._is_terminated = True
+            outcome = "terminated"
+            print("Contract terminated early.")
+        else:
+            # Maturity
+            interest = self._calculate_interest(self.__initial_deposit, self._interest_rate, Fraction(self.__deposit_period, 365))
+            total_amount = self.__initial_deposit + interest
+            self._is_matured = True
+            outcome = "matured"
+            print("Contract matured successfully!")
+        
+        print(f"Original deposit: {self.__initial_deposit}")
+        print(f"Interest earned: {interest}")
+        print(f"Total amount available: {total_amount}")
+        
+        self._apply_balance_change(total_amount - self._balance)
+        return interest, total_amount, outcome
+
     def withdraw(self, amount, password):
         """Terminate time deposit account"""
         try:
-            self._validate_password(password)
-            self._check_contract_status()
-            
-            if datetime.now() < self._contract_end_date:
-                # Early termination
-                interest = self._calculate_interest(self.__initial_deposit, self._interest_rate * 0.1, self.__deposit_period / 365)
-                total_amount = self.__initial_deposit + interest
-                self._is_terminated = True
-                print("Contract terminated early.")
-            else:
-                # Maturity
-                interest = self._calculate_interest(self.__initial_deposit, self._interest_rate, self.__deposit_period / 365)
-                total_amount = self.__initial_deposit + interest
-                self._is_matured = True
-                print("Contract matured successfully!")
-            
-            print(f"Original deposit: {self.__initial_deposit}")
-            print(f"Interest earned: {interest}")
-            print(f"Total amount available: {total_amount}")
+            interest, total_amount, outcome = self._settle_contract(password)
+            self._post_settlement(interest, outcome)
             
             # Process withdrawal through parent class
-            self._balance = total_amount  # Set balance for withdrawal
             return super().withdraw(total_amount, password)
             
         except (InvalidPasswordError, ContractValueError) as e:
@@ -135,13 +205,23 @@ class OverdraftAccount(BankAccount):
     
     def __init__(self, username, password, interest_rate, overdraft_limit=500000):
         super().__init__(username, password, interest_rate)
-        self.__overdraft_limit = overdraft_limit
+        self.__overdraft_limit = to_minor(overdraft_limit)
 
-    def _check_withdrawal_allowed(self, amount):
+    def _check_withdrawal_allowed(self, amount, balance=None):
         """Override to allow overdraft up to limit"""
-        if self._balance - amount < -self.__overdraft_limit:
+        if balance is None:
+            balance = self._balance
+        if balance - amount < -self.__overdraft_limit:
             raise InvalidAmountError(f"Exceeded limit. Maximum negative limit: {self.__overdraft_limit}")
 
+    def get_overdraft_limit(self):
+        return self.__overdraft_limit
+
+    def _opening_details(self):
+        details = super()._opening_details()
+        details["overdraft_limit"] = self.__overdraft_limit
+        return details
+
     def withdraw(self, amount, password):
         """Withdraw with overdraft capability"""
         return super().withdraw(amount, password)
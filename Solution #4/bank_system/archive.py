@@ -0,0 +1,285 @@
+"""
+File Name: archive.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Immutable zlib-compressed, column-encoded segment files for old transactions
+"""
+import json
+import os
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from transaction import Transaction
+
+
+SEGMENT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _write_varint(out, value):
+    """Append unsigned int as LEB128 varint"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    """Read varint at pos; returns (value, next pos)"""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+def _micros(moment):
+    if moment.tzinfo is not None:
+        raise ValueError("Archived transaction dates must be naive datetimes")
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _from_micros(micros):
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def encode_segment(transactions):
+    """Compress transactions (contiguous ledger positions) into (segment bytes, uncompressed size)"""
+    strings = {}  # string -> code
+
+    def code(value):
+        found = strings.get(value)
+        if found is None:
+            found = strings[value] = len(strings)
+        return found
+
+    columns = [bytearray() for _ in range(7)]
+    times, accounts, amounts, usernames, account_types, types, details = columns
+    previous = 0
+    for transaction in transactions:
+        micros = _micros(transaction.get_transaction_date())
+        _write_varint(times, _zigzag(micros - previous))
+        previous = micros
+        _write_varint(accounts, transaction.get_account_number())
+        _write_varint(amounts, _zigzag(transaction.get_amount()))
+        _write_varint(usernames, code(transaction.get_username()))
+        _write_varint(account_types, code(transaction.get_account_type()))
+        _write_varint(types, code(transaction.get_transaction_type()))
+        extra = transaction.get_details()
+        _write_varint(details, 0 if extra is None else code(json.dumps(extra, sort_keys=True)) + 1)
+
+    body = bytearray()
+    _write_varint(body, SEGMENT_FORMAT_VERSION)
+    _write_varint(body, len(transactions))
+    table = json.dumps(list(strings), ensure_ascii=False).encode("utf-8")
+    for part in [table] + columns:
+        _write_varint(body, len(part))
+        body.extend(part)
+    return zlib.compress(bytes(body), 6), len(body)
+
+
+def decode_segment(data, first_position, missing=()):
+    """Rebuild the Transaction list of a segment (None at missing offsets)"""
+    body = zlib.decompress(data)
+    version, pos = _read_varint(body, 0)
+    if version != SEGMENT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported segment format: {version}")
+    count, pos = _read_varint(body, pos)
+    parts = []
+    for _ in range(8):
+        size, pos = _read_varint(body, pos)
+        parts.append((pos, pos + size))
+        pos += size
+    table = json.loads(body[parts[0][0]:parts[0][1]].decode("utf-8"))
+    cursors = [start for start, _ in parts[1:]]
+
+    def read(column):
+        value, cursors[column] = _read_varint(body, cursors[column])
+        return value
+
+    transactions = []
+    micros = 0
+    skipped = set(missing)
+    offsets = [i for i in range(count + len(skipped)) if i not in skipped]
+    for i in offsets:
+        micros += _unzigzag(read(0))
+        account_number = read(1)
+        amount = _unzigzag(read(2))
+        username = table[read(3)]
+        account_type = table[read(4)]
+        transaction_type = table[read(5)]
+        details_code = read(6)
+        details = None if details_code == 0 else json.loads(table[details_code - 1])
+        transactions.append(Transaction(account_number, username, account_type, amount, transaction_type,
+                                        details, _from_micros(micros), first_position + i + 1))
+    for i in missing:
+        transactions.insert(i, None)
+    return transactions
+
+
+class TransactionArchive:
+    """Directory of immutable segment files plus a JSON manifest of their position ranges"""
+
+    def __init__(self, directory, cache_segments=4):
+        self.__directory = directory
+        self.__cache_segments = cache_segments
+        self.__cache = OrderedDict()  # segment index -> decoded transactions
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                self.__segments = json.load(f)["segments"]
+        else:
+            self.__segments = []
+        self.__starts = [segment["first_position"] for segment in self.__segments]
+
+    def get_directory(self):
+        return self.__directory
+
+    def get_archived_count(self):
+        """Number of ledger positions held in segments"""
+        if not self.__segments:
+            return 0
+        last = self.__segments[-1]
+        return last["first_position"] + last["count"]
+
+    def get_segments(self):
+        """Copy of segment metadata, oldest first"""
+        return [dict(segment) for segment in self.__segments]
+
+    def _write_atomic(self, name, data):
+        path = os.path.join(self.__directory, name)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def append_segment(self, transactions):
+        """Write the next contiguous ledger positions as one segment (None entries are compacted)"""
+        transactions = list(transactions)
+        if not transactions:
+            return None
+        first_position = self.get_archived_count()
+        missing = [i for i, t in enumerate(transactions) if t is None]
+        present = [t for t in transactions if t is not None]
+        if any(t.get_transaction_id() != first_position + i + 1
+               for i, t in enumerate(transactions[:len(missing) + 1]) if t is not None):
+            raise ValueError("Segments must continue the archived ledger without gaps")
+        data, raw_bytes = encode_segment(present)
+        name = f"segment-{first_position:012d}.seg"
+        self._write_atomic(name, data)
+
+        segment = {
+            "file": name,
+            "first_position": first_position,
+            "count": len(transactions),
+            "raw_bytes": raw_bytes,
+            "stored_bytes": len(data),
+        }
+        if present:
+            dates = [t.get_transaction_date() for t in present]
+            accounts = [t.get_account_number() for t in present]
+            amounts = [t.get_amount() for t in present]
+            segment.update(min_date=min(dates).isoformat(), max_date=max(dates).isoformat(),
+                           min_account=min(accounts), max_account=max(accounts),
+                           min_amount=min(amounts), max_amount=max(amounts))
+        if missing:
+            segment["missing"] = missing
+        self.__segments.append(segment)
+        self.__starts.append(first_position)
+        manifest = {"version": SEGMENT_FORMAT_VERSION, "segments": self.__segments}
+        self._write_atomic(MANIFEST_NAME, json.dumps(manifest, indent=1).encode("utf-8"))
+        return dict(segment)
+
+    def _load(self, index):
+        transactions = self.__cache.get(index)
+        if transactions is not None:
+            self.__cache.move_to_end(index)
+            return transactions
+        segment = self.__segments[index]
+        with open(os.path.join(self.__directory, segment["file"]), "rb") as f:
+            transactions = decode_segment(f.read(), segment["first_position"], segment.get("missing", ()))
+        self.__cache[index] = transactions
+        if len(self.__cache) > self.__cache_segments:
+            self.__cache.popitem(last=False)
+        return transactions
+
+    def transaction_at(self, position):
+        if not 0 <= position < self.get_archived_count():
+            raise IndexError("position is not archived")
+        index = bisect_right(self.__starts, position) - 1
+        return self._load(index)[position - self.__starts[index]]
+
+    def transactions_at(self, positions):
+        """Transactions at sorted archived positions; each segment is read once"""
+        result = []
+        index = -1
+        transactions = None
+        for p in positions:
+            if index < 0 or not self.__starts[index] <= p < self.__starts[index] + len(transactions):
+                index = bisect_right(self.__starts, p) - 1
+                if index < 0 or p >= self.get_archived_count():
+                    raise IndexError("position is not archived")
+                transactions = self._load(index)
+            result.append(transactions[p - self.__starts[index]])
+        return result
+
+    def iter_transactions(self):
+        for index in range(len(self.__segments)):
+            for transaction in self._load(index):
+                if transaction is not None:
+                    yield transaction
+
+    def scan(self, start=None, end=None, account_number=None):
+        """Yield archived transactions with start <= date < end (and account), skipping ruled-out segments"""
+        for index, segment in enumerate(self.__segments):
+            if "min_date" not in segment:
+                continue  # every position in it was compacted
+            if start is not None and datetime.fromisoformat(segment["max_date"]) < start:
+                continue
+            if end is not None and datetime.fromisoformat(segment["min_date"]) >= end:
+                continue
+            if account_number is not None and not (
+                    segment["min_account"] <= account_number <= segment["max_account"]):
+                continue
+            for transaction in self._load(index):
+                if transaction is None:
+                    continue
+                date = transaction.get_transaction_date()
+                if start is not None and date < start:
+                    continue
+                if end is not None and date >= end:
+                    continue
+                if account_number is not None and transaction.get_account_number() != account_number:
+                    continue
+                yield transaction
+
+    def get_stats(self):
+        raw = sum(segment["raw_bytes"] for segment in self.__segments)
+        stored = sum(segment["stored_bytes"] for segment in self.__segments)
+        return {
+            "segments": len(self.__segments),
+            "transactions": self.get_archived_count(),
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "compression_ratio": raw / stored if stored else 0.0,
+            "cached_segments": len(self.__cache),
+        }
@@ -2,38 +2,375 @@
 File Name: bank.py
 Created Date: 2025-07-19
 Programmer: Kwanju Eun
-Description: Core bank class that manages accounts and transactions
+Description: Core bank class that manages accounts and transactions (indexes are rebuilt in memory on open)
 """
 import random
+import weakref
+from array import array
+from bisect import bisect_left
+from itertools import chain
 from transaction import Transaction
-from accounts.base import BankAccount
+from clock import get_default_clock
+from accounts.base import BankAccount, ContractAccount
 from accounts.types import OverdraftAccount
+from exceptions import InvalidPasswordError, InvalidAmountError, ContractValueError
+from views import ReadOnlySequence
+from money import check_minor, pack
+from time_index import TransactionTimeIndex
+from rollups import DailyRollups
+from ledger_columns import LedgerColumns
+from query import TransactionQuery
+from username_index import UsernameIndex
+from leaderboard import BalanceLeaderboard, ActivityCounter
+from idempotency import IdempotencyCache, request_fingerprint
+from bloom import ScalableBloomFilter
+from checkpoints import AccountCheckpoint, COMPACTABLE_ACCOUNT_TYPES
+from reconcile import reconcile_ledger
+from projections import project_ledger, AccountEvent, ACCOUNT_OPENED, ACCOUNT_CLOSED
+from ledger_chain import (LedgerChain, ChainCheckpoint, MISSING_DIGEST, transaction_fields,
+                          verify_segments, default_workers)
+from snapshots import BankSnapshot
+from storage import MemoryStorage
+from storage.base import StoredSequence
 
 
 class Bank:
     """Main bank class that manages accounts and transactions"""
     
-    def __init__(self):
-        self.__accounts = []
-        self.__transactions = []
-        self.__used_account_numbers = set()
+    def __init__(self, clock=None, idempotency_cache=None, storage=None, archive=None,
+                 expected_accounts=100000, ledger_key=None, chain_interval=1000):
+        """Open a bank over storage (MemoryStorage by default) and an optional archive"""
+        self.__clock = clock if clock is not None else get_default_clock()
+        self.__idempotency = (idempotency_cache if idempotency_cache is not None
+                              else IdempotencyCache(clock=self.__clock))
+        self.__storage = storage if storage is not None else MemoryStorage()
+        self.__storage.attach(self)
+        self.__archive = archive
+        self.__accounts_view = ReadOnlySequence(self.__storage.accounts_view())
+        if archive is None:
+            ledger = self.__storage.transactions_view()
+        else:
+            ledger = StoredSequence(self._transaction_count, self._transaction_at, self.iter_transactions)
+        self.__transactions_view = ReadOnlySequence(ledger)
+        self.__time_index = TransactionTimeIndex()
+        self.__daily_rollups = DailyRollups()
+        self.__columns = LedgerColumns()
+        self.__balance_leaderboard = BalanceLeaderboard()
+        self.__activity = ActivityCounter()
+        self.__username_index = UsernameIndex()
+        # Every account number ever issued; answers "definitely unused" without storage
+        self.__account_filter = ScalableBloomFilter(expected_accounts)
+        self.__total_overdraft = 0
+        self.__next_transfer_id = 1
+        self.__next_transaction_id = 1
+        self.__reversed_ids = set()
+        self.__checkpoints = {}  # account number -> AccountCheckpoint of compacted history
+        self.__event_accounts = array("q")  # account number of each AccountEvent stored since opening
+        self.__chain = LedgerChain(ledger_key, chain_interval)
+        self.__snapshots = ()  # weak references to open BankSnapshots, replaced (never changed) on update
+        self._load_from_storage()
+
+    def _load_from_storage(self):
+        """Rebuild indexes and counters from records already in storage"""
+        storage = self.__storage
+        accounts = list(storage.iter_accounts())
+        numbers = [acc.get_account_number() for acc in accounts]
+        for account_number in numbers:
+            self.__account_filter.add(account_number)
+        self.__total_overdraft = sum(self._overdraft_of(acc) for acc in accounts)
+        self.__balance_leaderboard.update_many(zip(numbers, (acc.get_balance() for acc in accounts)))
+        self.__username_index.add_many(zip((acc.get_username() for acc in accounts), numbers))
+
+        # Finish an archive run that stopped between writing segments and releasing them
+        archived = self._archived_count()
+        if archived > storage.released_count():
+            storage.release_transactions(archived - storage.released_count())
+
+        # Removed accounts with no ledger rows are only known from their lifecycle events
+        for data in storage.load_account_events():
+            if data["account_number"] not in self.__account_filter:
+                self.__account_filter.add(data["account_number"])
+
+        for data in storage.load_checkpoints():
+            checkpoint = self.__checkpoints[data["account_number"]] = AccountCheckpoint.from_dict(data)
+            if data["account_number"] not in self.__account_filter:
+                self.__account_filter.add(data["account_number"])
+            # Compacted entries count in rollups and activity through their checkpoint
+            for day, transaction_type, account_type, count, total, low, high in checkpoint.get_daily_totals():
+                self.__daily_rollups.add_cell(day, (transaction_type, account_type), count, total, low, high)
+                self.__activity.add(day, data["account_number"], count)
+
+        # The chain resumes at its last checkpoint; later records are chained below. The head
+        # stored with the last flush becomes a checkpoint too, so records written after the last
+        # sealed checkpoint are checked against it instead of being trusted as found.
+        chain = self.__chain
+        chain_checkpoints = [ChainCheckpoint.from_dict(data) for data in storage.load_chain_checkpoints()]
+        new_chain_checkpoints = []
+        self.__verify_from = len(chain_checkpoints)
+        head = storage.load_chain_head()
+        if head is not None:
+            head = ChainCheckpoint.from_dict(head)
+            if head.get_position() > max((cp.get_position() for cp in chain_checkpoints), default=0):
+                chain_checkpoints.append(head)
+                new_chain_checkpoints.append(head)
+        chain.restore(chain_checkpoints, storage.load_pruned_digests())
+
+        # Positions missing from storage, or covered by a checkpoint, were compacted
+        position = 0
+        for transaction in self._iter_ledger():
+            transaction_position = transaction.get_transaction_id() - 1
+            while position < transaction_position:
+                self._index_missing(transaction.get_transaction_date())
+                self._chain_missing(position, new_chain_checkpoints)
+                position += 1
+            if position >= len(chain):
+                new_chain_checkpoints.append(chain.append(transaction))
+            checkpoint = self.__checkpoints.get(transaction.get_account_number())
+            compacted = checkpoint is not None and checkpoint.covers(transaction.get_transaction_id())
+            self._index_transaction(transaction, removed=compacted)
+            position += 1
+            if transaction.get_account_number() not in self.__account_filter:
+                self.__account_filter.add(transaction.get_account_number())
+            details = transaction.get_details() or {}
+            if transaction.get_transaction_type() == "Reversal":
+                self.__reversed_ids.add(details["reverses"])
+            if "transfer_id" in details:
+                self.__next_transfer_id = max(self.__next_transfer_id, details["transfer_id"] + 1)
+        while position < self._transaction_count():
+            self._index_missing()
+            self._chain_missing(position, new_chain_checkpoints)
+            position += 1
+        storage.save_chain_checkpoints([cp.to_dict() for cp in new_chain_checkpoints if cp is not None])
+        self.__next_transaction_id = self._transaction_count() + 1
+        self.__idempotency.load_entries(storage.load_idempotency_entries())
+        expired = self.__idempotency.drain_evicted()
+        if expired:
+            storage.save_idempotency_entries([], expired)
+
+    def _chain_missing(self, position, new_chain_checkpoints):
+        """Chain a position with no stored record during loading"""
+        if position >= len(self.__chain):
+            digest = self.__chain.get_pruned_digest(position)
+            new_chain_checkpoints.append(self.__chain.append_digest(digest or MISSING_DIGEST))
+
+    def get_storage(self):
+        return self.__storage
+
+    def get_archive(self):
+        return self.__archive
+
+    def _archived_count(self):
+        return 0 if self.__archive is None else self.__archive.get_archived_count()
+
+    def _transaction_count(self):
+        return self.__storage.transaction_count()
+
+    def _transaction_at(self, position):
+        """Transaction at ledger position, from the archive or the storage tail (None if compacted)"""
+        if self.__time_index.is_removed(position):
+            return None
+        if position < self._archived_count():
+            return self.__archive.transaction_at(position)
+        return self.__storage.transaction_at(position)
+
+    def _transactions_at(self, positions):
+        """Transactions at sorted ledger positions, split between archive and storage"""
+        split = bisect_left(positions, self._archived_count())
+        if split == 0:
+            return self.__storage.transactions_at(positions)
+        return (self.__archive.transactions_at(positions[:split])
+                + self.__storage.transactions_at(positions[split:]))
+
+    def archive_transactions(self, before, segment_size=10000):
+        """Move transactions dated before `before` into archive segments; returns the number archived"""
+        if self.__archive is None:
+            raise ValueError("Bank has no transaction archive")
+        if segment_size <= 0:
+            raise ValueError("segment_size must be greater than 0")
+        first = self._archived_count()
+        _, stop = self.__time_index.time_bounds(None, None, before)
+        for start in range(first, stop, segment_size):
+            positions = range(start, min(start + segment_size, stop))
+            self.__archive.append_segment(self.__storage.transactions_at(positions))
+        if stop > first:
+            self.__storage.release_transactions(stop - first)
+        return max(0, stop - first)
+
+    def flush(self):
+        """Write buffered storage changes"""
+        self.__storage.flush()
+
+    def close(self):
+        """Sign the ledger chain head, then flush and close storage"""
+        checkpoint = self.__chain.seal(self.__clock.now().isoformat())
+        if checkpoint is not None:
+            self.__storage.save_chain_checkpoints([checkpoint.to_dict()])
+        self.__storage.close()
+
+    def get_clock(self):
+        """Clock used for transaction dates and contract maturity"""
+        return self.__clock
+
+    def get_idempotency_cache(self):
+        return self.__idempotency
+
+    def _run_idempotent(self, idempotency_key, request, action, encode=None, decode=None):
+        """Run action once per idempotency key (failed operations are not remembered)"""
+        if idempotency_key is None:
+            return action()
+        fingerprint = request_fingerprint(*request)
+        hit, stored = self.__idempotency.lookup(idempotency_key, fingerprint)
+        if hit:
+            return decode(stored) if decode else stored
+        # The key is written in the same storage batch as the entries the action posts
+        with self.__storage.deferred_flush():
+            result = action()
+            if result is False:
+                return result
+            entry = self.__idempotency.store(idempotency_key, fingerprint, encode(result) if encode else result)
+            self.__storage.save_idempotency_entries([entry], self.__idempotency.drain_evicted())
+        return result
+
+    def deposit(self, account_number, amount, idempotency_key=None):
+        """Deposit to account by number; returns True on success"""
+        account = self.get_account_by_number(account_number)
+        if account is None:
+            raise ValueError("Account not found")
+        return self._run_idempotent(idempotency_key, ("deposit", account_number, amount),
+                                    lambda: account.deposit(amount))
+
+    def withdraw(self, account_number, amount, password, idempotency_key=None):
+        """Withdraw from account by number; returns True on success"""
+        account = self.get_account_by_number(account_number)
+        if account is None:
+            raise ValueError("Account not found")
+        return self._run_idempotent(idempotency_key, ("withdraw", account_number, amount, password),
+                                    lambda: account.withdraw(amount, password))
 
     def generate_unique_account_number(self):
-        """Generate unique account number"""
+        """Generate unique account number (never reuses a removed account's number)"""
         while True:
             account_number = random.randint(10000000, 99999999)
-            if account_number not in self.__used_account_numbers:
-                self.__used_account_numbers.add(account_number)
+            if account_number not in self.__account_filter:
+                self.__account_filter.add(account_number)
                 return account_number
 
-    def add_transaction(self, account_number, username, account_type, amount, transaction_type):
+    def allocate_account_numbers(self, count):
+        """Generate count unique account numbers in one pass"""
+        numbers = []
+        while len(numbers) < count:
+            candidates = random.sample(range(10000000, 100000000), count - len(numbers))
+            for account_number in candidates:
+                if account_number not in self.__account_filter:
+                    self.__account_filter.add(account_number)
+                    numbers.append(account_number)
+        return numbers
+
+    def get_account_filter_stats(self):
+        """Memory and false positive report of the account number filter"""
+        return self.__account_filter.get_stats()
+
+    def add_transaction(self, account_number, username, account_type, amount, transaction_type, details=None):
         """Add transaction to bank's transaction history"""
-        transaction = Transaction(account_number, username, account_type, amount, transaction_type)
-        self.__transactions.append(transaction)
+        check_minor(amount)
+        transaction_id = self.__next_transaction_id
+        transaction = Transaction(account_number, username, account_type, amount, transaction_type,
+                                  details, self.__clock.now(), transaction_id)
+        # Chained first, so a flush triggered by the append stores a head that covers it
+        checkpoint = self.__chain.append(transaction, transaction.get_transaction_date().isoformat())
+        self.__storage.append_transaction(transaction)
+        self.__next_transaction_id += 1
+        self._index_transaction(transaction)
+        if checkpoint is not None:
+            self.__storage.save_chain_checkpoints([checkpoint.to_dict()])
         return transaction
 
-    def create_account(self, account):
+    def _index_transaction(self, transaction, removed=False):
+        """Add a stored transaction to the in-memory indexes and aggregates"""
+        account_number = transaction.get_account_number()
+        transaction_date = transaction.get_transaction_date()
+        if removed:
+            self.__time_index.append_removed(transaction_date)
+            self.__columns.append_placeholder()
+            return
+        self.__time_index.append(transaction_date, account_number, transaction.get_username())
+        self.__columns.append(transaction)
+        self.__daily_rollups.add(transaction)
+        self.__activity.add(transaction_date.date(), account_number)
+
+    def _index_missing(self, timestamp=None):
+        """Index a ledger position whose transaction was compacted away"""
+        self.__time_index.append_removed(timestamp)
+        self.__columns.append_placeholder()
+
+    def get_transaction(self, transaction_id):
+        """Get transaction by id in O(1) (None if unknown)"""
+        if isinstance(transaction_id, int) and 1 <= transaction_id <= self._transaction_count():
+            return self._transaction_at(transaction_id - 1)
+        return None
+
+    def reverse(self, transaction_id, idempotency_key=None):
+        """Post a compensating entry for a transaction (both legs of a transfer); returns the Reversal"""
+        return self._run_idempotent(idempotency_key, ("reverse", transaction_id),
+                                    lambda: self._reverse(transaction_id),
+                                    encode=Transaction.get_transaction_id,
+                                    decode=self.get_transaction)
+
+    def _reverse(self, transaction_id):
+        original = self.get_transaction(transaction_id)
+        if original is None:
+            raise ValueError(f"Transaction not found: {transaction_id}")
+
+        originals = [original]
+        transaction_type = original.get_transaction_type()
+        if transaction_type == "Transfer Out":
+            originals.append(self.get_transaction(transaction_id + 1))
+        elif transaction_type == "Transfer In":
+            originals.insert(0, self.get_transaction(transaction_id - 1))
+        elif transaction_type not in ("Deposit", "Withdrawal"):
+            raise ValueError(f"{transaction_type} transactions cannot be reversed")
+        if None in originals:
+            raise ValueError("The other leg of this transfer has been compacted")
+
+        changes = []
+        for txn in originals:
+            if txn.get_transaction_id() in self.__reversed_ids:
+                raise ValueError(f"Transaction already reversed: {txn.get_transaction_id()}")
+            account = self.get_account_by_number(txn.get_account_number())
+            if account is None:
+                raise ValueError(f"Account not found: {txn.get_account_number()}")
+            if isinstance(account, ContractAccount):
+                raise ContractValueError("Contract account postings cannot be reversed.")
+            delta = -txn.get_signed_amount()
+            if delta < 0:
+                account._check_withdrawal_allowed(-delta)
+            changes.append((txn, account, delta))
+
+        reversals = {}
+        for txn, account, delta in changes:
+            account._apply_balance_change(delta)
+            self.__reversed_ids.add(txn.get_transaction_id())
+            reversals[txn.get_transaction_id()] = self.add_transaction(
+                account.get_account_number(),
+                account.get_username(),
+                account.get_account_type(),
+                delta,
+                "Reversal",
+                details={"reverses": txn.get_transaction_id()}
+            )
+        return reversals[transaction_id]
+
+    def is_reversed(self, transaction_id):
+        return transaction_id in self.__reversed_ids
+
+    def create_account(self, account, idempotency_key=None):
         """Add account to bank"""
+        if idempotency_key is not None:
+            request = ("create_account", sorted(account._creation_arguments().items()))
+            return self._run_idempotent(idempotency_key, request,
+                                        lambda: self.create_account(account),
+                                        encode=BankAccount.get_account_number,
+                                        decode=self.get_account_by_number)
         if not isinstance(account, BankAccount):
             raise ValueError("Invalid account type")
         
@@ -42,67 +379,494 @@ class Bank:
         account.set_account_number(account_number)
         account.set_bank(self)
         
-        self.__accounts.append(account)
+        self.__storage.add_accounts([account], [self._opening_event(account)])
+        self.__event_accounts.append(account_number)
+        self.__total_overdraft += self._overdraft_of(account)
+        self.__balance_leaderboard.update(account_number, account.get_balance())
+        self.__username_index.add(account.get_username(), account_number)
         return account
 
+    def add_accounts(self, accounts):
+        """Add many accounts to bank at once"""
+        accounts = list(accounts)
+        for account in accounts:
+            if not isinstance(account, BankAccount):
+                raise ValueError("Invalid account type")
+
+        numbers = self.allocate_account_numbers(len(accounts))
+        for account, account_number in zip(accounts, numbers):
+            account.set_account_number(account_number)
+            account.set_bank(self)
+
+        self.__storage.add_accounts(accounts, [self._opening_event(acc) for acc in accounts])
+        self.__event_accounts.extend(numbers)
+        self.__total_overdraft += sum(self._overdraft_of(acc) for acc in accounts)
+        self.__balance_leaderboard.update_many(zip(numbers, (acc.get_balance() for acc in accounts)))
+        self.__username_index.add_many(zip((acc.get_username() for acc in accounts), numbers))
+        return accounts
+
+    def _opening_event(self, account):
+        """"Account Opened" AccountEvent dict, stored with the account so projections can rebuild it"""
+        return AccountEvent(ACCOUNT_OPENED, account.get_account_number(), account.get_username(),
+                            account.get_account_type(), account.get_opening_balance(), self.__clock.now(),
+                            account._opening_details()).to_dict()
+
+    @staticmethod
+    def _overdraft_of(account):
+        """Overdraft limit contributed by account to bank total"""
+        if isinstance(account, OverdraftAccount):
+            return account.get_overdraft_limit()
+        return 0
+
+    def _transfer_accounts(self, src_number, dst_number):
+        """Look up and check both sides of a transfer"""
+        src = self.get_account_by_number(src_number)
+        dst = self.get_account_by_number(dst_number)
+        if src is None or dst is None:
+            raise ValueError("Account not found")
+        if src is dst:
+            raise ValueError("Cannot transfer to the same account")
+        if isinstance(src, ContractAccount) or isinstance(dst, ContractAccount):
+            raise ContractValueError("Contract accounts cannot take part in transfers.")
+        return src, dst
+
+    def _post_transfer(self, src, dst, amount):
+        """Write the linked Transfer Out / Transfer In pair; returns transfer id"""
+        transfer_id = self.__next_transfer_id
+        self.__next_transfer_id += 1
+        src_number = src.get_account_number()
+        dst_number = dst.get_account_number()
+        self.add_transaction(src_number, src.get_username(), src.get_account_type(), amount,
+                             "Transfer Out", details={"transfer_id": transfer_id, "counterparty": dst_number})
+        self.add_transaction(dst_number, dst.get_username(), dst.get_account_type(), amount,
+                             "Transfer In", details={"transfer_id": transfer_id, "counterparty": src_number})
+        return transfer_id
+
+    def transfer(self, src, dst, amount, password, idempotency_key=None):
+        """Move amount from account number src to account number dst atomically; returns the transfer id"""
+        if idempotency_key is not None:
+            return self._run_idempotent(idempotency_key, ("transfer", src, dst, amount, password),
+                                        lambda: self.transfer(src, dst, amount, password))
+        src_account, dst_account = self._transfer_accounts(src, dst)
+        src_account._validate_password(password)
+        amount = src_account._validate_amount(amount)
+        src_account._check_withdrawal_allowed(amount)
+
+        src_account._apply_balance_change(-amount)
+        dst_account._apply_balance_change(amount)
+        return self._post_transfer(src_account, dst_account, amount)
+
+    def transfer_batch(self, transfers, idempotency_key=None):
+        """Settle many (src, dst, amount, password) transfers; returns (transfer id, error) per transfer"""
+        if idempotency_key is not None:
+            transfers = list(transfers)
+            return self._run_idempotent(idempotency_key, ("transfer_batch", transfers),
+                                        lambda: self.transfer_batch(transfers))
+        projected = {}  # account number -> projected balance
+        accepted = []  # (result index, src, dst, amount)
+        results = []
+        for src, dst, amount, password in transfers:
+            try:
+                src_account, dst_account = self._transfer_accounts(src, dst)
+                src_account._validate_password(password)
+                amount = src_account._validate_amount(amount)
+                src_number = src_account.get_account_number()
+                dst_number = dst_account.get_account_number()
+                balance = projected.get(src_number, src_account.get_balance())
+                src_account._check_withdrawal_allowed(amount, balance)
+            except (ValueError, InvalidPasswordError, InvalidAmountError, ContractValueError) as e:
+                results.append((None, str(e)))
+                continue
+            projected[src_number] = balance - amount
+            projected[dst_number] = projected.get(dst_number, dst_account.get_balance()) + amount
+            accepted.append((len(results), src_account, dst_account, amount))
+            results.append(None)
+
+        # Apply net balance change once per account
+        for account_number, balance in projected.items():
+            account = self.get_account_by_number(account_number)
+            delta = balance - account.get_balance()
+            if delta:
+                account._apply_balance_change(delta)
+
+        for index, src_account, dst_account, amount in accepted:
+            results[index] = (self._post_transfer(src_account, dst_account, amount), None)
+        return results
+
+    def compact_history(self, horizon, account_types=COMPACTABLE_ACCOUNT_TYPES):
+        """Fold each account's transactions dated before horizon into a checkpoint; returns (accounts, transactions)"""
+        if self.get_open_snapshot_count():
+            raise ValueError("Cannot compact history while a snapshot is open")
+        archived = self._archived_count()
+        changed = []
+        discarded = []
+        pruned = {}
+        compacted = 0
+        for account in self.__storage.iter_accounts():
+            if account.get_account_type() not in account_types:
+                continue
+            account_number = account.get_account_number()
+            positions = self.__time_index.positions_for_account(account_number)
+            _, stop = self.__time_index.time_bounds(positions, None, horizon)
+            if stop == 0:
+                continue
+            old = positions[:stop]
+            checkpoint = self.__checkpoints.get(account_number)
+            if checkpoint is None:
+                checkpoint = AccountCheckpoint(account_number, account.get_opening_balance())
+                self.__checkpoints[account_number] = checkpoint
+            for position, transaction in zip(old, self._transactions_at(old)):
+                checkpoint.fold(transaction)
+                if position >= archived:
+                    pruned[position] = self.__chain.prune(position, transaction)
+            checkpoint.set_as_of(horizon)
+            self.__time_index.remove_positions(account_number, account.get_username(), old)
+            self.__columns.clear_rows(old)
+            changed.append(checkpoint)
+            discarded.extend(p for p in old if p >= archived)
+            compacted += len(old)
+
+        # Checkpoints and digests first: after a crash they still describe what was compacted
+        self.__storage.save_checkpoints([checkpoint.to_dict() for checkpoint in changed])
+        self.__storage.save_pruned_digests(pruned)
+        if discarded:
+            self.__storage.discard_transactions(sorted(discarded))
+        return len(changed), compacted
+
+    def _chain_records(self, start, end):
+        """verify_segment() arguments for ledger positions start..end-1, read from archive/storage"""
+        records = []
+        pruned = {}
+        for index, transaction in enumerate(self._transactions_at(range(start, end))):
+            if transaction is None:
+                records.append(None)
+                pruned[index] = self.__chain.get_pruned_digest(start + index) or MISSING_DIGEST
+            else:
+                records.append(transaction_fields(transaction))
+        return records, pruned
+
+    def _chain_head(self):
+        """Current chain head as a ChainCheckpoint dict (stored by backends with each flush)"""
+        chain = self.__chain
+        return ChainCheckpoint(len(chain), chain.get_head(), chain.sign(len(chain), chain.get_head()),
+                               self.__clock.now().isoformat()).to_dict()
+
+    def _verify_chain(self, trusted_checkpoints, workers):
+        """Recompute the chain after the first trusted_checkpoints checkpoints"""
+        chain = self.__chain
+        checkpoints = chain.get_checkpoints()[max(0, trusted_checkpoints - 1):]
+        segments = chain.segments(trusted_checkpoints)
+        failures = verify_segments(segments, self._chain_records, workers)
+        valid = (not failures and all(map(chain.is_trusted, checkpoints))
+                 and len(chain) == self._transaction_count())
+        if valid:
+            self.__verify_from = len(chain.get_checkpoints())
+        return {
+            "valid": valid,
+            "signed": chain.is_keyed(),
+            "transactions_checked": sum(end - start for start, end, _, _ in segments),
+            "segments_checked": len(segments),
+            "failed_segments": [(start + 1, end) for start, end in failures],  # transaction id ranges
+            "unsigned_checkpoints": [cp.get_position() for cp in checkpoints if not chain.is_signed(cp)],
+            "chained_transactions": len(chain),
+            "stored_transactions": self._transaction_count(),
+        }
+
+    def verify_ledger(self):
+        """Check the ledger since the last verified checkpoint against the chain head; returns a report"""
+        return self._verify_chain(min(self.__verify_from, len(self.__chain.get_checkpoints())), 1)
+
+    def audit_ledger(self, workers=None):
+        """Recompute the whole chain in parallel, one segment per checkpoint interval"""
+        return self._verify_chain(0, workers if workers is not None else default_workers())
+
+    def get_ledger_chain(self):
+        return self.__chain
+
+    def reconcile_balances(self, workers=None, partitions=None, chunk_size=200000):
+        """Check every account's balance against the ledger read from storage; returns a report"""
+        return reconcile_ledger(self._reconcile_transactions(), self._reconcile_rows(), workers, partitions,
+                                chunk_size)
+
+    def _reconcile_transactions(self):
+        """Stored ledger rows not folded into a compaction checkpoint"""
+        checkpoints = self.__checkpoints
+        for transaction in self._iter_ledger():
+            checkpoint = checkpoints.get(transaction.get_account_number())
+            if checkpoint is None or not checkpoint.covers(transaction.get_transaction_id()):
+                yield transaction
+
+    def project_accounts(self, workers=None, read_models=(), partitions=None, chunk_size=200000):
+        """Rebuild every account's state from the ledger and the account events"""
+        events = [AccountEvent.from_dict(data) for data in self.__storage.load_account_events()]
+        return project_ledger(self.__columns, self._transactions_at, self.__checkpoints, events, read_models,
+                              workers, partitions, chunk_size)
+
+    def verify_projections(self, workers=None):
+        """Compare live accounts with their projected state; returns mismatch rows"""
+        states = self.project_accounts(workers)
+        mismatches = []
+        for account in self.__storage.iter_accounts():
+            state = states.get(account.get_account_number())
+            if state is None:
+                mismatches.append({"account_number": account.get_account_number(), "field": "account",
+                                   "live": account.get_account_type(), "projected": None})
+                continue
+            projected = state.get_fields()
+            for field, live in account._projected_fields().items():
+                if projected[field] != live:
+                    mismatches.append({"account_number": account.get_account_number(), "field": field,
+                                       "live": live, "projected": projected[field]})
+        return mismatches
+
+    def restore_from_projections(self, workers=None):
+        """Reset live account state to the projected state; returns the changed account numbers"""
+        states = self.project_accounts(workers)
+        restored = []
+        for account in list(self.__storage.iter_accounts()):
+            state = states.get(account.get_account_number())
+            if state is None or state.get_account_type() != account.get_account_type():
+                continue
+            projected = state.get_fields()
+            if any(projected[field] != live for field, live in account._projected_fields().items()):
+                account._restore_projection(state)
+                self.__storage.save_account(account)
+                restored.append(account.get_account_number())
+        return restored
+
+    def _reconcile_rows(self):
+        for account in self.__storage.iter_accounts():
+            checkpoint = self.__checkpoints.get(account.get_account_number())
+            base = checkpoint.get_balance() if checkpoint is not None else account.get_opening_balance()
+            yield account.get_account_number(), base, account.get_balance()
+
+    def get_checkpoint(self, account_number):
+        """AccountCheckpoint of the account's compacted history (None if never compacted)"""
+        return self.__checkpoints.get(account_number)
+
+    def verify_account_history(self, account):
+        """True if balance == checkpoint (or opening) balance + signed sum of remaining transactions"""
+        checkpoint = self.__checkpoints.get(account.get_account_number())
+        expected = checkpoint.get_balance() if checkpoint is not None else account.get_opening_balance()
+        for transaction in self.get_transactions_by_account(account.get_account_number()):
+            expected += transaction.get_signed_amount()
+        return expected == account.get_balance()
+
     def get_account_by_number(self, account_number):
-        """Get account by account number"""
-        for acc in self.__accounts:
-            if acc.get_account_number() == account_number:
-                return acc
-        return None
+        """Get account by account number (unknown numbers never reach storage)"""
+        if account_number not in self.__account_filter:
+            return None
+        return self.__storage.get_account(account_number)
+
+    def find_accounts_by_username(self, text, exact=False):
+        """Lazily yield accounts whose username starts with (or equals) text, case-insensitive"""
+        for account_number in self.__username_index.search(text, exact):
+            yield self.get_account_by_number(account_number)
 
     def get_transactions_by_account(self, account_number):
         """Get all transactions for specific account"""
-        return [t for t in self.__transactions if t.get_account_number() == account_number]
+        positions = self.__time_index.positions_for_account(account_number)
+        return self._transactions_at(positions)
 
     def get_transactions_by_username(self, username):
         """Get all transactions for specific username"""
-        return [t for t in self.__transactions if t.get_username() == username]
+        positions = self.__time_index.positions_for_username(username)
+        return self._transactions_at(positions)
+
+    def get_transactions_between(self, start=None, end=None, account_number=None, username=None,
+                                 offset=0, limit=None):
+        """Get one page of transactions with start <= date < end, optionally for one account/username"""
+        positions, _ = self.__time_index.query(start, end, account_number, username, offset, limit)
+        return self._transactions_at(positions)
+
+    def count_transactions_between(self, start=None, end=None, account_number=None, username=None):
+        """Count transactions with start <= date < end (for paging)"""
+        return self.__time_index.query(start, end, account_number, username, limit=0)[1]
+
+    def query(self):
+        """Start an ad-hoc transaction query (see query.TransactionQuery)"""
+        return TransactionQuery(self.__columns, self.__time_index, self.__transactions_view)
+
+    def _account_event_count(self):
+        """AccountEvents stored since the bank was opened"""
+        return len(self.__event_accounts)
+
+    def _accounts_changed_since(self, position, event_position):
+        """Account numbers with a ledger entry at or after position, or an AccountEvent at or after event_position"""
+        changed = set(self.__columns.account_numbers[position:])
+        changed.update(self.__event_accounts[event_position:])
+        return changed
+
+    def _before_account_change(self, account):
+        """Called by accounts (and on removal) before their state changes"""
+        for ref in self.__snapshots:
+            snapshot = ref()
+            if snapshot is not None:
+                snapshot._preserve(account)
+
+    def _on_balance_change(self, account):
+        """Called by accounts after every balance change"""
+        self.__storage.save_account(account)
+        self.__balance_leaderboard.update(account.get_account_number(), account.get_balance())
+
+    def _accounts_with(self, pairs):
+        return [(self.get_account_by_number(number), value) for number, value in pairs]
+
+    def get_top_balances(self, n=100):
+        """[(account, balance)] for the n largest balances"""
+        return self._accounts_with(self.__balance_leaderboard.largest(n))
+
+    def get_most_overdrawn(self, n=100):
+        """[(account, balance)] for the n most negative balances"""
+        return self._accounts_with(self.__balance_leaderboard.smallest(n, below=0))
+
+    def get_most_active(self, n=100, start_day=None, end_day=None):
+        """[(account, transaction count)] for the n busiest accounts between two dates"""
+        pairs = self.__activity.most_active(n, start_day, end_day)
+        return [(acc, count) for acc, count in self._accounts_with(pairs) if acc is not None]
+
+    def get_daily_rollup(self, day):
+        """Per-(transaction type, account type) count/sum/min/max for one date"""
+        return self.__daily_rollups.get_day(day)
+
+    def get_period_summary(self, start_day=None, end_day=None, group_by=("transaction_type", "account_type")):
+        """Totals for start_day <= date <= end_day from daily rollups (no ledger scan)"""
+        return self.__daily_rollups.summarize(start_day, end_day, group_by)
 
     def get_total_balance(self):
         """Calculate total balance in bank"""
-        return sum(acc.get_balance() for acc in self.__accounts)
+        return self.__storage.total_balance()
+
+    def get_balance_array(self):
+        """Account balances (minor units) packed as int64 array, in account list order"""
+        return pack(acc.get_balance() for acc in self.__storage.iter_accounts())
 
     def get_total_overdraft(self):
         """Calculate total overdraft limit"""
-        total = 0
-        for acc in self.__accounts:
-            if isinstance(acc, OverdraftAccount):
-                total += acc._OverdraftAccount__overdraft_limit
-        return total
+        return self.__total_overdraft
 
     def remove_account(self, account):
-        """Remove account from bank"""
-        if account in self.__accounts:
-            self.__accounts.remove(account)
+        """Remove account from bank in O(1) (the last account takes its slot)"""
+        account_number = account.get_account_number()
+        if self.__storage.get_account(account_number) is not account:
+            return
+        self._before_account_change(account)
+        event = AccountEvent(ACCOUNT_CLOSED, account_number, account.get_username(), account.get_account_type(),
+                             account.get_balance(), self.__clock.now())
+        self.__storage.remove_account(account_number, event.to_dict())
+        self.__event_accounts.append(account_number)
+        self.__total_overdraft -= self._overdraft_of(account)
+        self.__balance_leaderboard.remove(account_number)
+        self.__username_index.remove(account.get_username(), account_number)
+
+    def convert_contract_account(self, account, password, idempotency_key=None):
+        """Settle a SavingAccount/TimeDepositAccount and replace it with a normal account"""
+        if idempotency_key is not None:
+            request = ("convert_contract_account", account.get_account_number(), password)
+            return self._run_idempotent(idempotency_key, request,
+                                        lambda: self.convert_contract_account(account, password),
+                                        encode=BankAccount.get_account_number,
+                                        decode=self.get_account_by_number)
+        if not isinstance(account, ContractAccount):
+            raise ContractValueError("Only contract accounts can be converted.")
+        if self.__storage.get_account(account.get_account_number()) is not account:
+            raise ContractValueError("Account does not belong to this bank.")
+
+        interest, _, outcome = account._settle_contract(password)
+        account._post_settlement(interest, outcome, converted=True)
+
+        new_account = account.to_normal_account()
+        self.__storage.replace_account(new_account)
+        return new_account
 
     def get_all_accounts(self):
-        """Get all accounts"""
-        return self.__accounts.copy()
+        """Get read-only live view of all accounts"""
+        return self.__accounts_view
 
     def get_all_transactions(self):
-        """Get all transactions"""
-        return self.__transactions.copy()
+        """Get read-only live view of all transactions (None at compacted positions)"""
+        return self.__transactions_view
+
+    def snapshot(self):
+        """Take a consistent point-in-time BankSnapshot for reports and exports"""
+        snapshot = BankSnapshot(self, self.__storage.account_numbers(), self._transaction_count(),
+                                self.__clock.now())
+        live = tuple(ref for ref in self.__snapshots if ref() is not None)
+        self.__snapshots = live + (weakref.ref(snapshot),)
+        return snapshot
+
+    def _release_snapshot(self, snapshot):
+        self.__snapshots = tuple(ref for ref in self.__snapshots if ref() not in (None, snapshot))
+
+    def get_open_snapshot_count(self):
+        return sum(1 for ref in self.__snapshots if ref() is not None)
+
+    def snapshot_accounts(self):
+        """Get isolated copy of account list"""
+        return self.__accounts_view.snapshot()
+
+    def snapshot_transactions(self):
+        """Get isolated copy of transaction list"""
+        return self.__transactions_view.snapshot()
+
+    def iter_accounts(self):
+        """Iterate over accounts without copying"""
+        return self.__storage.iter_accounts()
+
+    def _iter_ledger(self):
+        """Archived then stored transactions, including compacted ones still held"""
+        if self.__archive is None:
+            return self.__storage.iter_transactions()
+        return chain(self.__archive.iter_transactions(), self.__storage.iter_transactions())
+
+    def iter_transactions(self, start=None, end=None, account_number=None, username=None):
+        """Iterate over transactions in posting order without copying (compacted ones are skipped)"""
+        if username is not None:
+            return self._iter_username_transactions(start, end, account_number, username)
+        if start is None and end is None and account_number is None:
+            transactions = self._iter_ledger()
+        else:
+            archived = self.__archive.scan(start, end, account_number) if self.__archive is not None else ()
+            transactions = chain(archived, self._filter_transactions(self.__storage.iter_transactions(),
+                                                                     start, end, account_number))
+        if self.__time_index.get_removed_total():
+            is_removed = self.__time_index.is_removed
+            transactions = (t for t in transactions if not is_removed(t.get_transaction_id() - 1))
+        return transactions
+
+    def _iter_username_transactions(self, start, end, account_number, username, page_size=1000):
+        positions, _ = self.__time_index.query(start, end, None, username)
+        for i in range(0, len(positions), page_size):
+            for transaction in self._transactions_at(positions[i:i + page_size]):
+                if account_number is None or transaction.get_account_number() == account_number:
+                    yield transaction
+
+    @staticmethod
+    def _filter_transactions(transactions, start, end, account_number):
+        for transaction in transactions:
+            date = transaction.get_transaction_date()
+            if start is not None and date < start:
+                continue
+            if end is not None and date >= end:
+                continue
+            if account_number is not None and transaction.get_account_number() != account_number:
+                continue
+            yield transaction
 
     def show_all_accounts(self):
-        """Display all accounts information"""
-        print("\n=== All Accounts in Bank ===")
-        for acc in self.__accounts:
-            acc.show_account_info()
-            print("--------------------------")
-        print(f"Total amount in bank: {self.get_total_balance()}")
-        print(f"Max overdraft allowed: {self.get_total_overdraft()}")
+        """Display all accounts information from one snapshot"""
+        with self.snapshot() as snapshot:
+            snapshot.show_all_accounts()
 
     def show_all_transactions(self):
         """Display all transactions"""
-        if not self.__transactions:
+        if not self._transaction_count():
             print("No transactions found.")
             return
         
         print("\n=== All Transactions ===")
         # Group by username
-        usernames = set(t.get_username() for t in self.__transactions)
+        usernames = set(t.get_username() for t in self.iter_transactions())
         
         for username in sorted(usernames):
             print(f"\n--- {username} ---")
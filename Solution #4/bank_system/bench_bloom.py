@@ -0,0 +1,72 @@
+"""
+File Name: bench_bloom.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Memory / false positive report for the account number filter
+Usage: python bench_bloom.py [--accounts N] [--probes N] [--rate P]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from bloom import ScalableBloomFilter, measure_false_positive_rate
+from bank import Bank
+from accounts.base import BankAccount
+from storage import SQLiteStorage
+
+
+def set_bytes(numbers):
+    """Approximate memory of a Python set of ints"""
+    return sys.getsizeof(numbers) + sum(sys.getsizeof(n) for n in numbers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Account number filter report")
+    parser.add_argument("--accounts", type=int, default=100000)
+    parser.add_argument("--probes", type=int, default=100000)
+    parser.add_argument("--rate", type=float, default=0.01, help="target false positive rate")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    numbers = rng.sample(range(10000000, 100000000), args.accounts + args.probes)
+    members, absent = numbers[:args.accounts], numbers[args.accounts:]
+
+    for expected in (args.accounts, max(1, args.accounts // 8)):
+        bloom = ScalableBloomFilter(expected, args.rate)
+        for number in members:
+            bloom.add(number)
+        assert all(number in bloom for number in members)
+        stats = bloom.get_stats()
+        measured = measure_false_positive_rate(bloom, absent)
+        print(f"\n=== filter sized for {expected} accounts, holding {args.accounts} ===")
+        print(f"layers                        {stats['layers']}")
+        print(f"filter memory                 {stats['bytes']:,} bytes "
+              f"({stats['bytes'] * 8 / args.accounts:.1f} bits/account)")
+        print(f"set of ints memory            {set_bytes(set(members)):,} bytes")
+        print(f"expected false positive rate  {stats['expected_false_positive_rate']:.4%}")
+        print(f"measured false positive rate  {measured:.4%} over {len(absent)} absent numbers")
+
+    # Misses against a disk-backed store, with and without the filter
+    with tempfile.TemporaryDirectory() as directory:
+        bank = Bank(storage=SQLiteStorage(os.path.join(directory, "bank.db")),
+                    expected_accounts=min(args.accounts, 20000))
+        bank.add_accounts(BankAccount(f"user_{i}", "1234", 0.01) for i in range(min(args.accounts, 20000)))
+        storage = bank.get_storage()
+        start = time.perf_counter()
+        for number in absent:
+            bank.get_account_by_number(number)
+        filtered = time.perf_counter() - start
+        start = time.perf_counter()
+        for number in absent:
+            storage.get_account(number)
+        unfiltered = time.perf_counter() - start
+        bank.close()
+    print(f"\n=== {len(absent)} lookups of unknown numbers (SQLite storage) ===")
+    print(f"with filter                   {filtered:.3f} s")
+    print(f"storage probe only            {unfiltered:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+File Name: bench_reconcile.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Times parallel reconciliation and projection rebuild and checks planted mismatches are found
+Usage: python bench_reconcile.py [--accounts N] [--transfers N] [--workers 1,2,4] [--chunk-size N]
+"""
+import argparse
+import os
+import random
+import time
+from bank import Bank
+from clock import SimulatedClock
+from accounts.base import BankAccount
+
+
+PASSWORD = "1234"
+
+
+def build_bank(account_count, transfer_count, seed):
+    rng = random.Random(seed)
+    random.seed(seed)  # account numbers
+    bank = Bank(clock=SimulatedClock())
+    accounts = []
+    for i in range(account_count):
+        account = BankAccount(f"user_{i}", PASSWORD, 0.01)
+        account.set_opening_balance(rng.randrange(100000, 1000000))
+        accounts.append(account)
+    numbers = [acc.get_account_number() for acc in bank.add_accounts(accounts)]
+    for _ in range(transfer_count):
+        src, dst = rng.sample(numbers, 2)
+        try:
+            bank.transfer(src, dst, rng.randrange(1, 5000), PASSWORD)
+        except Exception:
+            pass
+    return bank, accounts, rng
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel balance reconciliation")
+    parser.add_argument("--accounts", type=int, default=20000)
+    parser.add_argument("--transfers", type=int, default=300000)
+    parser.add_argument("--workers", default=None,
+                        help="comma separated worker counts (default: 1,2,4,... up to the CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--planted", type=int, default=5, help="balances to corrupt before checking")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.workers:
+        worker_counts = [int(w) for w in args.workers.split(",")]
+    else:
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({1, cpus} | {w for w in (2, 4, 8, 16) if w < cpus})
+
+    start = time.perf_counter()
+    bank, accounts, rng = build_bank(args.accounts, args.transfers, args.seed)
+    print(f"built {len(accounts)} accounts / {len(bank.get_all_transactions())} transactions "
+          f"in {time.perf_counter() - start:.1f} s")
+
+    # Balance changes that bypass the ledger must show up as mismatches
+    planted = rng.sample(accounts, args.planted)
+    for account in planted:
+        account._apply_balance_change(rng.randrange(1, 100))
+    expected = sorted(acc.get_account_number() for acc in planted)
+
+    start = time.perf_counter()
+    serial = sorted(acc.get_account_number() for acc in bank.iter_accounts()
+                    if not bank.verify_account_history(acc))
+    print(f"\n{'per-account history walk':<28} {time.perf_counter() - start:9.3f} s")
+    assert serial == expected, "per-account walk missed a planted mismatch"
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        report = bank.reconcile_balances(workers=workers, chunk_size=args.chunk_size)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        found = [row["account_number"] for row in report["mismatches"]]
+        assert found == expected, f"{workers} workers: mismatches {found} != planted {expected}"
+        print(f"{f'reconcile, {workers} workers':<28} {seconds:9.3f} s   speedup {baseline / seconds:4.2f}x")
+    print(f"\nAll runs found the {len(expected)} planted mismatches.\n")
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        states = bank.project_accounts(workers=workers, chunk_size=args.chunk_size)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        drifted = sorted(number for number, state in states.items()
+                         if state.get_balance() != bank.get_account_by_number(number).get_balance())
+        assert drifted == expected, f"{workers} workers: projection differs at {drifted}"
+        print(f"{f'projection, {workers} workers':<28} {seconds:9.3f} s   speedup {baseline / seconds:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
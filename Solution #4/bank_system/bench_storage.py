@@ -0,0 +1,147 @@
+"""
+File Name: bench_storage.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Runs one workload against each storage backend, times it and checks the results agree
+Usage: python bench_storage.py [--accounts N] [--transfers N] [--batch-size N] [--hot-budget BYTES]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from bank import Bank
+from clock import SimulatedClock
+from accounts.base import BankAccount
+from accounts.types import OverdraftAccount
+from storage import MemoryStorage, SQLiteStorage, TieredStorage
+
+
+PASSWORD = "1234"
+
+
+class Timer:
+    """Collects (phase, seconds, operations) rows"""
+
+    def __init__(self):
+        self.rows = []
+
+    def run(self, phase, operations, action):
+        start = time.perf_counter()
+        result = action()
+        self.rows.append((phase, time.perf_counter() - start, operations))
+        return result
+
+
+def run_workload(bank, timer, account_count, transfer_count, seed):
+    """Same operations for every backend; returns values that must match"""
+    rng = random.Random(seed)
+    random.seed(seed)  # account numbers
+
+    def create():
+        accounts = []
+        for i in range(account_count):
+            if i % 4 == 0:
+                account = OverdraftAccount(f"user_{i}", PASSWORD, 0.01, 100000)
+            else:
+                account = BankAccount(f"user_{i}", PASSWORD, 0.01)
+            account.set_opening_balance(rng.randrange(0, 1000000))
+            accounts.append(account)
+        return [acc.get_account_number() for acc in bank.add_accounts(accounts)]
+
+    numbers = timer.run("add_accounts", account_count, create)
+    pairs = [tuple(rng.sample(numbers, 2)) + (rng.randrange(1, 5000),) for _ in range(transfer_count)]
+    clock = bank.get_clock()
+
+    def transfer():
+        for i, (src, dst, amount) in enumerate(pairs):
+            if i % 1000 == 0:
+                clock.advance(seconds=60)
+            try:
+                bank.transfer(src, dst, amount, PASSWORD)
+            except Exception:
+                pass
+
+    timer.run("transfer", transfer_count, transfer)
+    # Skewed lookups: 80% go to the first 10% of accounts
+    hot_numbers = numbers[:max(1, len(numbers) // 10)]
+    probes = [rng.choice(hot_numbers if rng.random() < 0.8 else numbers) for _ in range(transfer_count)]
+    timer.run("get_account_by_number", len(probes),
+              lambda: [bank.get_account_by_number(n) for n in probes])
+    sample = probes[:1000]
+    history = timer.run("get_transactions_by_account", len(sample),
+                        lambda: sum(len(bank.get_transactions_by_account(n)) for n in sample))
+    total = timer.run("get_total_balance", 1, bank.get_total_balance)
+    totals = timer.run("ledger_totals", 1, bank.get_storage().ledger_totals)
+    timer.run("flush", 1, bank.flush)
+    return {
+        "accounts": len(bank.get_all_accounts()),
+        "transactions": len(bank.get_all_transactions()),
+        "history rows": history,
+        "total balance": total,
+        "ledger total": sum(t for _, t in totals.values()),
+    }
+
+
+def report(name, timer, results, stats=None):
+    print(f"\n=== {name} ===")
+    for phase, seconds, operations in timer.rows:
+        rate = operations / seconds if seconds else float("inf")
+        print(f"{phase:<28} {seconds:9.3f} s {rate:14,.0f} ops/s")
+    for key, value in results.items():
+        print(f"{key:<28} {value}")
+    for key, value in (stats or {}).items():
+        print(f"{key:<28} {value:.3f}" if isinstance(value, float) else f"{key:<28} {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bank storage backends")
+    parser.add_argument("--accounts", type=int, default=10000)
+    parser.add_argument("--transfers", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--hot-budget", type=int, default=256 * 1024,
+                        help="tiered backend: hot tier memory budget in bytes")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    outcomes = {}
+    timer = Timer()
+    bank = Bank(clock=SimulatedClock(), storage=MemoryStorage())
+    outcomes["memory"] = run_workload(bank, timer, args.accounts, args.transfers, args.seed)
+    report("memory", timer, outcomes["memory"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.db")
+        timer = Timer()
+        bank = Bank(clock=SimulatedClock(), storage=SQLiteStorage(path, args.batch_size))
+        outcomes["sqlite"] = run_workload(bank, timer, args.accounts, args.transfers, args.seed)
+        bank.close()
+        reopened = timer.run("reopen (load + index)", 1,
+                             lambda: Bank(clock=SimulatedClock(), storage=SQLiteStorage(path)))
+        outcomes["sqlite reopened"] = {
+            "accounts": len(reopened.get_all_accounts()),
+            "transactions": len(reopened.get_all_transactions()),
+            "total balance": reopened.get_total_balance(),
+        }
+        reopened.close()
+        report(f"sqlite (batch size {args.batch_size})", timer, outcomes["sqlite"])
+
+    timer = Timer()
+    storage = TieredStorage(memory_budget=args.hot_budget)
+    bank = Bank(clock=SimulatedClock(), storage=storage)
+    outcomes["tiered"] = run_workload(bank, timer, args.accounts, args.transfers, args.seed)
+    stats = storage.get_stats()
+    bank.close()
+    report(f"tiered (hot budget {args.hot_budget} bytes)", timer, outcomes["tiered"], stats)
+
+    memory = outcomes["memory"]
+    mismatched = [f"{name} {key}" for name in ("sqlite", "tiered")
+                  for key, value in outcomes[name].items() if memory[key] != value]
+    mismatched += [f"reopened {key}" for key, value in outcomes["sqlite reopened"].items()
+                   if memory[key] != value]
+    print("\nBackends agree." if not mismatched else f"\nMISMATCH: {', '.join(mismatched)}")
+    return 0 if not mismatched else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+"""
+File Name: bench_writer.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Compares the single-writer command queue with a global lock under concurrent writers and readers
+Usage: python bench_writer.py [--accounts N] [--clients N] [--readers N] [--ops N] [--hot 0.5] [--window 16]
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+from bank import Bank
+from clock import SimulatedClock
+from accounts.base import BankAccount
+from exceptions import InvalidAmountError
+from writer import BankWriter
+
+
+PASSWORD = "1234"
+
+
+def build_bank(account_count, seed):
+    rng = random.Random(seed)
+    random.seed(seed)  # account numbers
+    bank = Bank(clock=SimulatedClock())
+    accounts = []
+    for i in range(account_count):
+        account = BankAccount(f"user_{i}", PASSWORD, 0.01)
+        account.set_opening_balance(rng.randrange(100000, 1000000))
+        accounts.append(account)
+    return bank, [acc.get_account_number() for acc in bank.add_accounts(accounts)]
+
+
+def transfer_plan(numbers, count, hot, seed):
+    """(src, dst, amount) list; a `hot` share of transfers involve the first account"""
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(count):
+        src, dst = rng.sample(numbers[1:], 2)
+        if rng.random() < hot:
+            src, dst = (numbers[0], dst) if rng.random() < 0.5 else (src, numbers[0])
+        plan.append((src, dst, rng.randrange(1, 5000)))
+    return plan
+
+
+class GlobalLockBank:
+    """Naive baseline: every read and write takes one lock around the bank"""
+
+    def __init__(self, bank):
+        self.__bank = bank
+        self.__lock = threading.Lock()
+
+    def transfer(self, src, dst, amount):
+        with self.__lock:
+            return self.__bank.transfer(src, dst, amount, PASSWORD)
+
+    def get_balance(self, account_number):
+        with self.__lock:
+            return self.__bank.get_account_by_number(account_number).get_balance()
+
+    def report(self):
+        """(sum of listed balances, total); both under the lock, so they agree"""
+        with self.__lock:
+            listed = sum(acc.get_balance() for acc in self.__bank.iter_accounts())
+            return listed, self.__bank.get_total_balance()
+
+
+class WriterBank:
+    """Single writer: transfers are queued, reads use the published state"""
+
+    def __init__(self, bank, batch_size, window):
+        self.__writer = BankWriter(bank, batch_size)
+        self.__window = window
+
+    def transfers(self, plan, latencies):
+        """Submit with up to `window` transfers in flight; records submit-to-result latency"""
+        in_flight = []
+        for src, dst, amount in plan:
+            in_flight.append((time.perf_counter(), self.__writer.submit("transfer", src, dst, amount, PASSWORD)))
+            if len(in_flight) >= self.__window:
+                self._wait(in_flight.pop(0), latencies)
+        for entry in in_flight:
+            self._wait(entry, latencies)
+
+    @staticmethod
+    def _wait(entry, latencies):
+        started, future = entry
+        try:
+            future.result()
+        except InvalidAmountError:
+            pass
+        latencies.append(time.perf_counter() - started)
+
+    def get_balance(self, account_number):
+        return self.__writer.get_state().get_balance(account_number)
+
+    def report(self):
+        state = self.__writer.get_state()
+        return sum(balance for _, balance in state.get_balances().items()), state.get_total_balance()
+
+    def close(self):
+        self.__writer.close()
+        return self.__writer
+
+
+def run(target, plans, numbers, readers, report_every, read_pause):
+    """Run client and reader threads; returns measurements"""
+    latencies = [[] for _ in plans]
+    reads = [0] * readers
+    reports = [0] * readers
+    inconsistent = [0]
+    done = threading.Event()
+
+    def client(index):
+        if isinstance(target, WriterBank):
+            target.transfers(plans[index], latencies[index])
+            return
+        for src, dst, amount in plans[index]:
+            started = time.perf_counter()
+            try:
+                target.transfer(src, dst, amount)
+            except InvalidAmountError:
+                pass
+            latencies[index].append(time.perf_counter() - started)
+
+    def reader(index):
+        rng = random.Random(index)
+        while not done.is_set():
+            target.get_balance(numbers[rng.randrange(len(numbers))])
+            reads[index] += 1
+            if reads[index] % report_every == 0:
+                listed, total = target.report()
+                reports[index] += 1
+                if listed != total:
+                    inconsistent[0] += 1
+            time.sleep(read_pause)
+
+    reader_threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    client_threads = [threading.Thread(target=client, args=(i,)) for i in range(len(plans))]
+    start = time.perf_counter()
+    for thread in reader_threads + client_threads:
+        thread.start()
+    for thread in client_threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    all_latencies = sorted(x for per_client in latencies for x in per_client)
+    return {
+        "seconds": seconds,
+        "writes_per_second": len(all_latencies) / seconds,
+        "p50_ms": statistics.median(all_latencies) * 1000,
+        "p99_ms": all_latencies[int(len(all_latencies) * 0.99) - 1] * 1000,
+        "reads_per_second": sum(reads) / seconds,
+        "reports": sum(reports),
+        "inconsistent_reports": inconsistent[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-writer queue against a global lock")
+    parser.add_argument("--accounts", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=8, help="writer client threads")
+    parser.add_argument("--readers", type=int, default=2, help="reader threads")
+    parser.add_argument("--ops", type=int, default=5000, help="transfers per client")
+    parser.add_argument("--hot", type=float, default=0.5, help="share of transfers touching one hot account")
+    parser.add_argument("--window", type=int, default=16, help="transfers a client keeps in flight (queue mode)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--report-every", type=int, default=500, help="reads between full balance reports")
+    parser.add_argument("--read-pause", type=float, default=0.0002, help="seconds a reader waits between reads")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    modes = [("global lock", None), ("single writer, window 1", 1),
+             (f"single writer, window {args.window}", args.window)]
+    print(f"{args.clients} clients x {args.ops} transfers ({args.hot:.0%} on one account), "
+          f"{args.readers} readers, {args.accounts} accounts\n")
+    print(f"{'mode':<28} {'writes/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'reads/s':>10} {'reports':>8}")
+    final_balances = []
+    for name, window in modes:
+        bank, numbers = build_bank(args.accounts, args.seed)
+        plans = [transfer_plan(numbers, args.ops, args.hot, args.seed + i) for i in range(args.clients)]
+        target = GlobalLockBank(bank) if window is None else WriterBank(bank, args.batch_size, window)
+        result = run(target, plans, numbers, args.readers, args.report_every, args.read_pause)
+        batches = ""
+        if window is not None:
+            writer = target.close()
+            batches = f"   ({writer.get_applied_count() / max(1, writer.get_batch_count()):.1f} ops/batch)"
+        assert result["inconsistent_reports"] == 0, f"{name}: a report's listing and total disagreed"
+        assert not bank.reconcile_balances(workers=1)["mismatches"], f"{name}: balances do not match the ledger"
+        final_balances.append(bank.get_total_balance())
+        print(f"{name:<28} {result['writes_per_second']:10.0f} {result['p50_ms']:8.2f} {result['p99_ms']:8.2f} "
+              f"{result['reads_per_second']:10.0f} {result['reports']:8d}{batches}")
+    assert len(set(final_balances)) == 1, "modes ended with different total balances"
+    print("\nEvery report was internally consistent and every ledger reconciled.")
+
+
+if __name__ == "__main__":
+    main()
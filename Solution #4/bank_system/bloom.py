@@ -0,0 +1,118 @@
+"""
+File Name: bloom.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Bloom filters for cheap "definitely not present" membership checks
+"""
+import hashlib
+import math
+
+
+def _key_bytes(key):
+    if isinstance(key, int):
+        return key.to_bytes(16, "little", signed=True)
+    return repr(key).encode("utf-8")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized from expected item count and false positive rate"""
+
+    def __init__(self, expected_items, false_positive_rate=0.01):
+        if expected_items <= 0:
+            raise ValueError("expected_items must be greater than 0")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.__capacity = expected_items
+        self.__target_rate = false_positive_rate
+        self.__bit_count = max(8, math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.__hash_count = max(1, round(self.__bit_count / expected_items * math.log(2)))
+        self.__bits = bytearray((self.__bit_count + 7) // 8)
+        self.__items = 0
+
+    def __len__(self):
+        return self.__items
+
+    def _hashes(self, key):
+        digest = hashlib.blake2b(_key_bytes(key), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, key):
+        h1, h2 = self._hashes(key)
+        bits, bit_count = self.__bits, self.__bit_count
+        for i in range(self.__hash_count):
+            position = (h1 + i * h2) % bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+        self.__items += 1
+
+    def __contains__(self, key):
+        h1, h2 = self._hashes(key)
+        bits, bit_count = self.__bits, self.__bit_count
+        for i in range(self.__hash_count):
+            position = (h1 + i * h2) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False  # most misses stop at the first probes
+        return True
+
+    def is_full(self):
+        return self.__items >= self.__capacity
+
+    def expected_false_positive_rate(self):
+        """(1 - e^(-kn/m))^k for the current item count"""
+        k, m = self.__hash_count, self.__bit_count
+        return (1 - math.exp(-k * self.__items / m)) ** k
+
+    def get_stats(self):
+        return {
+            "items": self.__items,
+            "capacity": self.__capacity,
+            "bits": self.__bit_count,
+            "bytes": len(self.__bits),
+            "hash_functions": self.__hash_count,
+            "target_false_positive_rate": self.__target_rate,
+            "expected_false_positive_rate": self.expected_false_positive_rate(),
+        }
+
+
+class ScalableBloomFilter:
+    """Bloom filter that adds a larger layer whenever the newest one is full"""
+
+    def __init__(self, expected_items=100000, false_positive_rate=0.01):
+        self.__layers = [BloomFilter(expected_items, false_positive_rate / 2)]
+
+    def __len__(self):
+        return sum(len(layer) for layer in self.__layers)
+
+    def add(self, key):
+        layer = self.__layers[-1]
+        if layer.is_full():
+            stats = layer.get_stats()
+            layer = BloomFilter(stats["capacity"] * 2, stats["target_false_positive_rate"] / 2)
+            self.__layers.append(layer)
+        layer.add(key)
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self.__layers)
+
+    def expected_false_positive_rate(self):
+        miss = 1.0
+        for layer in self.__layers:
+            miss *= 1 - layer.expected_false_positive_rate()
+        return 1 - miss
+
+    def get_stats(self):
+        layers = [layer.get_stats() for layer in self.__layers]
+        return {
+            "items": len(self),
+            "layers": len(layers),
+            "bits": sum(layer["bits"] for layer in layers),
+            "bytes": sum(layer["bytes"] for layer in layers),
+            "expected_false_positive_rate": self.expected_false_positive_rate(),
+        }
+
+
+def measure_false_positive_rate(bloom, absent_keys):
+    """Fraction of keys known to be absent that the filter reports as present"""
+    absent_keys = list(absent_keys)
+    if not absent_keys:
+        return 0.0
+    return sum(1 for key in absent_keys if key in bloom) / len(absent_keys)
@@ -0,0 +1,127 @@
+"""
+File Name: checkpoints.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Checkpoint records that replace an account's compacted transaction history
+"""
+from datetime import date, datetime
+
+
+# Account types whose old history may be compacted by default
+COMPACTABLE_ACCOUNT_TYPES = ("BankAccount", "OverdraftAccount")
+
+
+class AccountCheckpoint:
+    """Totals of an account's transactions up to a horizon"""
+
+    def __init__(self, account_number, opening_balance=0):
+        self.__account_number = account_number
+        self.__opening_balance = opening_balance
+        self.__as_of = None  # horizon of the latest compaction
+        self.__last_transaction_id = 0
+        self.__transaction_count = 0
+        self.__net_amount = 0
+        self.__type_totals = {}  # transaction type -> [count, sum of amounts]
+        self.__termination = None  # details of the last compacted "Contract Termination" entry
+        # (date, transaction type, account type) -> [count, sum, min, max] of the compacted entries,
+        # so daily rollups and activity counts can be rebuilt without them
+        self.__daily = {}
+
+    def fold(self, transaction):
+        """Add one compacted transaction (in ledger order)"""
+        if transaction.get_transaction_id() <= self.__last_transaction_id:
+            raise ValueError("Transactions must be folded in ledger order")
+        self.__last_transaction_id = transaction.get_transaction_id()
+        self.__transaction_count += 1
+        self.__net_amount += transaction.get_signed_amount()
+        totals = self.__type_totals.setdefault(transaction.get_transaction_type(), [0, 0])
+        totals[0] += 1
+        totals[1] += transaction.get_amount()
+        amount = transaction.get_amount()
+        key = (transaction.get_transaction_date().date(), transaction.get_transaction_type(),
+               transaction.get_account_type())
+        cell = self.__daily.get(key)
+        if cell is None:
+            self.__daily[key] = [1, amount, amount, amount]
+        else:
+            cell[0] += 1
+            cell[1] += amount
+            cell[2] = min(cell[2], amount)
+            cell[3] = max(cell[3], amount)
+        if transaction.get_transaction_type() == "Contract Termination":
+            self.__termination = transaction.get_details() or {}
+
+    def set_as_of(self, horizon):
+        self.__as_of = horizon
+
+    def covers(self, transaction_id):
+        """True if the transaction is part of this checkpoint"""
+        return transaction_id <= self.__last_transaction_id
+
+    # Getter methods
+    def get_account_number(self):
+        return self.__account_number
+
+    def get_as_of(self):
+        return self.__as_of
+
+    def get_last_transaction_id(self):
+        return self.__last_transaction_id
+
+    def get_transaction_count(self):
+        return self.__transaction_count
+
+    def get_net_amount(self):
+        return self.__net_amount
+
+    def get_balance(self):
+        """Balance right after the last compacted transaction"""
+        return self.__opening_balance + self.__net_amount
+
+    def get_termination(self):
+        """Details (outcome, converted) of the last compacted contract termination, or None"""
+        return self.__termination
+
+    def get_daily_totals(self):
+        """[(date, transaction type, account type, count, sum, min, max)] of the compacted entries"""
+        return [key + tuple(cell) for key, cell in sorted(self.__daily.items())]
+
+    def get_type_totals(self):
+        """{transaction type: (count, sum of amounts)}"""
+        return {name: tuple(totals) for name, totals in self.__type_totals.items()}
+
+    def to_dict(self):
+        return {
+            "account_number": self.__account_number,
+            "opening_balance": self.__opening_balance,
+            "as_of": None if self.__as_of is None else self.__as_of.isoformat(),
+            "last_transaction_id": self.__last_transaction_id,
+            "transaction_count": self.__transaction_count,
+            "net_amount": self.__net_amount,
+            "type_totals": self.__type_totals,
+            "termination": self.__termination,
+            "daily": [[day.isoformat(), transaction_type, account_type] + cell
+                      for (day, transaction_type, account_type), cell in sorted(self.__daily.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        checkpoint = cls(data["account_number"], data["opening_balance"])
+        checkpoint.__as_of = None if data["as_of"] is None else datetime.fromisoformat(data["as_of"])
+        checkpoint.__last_transaction_id = data["last_transaction_id"]
+        checkpoint.__transaction_count = data["transaction_count"]
+        checkpoint.__net_amount = data["net_amount"]
+        checkpoint.__type_totals = {name: list(totals) for name, totals in data["type_totals"].items()}
+        checkpoint.__termination = data.get("termination")
+        checkpoint.__daily = {(date.fromisoformat(day), transaction_type, account_type): cell
+                              for day, transaction_type, account_type, *cell in data.get("daily", ())}
+        return checkpoint
+
+    def show_checkpoint_info(self):
+        """Display checkpoint information"""
+        print(f"Account: {self.__account_number}")
+        print(f"Compacted before: {self.__as_of}")
+        print(f"Compacted transactions: {self.__transaction_count} (up to ID {self.__last_transaction_id})")
+        print(f"Balance at checkpoint: {self.get_balance()}")
+        for name, (count, total) in sorted(self.__type_totals.items()):
+            print(f"   {name}: {count} totalling {total}")
@@ -0,0 +1,70 @@
+"""
+File Name: clock.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Clock abstraction used for transaction dates, account dates and contract maturity
+"""
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """Real wall clock"""
+
+    def now(self):
+        return datetime.now()
+
+
+class CoarseClock:
+    """Cached clock that only moves when tick() is called"""
+
+    def __init__(self, source=None):
+        self.__source = source if source is not None else SystemClock()
+        self.__now = self.__source.now()
+
+    def now(self):
+        return self.__now
+
+    def tick(self):
+        """Refresh cached time from source clock"""
+        self.__now = self.__source.now()
+        return self.__now
+
+
+class SimulatedClock:
+    """Manually controlled clock for tests and simulations"""
+
+    def __init__(self, start=None):
+        self.__now = start if start is not None else datetime.now()
+
+    def now(self):
+        return self.__now
+
+    def set(self, moment):
+        """Jump to given datetime (may not go backwards)"""
+        if moment < self.__now:
+            raise ValueError("SimulatedClock cannot move backwards")
+        self.__now = moment
+
+    def advance(self, days=0, seconds=0):
+        """Move clock forward"""
+        step = timedelta(days=days, seconds=seconds)
+        if step < timedelta(0):
+            raise ValueError("SimulatedClock cannot move backwards")
+        self.__now += step
+        return self.__now
+
+
+_default_clock = SystemClock()
+
+
+def get_default_clock():
+    """Clock used by accounts and banks created without an explicit clock"""
+    return _default_clock
+
+
+def set_default_clock(clock):
+    """Replace default clock; returns the previous one"""
+    global _default_clock
+    previous = _default_clock
+    _default_clock = clock
+    return previous
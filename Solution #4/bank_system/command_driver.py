@@ -0,0 +1,400 @@
+"""
+File Name: command_driver.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Non-interactive command-stream driver for the bank system
+"""
+import argparse
+import io
+import json
+import os
+import shlex
+import sys
+from contextlib import redirect_stdout
+from datetime import timedelta
+from bank import Bank
+from clock import CoarseClock, SimulatedClock, set_default_clock
+from archive import TransactionArchive
+from storage import SQLiteStorage
+from accounts.types import SavingAccount, TimeDepositAccount
+from exceptions import (
+    InvalidPasswordError,
+    InvalidAmountError,
+    ContractValueError,
+    IdempotencyConflictError
+)
+from exporter import transaction_to_row
+from importer import account_from_row
+from ui_helpers import terminate_contract_account
+
+
+class CommandError(Exception):
+    """Exception raised when a command cannot be executed"""
+    def __init__(self, message="Invalid command"):
+        self.message = message
+        super().__init__(self.message)
+
+
+# Command reference shown by --help
+COMMAND_HELP = """\
+Reads commands as JSON lines or a simple text DSL and writes one JSON result per command.
+
+DSL examples:
+    create normal kwanju_1 1234 0.05
+    create saving kwanju_2 1234 0.05 100000 12
+    create timedeposit kwanju_3 1234 0.05 365
+    create overdraft kwanju_4 1234 0.05 500000
+    select 78345534      (or a list number, or an exact username)
+    deposit 500000
+    withdraw 40000 1234
+    transfer 12345678 10000 1234   (to account 12345678 from the selected account)
+    terminate 1234
+    reverse 17          (post a compensating entry for transaction 17)
+    info
+    history
+    advance 30          (simulated clock only: move forward 30 days)
+    archive 365         (move transactions older than 365 days to the archive; needs --archive)
+    compact 395         (fold each account's transactions older than 395 days into a checkpoint)
+    verify              (check the ledger hash chain since its last signed checkpoint)
+    audit 4             (recompute the whole ledger hash chain with 4 worker processes)
+    reconcile 4         (check every balance against its ledger entries with 4 worker processes)
+    projections 4       (rebuild account state from the ledger and list differences from live accounts)
+    totals              (account count, balance and overdraft totals and ledger length from one snapshot)
+JSON lines use the same names, e.g. {"op": "deposit", "amount": 500000, "account": 78345534}
+Any mutating command accepts an idempotency key: "key=abc" in the DSL or "key" in JSON.
+Ledger checkpoints are signed with the BANK_LEDGER_KEY environment variable (unsigned if it is not set).
+"""
+
+
+# Positional DSL arguments per create account type (after username, password, rate)
+CREATE_EXTRA_FIELDS = {
+    "saving": ["monthly_amount", "contract_months"],
+    "timedeposit": ["deposit_period"],
+    "overdraft": ["overdraft_limit"],
+}
+
+
+def parse_command(line):
+    """Parse one JSON or DSL line into a command dict (None for blank/comment)"""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        try:
+            command = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CommandError(f"Invalid JSON: {e}")
+        if not isinstance(command, dict) or "op" not in command:
+            raise CommandError("JSON command must be an object with 'op'")
+        return command
+
+    words = shlex.split(line)
+    op = words[0].lower()
+    key = None
+    args = []
+    for word in words[1:]:
+        if word.startswith("key="):
+            key = word[len("key="):]
+        else:
+            args.append(word)
+    try:
+        if op == "create":
+            account_type = args[0].lower()
+            command = {
+                "op": op,
+                "type": account_type,
+                "username": args[1],
+                "password": args[2],
+                "interest_rate": args[3],
+            }
+            command.update(zip(CREATE_EXTRA_FIELDS.get(account_type, []), args[4:]))
+        elif op == "select":
+            command = {"op": op, "account": args[0]}
+        elif op == "deposit":
+            command = {"op": op, "amount": args[0]}
+            if len(args) > 1:
+                command["account"] = args[1]
+        elif op == "withdraw":
+            command = {"op": op, "amount": args[0], "password": args[1]}
+            if len(args) > 2:
+                command["account"] = args[2]
+        elif op == "transfer":
+            command = {"op": op, "to": args[0], "amount": args[1], "password": args[2]}
+            if len(args) > 3:
+                command["account"] = args[3]
+        elif op == "terminate":
+            command = {"op": op, "password": args[0]}
+            if len(args) > 1:
+                command["account"] = args[1]
+        elif op == "reverse":
+            command = {"op": op, "transaction_id": args[0]}
+        elif op in ("archive", "compact"):
+            command = {"op": op, "days": args[0]}
+        elif op == "advance":
+            command = {"op": op, "days": args[0]}
+            if len(args) > 1:
+                command["seconds"] = args[1]
+        elif op in ("verify", "totals"):
+            command = {"op": op}
+        elif op in ("audit", "reconcile", "projections"):
+            command = {"op": op}
+            if args:
+                command["workers"] = args[0]
+        elif op in ("info", "history"):
+            command = {"op": op}
+            if args:
+                command["account"] = args[0]
+        else:
+            raise CommandError(f"Unknown command: {op}")
+    except IndexError:
+        raise CommandError(f"Missing arguments for {op}")
+    if key is not None:
+        command["key"] = key
+    return command
+
+
+def account_info(account):
+    """Machine-readable account information"""
+    return {
+        "account_number": account.get_account_number(),
+        "username": account.get_username(),
+        "account_type": account.get_account_type(),
+        "interest_rate": account.get_interest_rate(),
+        "balance": account.get_balance(),
+        "created_date": account.get_created_date().isoformat(),
+    }
+
+
+class CommandDriver:
+    """Runs parsed commands against a Bank without menus or prompts"""
+
+    def __init__(self, bank=None):
+        self.__bank = bank if bank is not None else Bank()
+        self.__selected = None
+        self.__messages = io.StringIO()  # Captured account/bank prints
+
+    def get_bank(self):
+        return self.__bank
+
+    def _resolve_account(self, command):
+        """Account named in command, or the selected account"""
+        if command.get("account") is None:
+            if self.__selected is None:
+                raise CommandError("No account selected.")
+            return self.__selected
+        account = self.__bank.get_account_by_number(int(command["account"]))
+        if account is None:
+            raise CommandError(f"Account not found: {command['account']}")
+        return account
+
+    def _last_message(self):
+        lines = [line for line in self.__messages.getvalue().splitlines() if line.strip()]
+        # Skip the trailing "[... Process Finished]" line
+        for line in reversed(lines):
+            if not line.endswith("Process Finished]"):
+                return line
+        return None
+
+    def execute(self, command):
+        """Execute one command dict and return a result dict"""
+        op = str(command.get("op", "")).lower()
+        self.__messages.seek(0)
+        self.__messages.truncate()
+        with redirect_stdout(self.__messages):
+            result = self._dispatch(op, command)
+        result.setdefault("ok", True)
+        if not result["ok"] and "error" not in result:
+            result["error"] = self._last_message()
+        return result
+
+    def _dispatch(self, op, command):
+        bank = self.__bank
+        if op == "create":
+            row = dict(command)
+            row.pop("key", None)
+            row["account_type"] = row.pop("type", "")
+            row = {k: str(v) for k, v in row.items() if v is not None}
+            try:
+                account = account_from_row(row)
+            except ValueError as e:
+                raise CommandError(str(e))
+            account = bank.create_account(account, command.get("key"))
+            self.__selected = account
+            return account_info(account)
+
+        if op == "advance":
+            clock = bank.get_clock()
+            if not isinstance(clock, SimulatedClock):
+                raise CommandError("advance requires a simulated clock.")
+            now = clock.advance(float(command.get("days", 0)), float(command.get("seconds", 0)))
+            return {"now": now.isoformat()}
+
+        if op == "archive":
+            if bank.get_archive() is None:
+                raise CommandError("archive requires a transaction archive (--archive).")
+            before = bank.get_clock().now() - timedelta(days=float(command["days"]))
+            return {"archived": bank.archive_transactions(before)}
+
+        if op == "compact":
+            before = bank.get_clock().now() - timedelta(days=float(command["days"]))
+            accounts, transactions = bank.compact_history(before)
+            return {"compacted_accounts": accounts, "compacted_transactions": transactions}
+
+        if op == "verify":
+            return bank.verify_ledger()
+
+        if op == "audit":
+            workers = command.get("workers")
+            return bank.audit_ledger(int(workers) if workers is not None else None)
+
+        if op == "reconcile":
+            workers = command.get("workers")
+            return bank.reconcile_balances(int(workers) if workers is not None else None)
+
+        if op == "projections":
+            workers = command.get("workers")
+            return {"mismatches": bank.verify_projections(int(workers) if workers is not None else None)}
+
+        if op == "totals":
+            with bank.snapshot() as snapshot:
+                return {
+                    "as_of": snapshot.get_created_date().isoformat(),
+                    "accounts": snapshot.get_account_count(),
+                    "total_balance": snapshot.get_total_balance(),
+                    "total_overdraft": snapshot.get_total_overdraft(),
+                    "transactions": snapshot.get_transaction_count(),
+                }
+
+        if op == "reverse":
+            try:
+                reversal = bank.reverse(int(command["transaction_id"]), command.get("key"))
+            except (InvalidAmountError, ContractValueError) as e:
+                raise CommandError(str(e))
+            return transaction_to_row(reversal)
+
+        if op == "select":
+            choice = str(command["account"])
+            if not choice.isdigit():
+                # Select by exact username (first match)
+                account = next(bank.find_accounts_by_username(choice, exact=True), None)
+                if account is None:
+                    raise CommandError(f"Account not found: {choice}")
+                self.__selected = account
+                return {"account_number": account.get_account_number()}
+            choice = int(choice)
+            account = bank.get_account_by_number(choice)
+            if account is None:
+                # Fall back to list number, as in the interactive menu
+                accounts = bank.get_all_accounts()
+                if not 1 <= choice <= len(accounts):
+                    raise CommandError(f"Account not found: {choice}")
+                account = accounts[choice - 1]
+            self.__selected = account
+            return {"account_number": account.get_account_number()}
+
+        account = self._resolve_account(command)
+        if op == "deposit":
+            ok = bank.deposit(account.get_account_number(), command["amount"], command.get("key"))
+            return {"ok": ok, "account_number": account.get_account_number(),
+                    "balance": account.get_balance()}
+        if op == "withdraw":
+            if isinstance(account, (SavingAccount, TimeDepositAccount)):
+                raise CommandError("Use terminate for contract accounts.")
+            ok = bank.withdraw(account.get_account_number(), command["amount"],
+                               str(command["password"]), command.get("key"))
+            return {"ok": ok, "account_number": account.get_account_number(),
+                    "balance": account.get_balance()}
+        if op == "transfer":
+            try:
+                transfer_id = bank.transfer(account.get_account_number(), int(command["to"]),
+                                            command["amount"], str(command["password"]),
+                                            command.get("key"))
+            except (InvalidPasswordError, InvalidAmountError, ContractValueError) as e:
+                raise CommandError(str(e))
+            return {"transfer_id": transfer_id, "account_number": account.get_account_number(),
+                    "balance": account.get_balance()}
+        if op == "terminate":
+            new_account = terminate_contract_account(account, bank, str(command["password"]),
+                                                     command.get("key"))
+            if new_account is None:
+                return {"ok": False, "account_number": account.get_account_number()}
+            self.__selected = new_account
+            return {"converted": True, **account_info(new_account)}
+        if op == "info":
+            return account_info(account)
+        if op == "history":
+            transactions = bank.get_transactions_by_account(account.get_account_number())
+            return {"account_number": account.get_account_number(),
+                    "transactions": [transaction_to_row(t) for t in transactions]}
+        raise CommandError(f"Unknown command: {op}")
+
+    def run(self, lines, out, tick_every=1000):
+        """Run every command line, writing one JSON result line each; returns (succeeded, failed)"""
+        clock = self.__bank.get_clock()
+        coarse = isinstance(clock, CoarseClock)
+        succeeded = failed = 0
+        for line_number, line in enumerate(lines, 1):
+            if coarse and line_number % tick_every == 0:
+                clock.tick()
+            command = None
+            try:
+                command = parse_command(line)
+                if command is None:
+                    continue
+                result = self.execute(command)
+            except (CommandError, IdempotencyConflictError, KeyError, ValueError, TypeError) as e:
+                message = e.message if isinstance(e, CommandError) else f"{type(e).__name__}: {e}"
+                result = {"ok": False, "error": message}
+            result = {"line": line_number, "op": command.get("op") if command else None, **result}
+            if result["ok"]:
+                succeeded += 1
+            else:
+                failed += 1
+            out.write(json.dumps(result, ensure_ascii=False))
+            out.write("\n")
+        return succeeded, failed
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Run bank commands without prompts", epilog=COMMAND_HELP,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("commands", nargs="?", default="-",
+                        help="command file (JSON lines or DSL); '-' reads stdin")
+    parser.add_argument("-o", "--output", default="-",
+                        help="result file (JSON lines); '-' writes stdout")
+    parser.add_argument("--clock", choices=["system", "coarse", "simulated"], default="system",
+                        help="coarse: cached time refreshed every --tick-every lines; "
+                             "simulated: time only moves with 'advance'")
+    parser.add_argument("--tick-every", type=int, default=1000)
+    parser.add_argument("--db", help="SQLite database file to load and save the bank (default: memory only)")
+    parser.add_argument("--archive", help="directory of archived transaction segments")
+    args = parser.parse_args(argv)
+
+    if args.clock == "coarse":
+        set_default_clock(CoarseClock())
+    elif args.clock == "simulated":
+        set_default_clock(SimulatedClock())
+
+    ledger_key = os.environ.get("BANK_LEDGER_KEY")
+    if not ledger_key:
+        print("BANK_LEDGER_KEY is not set: ledger checkpoints will be unsigned", file=sys.stderr)
+    bank = Bank(storage=SQLiteStorage(args.db) if args.db else None,
+                archive=TransactionArchive(args.archive) if args.archive else None,
+                ledger_key=ledger_key.encode("utf-8") if ledger_key else None)
+    source = sys.stdin if args.commands == "-" else open(args.commands, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        succeeded, failed = CommandDriver(bank).run(source, target, args.tick_every)
+    finally:
+        bank.close()
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"Commands succeeded: {succeeded}, failed: {failed}", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
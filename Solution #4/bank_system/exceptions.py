@@ -38,4 +38,14 @@ class ContractValueError(Exception):
         return f"Contract Error: {self.message}"
     
     def is_contract_related(self):
-        return True
\ No newline at end of file
+        return True
+
+
+class IdempotencyConflictError(Exception):
+    """Exception raised when an idempotency key is reused for a different request"""
+    def __init__(self, message="Idempotency key was already used for a different request"):
+        self.message = message
+        super().__init__(self.message)
+    
+    def __str__(self):
+        return f"Idempotency Error: {self.message}"
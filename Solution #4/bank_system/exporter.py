@@ -0,0 +1,101 @@
+"""
+File Name: exporter.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Streaming export of the bank transaction ledger to CSV / JSON Lines
+"""
+import csv
+import gzip
+import io
+import json
+from snapshots import BankSnapshot
+
+
+EXPORT_FIELDS = [
+    "transaction_id",
+    "account_number",
+    "username",
+    "account_type",
+    "transaction_type",
+    "amount",
+    "transaction_date",
+]
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+
+def iter_transactions(bank, account_number=None, username=None, transaction_type=None,
+                      start=None, end=None):
+    """Yield transactions matching the given filters (start inclusive, end exclusive)"""
+    # Bank applies the account, username and date filters through its indexes
+    for transaction in bank.iter_transactions(start, end, account_number, username):
+        if transaction_type is not None and transaction.get_transaction_type() != transaction_type:
+            continue
+        yield transaction
+
+
+def transaction_to_row(transaction):
+    """Convert transaction to a flat export row"""
+    return {
+        "transaction_id": transaction.get_transaction_id(),
+        "account_number": transaction.get_account_number(),
+        "username": transaction.get_username(),
+        "account_type": transaction.get_account_type(),
+        "transaction_type": transaction.get_transaction_type(),
+        "amount": transaction.get_amount(),
+        "transaction_date": transaction.get_transaction_date().isoformat(),
+    }
+
+
+def _open_output(path, compress):
+    """Open export target as a text stream"""
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def write_transactions(transactions, stream, fmt="csv", chunk_size=10000):
+    """Write transactions to an open text stream chunk_size rows at a time; returns rows written"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    buffer = io.StringIO()
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+
+    count = 0
+    pending = 0
+    for transaction in transactions:
+        row = transaction_to_row(transaction)
+        if writer:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+        count += 1
+        pending += 1
+        if pending >= chunk_size:
+            stream.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    stream.write(buffer.getvalue())
+    return count
+
+
+def export_transactions(bank, path, fmt="csv", compress=False, chunk_size=10000, **filters):
+    """Export bank transactions from one snapshot to a CSV or JSONL file; returns rows written"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    snapshot = bank if isinstance(bank, BankSnapshot) else bank.snapshot()
+    try:
+        with _open_output(path, compress) as stream:
+            return write_transactions(iter_transactions(snapshot, **filters), stream, fmt, chunk_size)
+    finally:
+        if snapshot is not bank:
+            snapshot.close()
@@ -0,0 +1,97 @@
+"""
+File Name: idempotency.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Bounded LRU cache with TTL for idempotency keys of posting operations
+"""
+import hashlib
+from collections import OrderedDict
+from datetime import timedelta
+from clock import get_default_clock
+from exceptions import IdempotencyConflictError
+
+
+def request_fingerprint(*parts):
+    """Stable digest of an operation and its arguments"""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class IdempotencyCache:
+    """Maps idempotency key -> (stored time, request fingerprint, result), LRU and TTL bounded"""
+
+    def __init__(self, max_entries=100000, ttl_seconds=24 * 60 * 60, clock=None):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.__entries = OrderedDict()
+        self.__max_entries = max_entries
+        self.__ttl = timedelta(seconds=ttl_seconds)
+        self.__clock = clock if clock is not None else get_default_clock()
+        self.__hits = 0
+        self.__evictions = 0
+        self.__evicted = []  # keys dropped since the last drain_evicted()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def _expired(self, stored_at, now):
+        return now - stored_at > self.__ttl
+
+    def lookup(self, key, fingerprint):
+        """Return (True, result) for a live key, (False, None) otherwise"""
+        entry = self.__entries.get(key)
+        if entry is None:
+            return False, None
+        stored_at, stored_fingerprint, result = entry
+        if self._expired(stored_at, self.__clock.now()):
+            del self.__entries[key]
+            self.__evicted.append(key)
+            return False, None
+        if stored_fingerprint != fingerprint:
+            raise IdempotencyConflictError()
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return True, result
+
+    def store(self, key, fingerprint, result, stored_at=None):
+        """Remember result for key; returns the stored (key, stored_at, fingerprint, result) entry"""
+        now = self.__clock.now()
+        stored_at = stored_at if stored_at is not None else now
+        self.__entries[key] = (stored_at, fingerprint, result)
+        self.__entries.move_to_end(key)
+
+        # Drop expired entries at the cold end, then enforce the size cap
+        entries = self.__entries
+        while entries:
+            oldest_key, (oldest_at, _, _) = next(iter(entries.items()))
+            if not self._expired(oldest_at, now):
+                break
+            del entries[oldest_key]
+            self.__evicted.append(oldest_key)
+            self.__evictions += 1
+        while len(entries) > self.__max_entries:
+            self.__evicted.append(entries.popitem(last=False)[0])
+            self.__evictions += 1
+        return key, stored_at, fingerprint, result
+
+    def drain_evicted(self):
+        """Keys evicted since the last call (so a store can delete them too)"""
+        evicted, self.__evicted = self.__evicted, []
+        return evicted
+
+    def export_entries(self):
+        """Yield (key, stored_at, fingerprint, result) from least to most recently used"""
+        for key, (stored_at, fingerprint, result) in self.__entries.items():
+            yield key, stored_at, fingerprint, result
+
+    def load_entries(self, entries):
+        """Restore entries produced by export_entries()"""
+        for key, stored_at, fingerprint, result in entries:
+            self.store(key, fingerprint, result, stored_at)
+
+    def get_stats(self):
+        return {
+            "entries": len(self.__entries),
+            "max_entries": self.__max_entries,
+            "hits": self.__hits,
+            "evictions": self.__evictions,
+        }
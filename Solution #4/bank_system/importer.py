@@ -0,0 +1,153 @@
+"""
+File Name: importer.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Bulk account import from CSV files
+"""
+import csv
+from accounts.base import BankAccount
+from accounts.types import SavingAccount, TimeDepositAccount, OverdraftAccount
+from exceptions import InvalidAmountError
+from money import to_minor
+
+
+IMPORT_FIELDS = [
+    "account_type",
+    "username",
+    "password",
+    "interest_rate",
+    "opening_balance",
+    "monthly_amount",
+    "contract_months",
+    "deposit_period",
+    "overdraft_limit",
+]
+
+# Accepted spellings of account type column (case-insensitive)
+ACCOUNT_TYPE_ALIASES = {
+    "normal": BankAccount,
+    "bankaccount": BankAccount,
+    "normalaccount": BankAccount,
+    "saving": SavingAccount,
+    "savingaccount": SavingAccount,
+    "timedeposit": TimeDepositAccount,
+    "timedepositaccount": TimeDepositAccount,
+    "overdraft": OverdraftAccount,
+    "overdraftaccount": OverdraftAccount,
+}
+
+
+class ImportResult:
+    """Outcome of a bulk account import"""
+
+    def __init__(self):
+        self.__accounts = []
+        self.__rejected = []  # (line number, reason)
+
+    def add_account(self, account):
+        self.__accounts.append(account)
+
+    def reject(self, line_number, reason):
+        self.__rejected.append((line_number, reason))
+
+    # Getter methods
+    def get_accounts(self):
+        return self.__accounts
+
+    def get_rejected_rows(self):
+        return self.__rejected
+
+    def get_loaded_count(self):
+        return len(self.__accounts)
+
+    def get_rejected_count(self):
+        return len(self.__rejected)
+
+    def show_import_info(self):
+        """Display import summary"""
+        print(f"Accounts loaded: {self.get_loaded_count()}")
+        print(f"Rows rejected: {self.get_rejected_count()}")
+        for line_number, reason in self.__rejected:
+            print(f"   Line {line_number}: {reason}")
+
+
+def _required(row, field):
+    value = (row.get(field) or "").strip()
+    if not value:
+        raise ValueError(f"Missing {field}")
+    return value
+
+
+def _optional_int(row, field, default):
+    value = (row.get(field) or "").strip()
+    return int(value) if value else default
+
+
+def _optional_money(row, field, default):
+    value = (row.get(field) or "").strip()
+    if not value:
+        return default
+    try:
+        return to_minor(value)
+    except InvalidAmountError as e:
+        raise ValueError(e.message)
+
+
+def account_from_row(row):
+    """Build an account object from one CSV row"""
+    type_name = _required(row, "account_type").replace(" ", "").lower()
+    account_class = ACCOUNT_TYPE_ALIASES.get(type_name)
+    if account_class is None:
+        raise ValueError(f"Unknown account type: {row.get('account_type')}")
+
+    username = _required(row, "username")
+    password = _required(row, "password")
+    interest_rate = float(_required(row, "interest_rate"))
+    opening_balance = _optional_money(row, "opening_balance", 0)
+
+    if account_class is SavingAccount:
+        monthly = _optional_money(row, "monthly_amount", 0)
+        months = int(_required(row, "contract_months"))
+        if monthly <= 0 or months <= 0:
+            raise ValueError("Monthly amount and contract months must be greater than 0")
+        account = SavingAccount(username, password, interest_rate, monthly, months)
+    elif account_class is TimeDepositAccount:
+        period = _optional_int(row, "deposit_period", 365)
+        if period <= 0:
+            raise ValueError("Deposit period must be greater than 0")
+        account = TimeDepositAccount(username, password, interest_rate, period)
+    elif account_class is OverdraftAccount:
+        limit = _optional_money(row, "overdraft_limit", 500000)
+        if limit < 0:
+            raise ValueError("Overdraft limit must not be negative")
+        if opening_balance < -limit:
+            raise ValueError(f"Opening balance exceeds overdraft limit ({limit})")
+        account = OverdraftAccount(username, password, interest_rate, limit)
+    else:
+        account = BankAccount(username, password, interest_rate)
+
+    if opening_balance < 0 and account_class is not OverdraftAccount:
+        raise ValueError("Opening balance must not be negative")
+    if opening_balance:
+        account.set_opening_balance(opening_balance)
+    return account
+
+
+def import_accounts(bank, rows):
+    """Import accounts from an iterable of dict rows; returns ImportResult"""
+    result = ImportResult()
+    # Header is line 1, so data rows start at line 2
+    for line_number, row in enumerate(rows, 2):
+        try:
+            result.add_account(account_from_row(row))
+        except ValueError as e:
+            result.reject(line_number, str(e))
+
+    bank.add_accounts(result.get_accounts())
+    return result
+
+
+def import_accounts_csv(bank, path):
+    """Import accounts from a CSV file with IMPORT_FIELDS columns"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return import_accounts(bank, csv.DictReader(f))
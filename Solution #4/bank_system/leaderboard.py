@@ -0,0 +1,120 @@
+"""
+File Name: leaderboard.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Top-N structures for account balances and account activity
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+
+
+class BalanceLeaderboard:
+    """Largest and smallest balances kept in two lazily invalidated heaps"""
+
+    def __init__(self):
+        self.__max_heap = []  # (-balance, account number, version)
+        self.__min_heap = []  # (balance, account number, version)
+        self.__versions = {}  # account number -> current version
+        self.__balances = {}  # account number -> current balance
+        self.__next_version = 0
+
+    def __len__(self):
+        return len(self.__balances)
+
+    def _push(self, account_number, balance):
+        version = self.__next_version
+        self.__next_version += 1
+        self.__versions[account_number] = version
+        self.__balances[account_number] = balance
+        return version
+
+    def update(self, account_number, balance):
+        """Record new balance for account"""
+        if self.__balances.get(account_number) == balance and account_number in self.__versions:
+            return
+        version = self._push(account_number, balance)
+        heapq.heappush(self.__max_heap, (-balance, account_number, version))
+        heapq.heappush(self.__min_heap, (balance, account_number, version))
+        self._compact_if_stale()
+
+    def update_many(self, items):
+        """Record many (account number, balance) pairs, heapifying once"""
+        for account_number, balance in items:
+            version = self._push(account_number, balance)
+            self.__max_heap.append((-balance, account_number, version))
+            self.__min_heap.append((balance, account_number, version))
+        heapq.heapify(self.__max_heap)
+        heapq.heapify(self.__min_heap)
+        self._compact_if_stale()
+
+    def remove(self, account_number):
+        """Forget account (its heap entries become stale)"""
+        self.__versions.pop(account_number, None)
+        self.__balances.pop(account_number, None)
+
+    def _compact_if_stale(self):
+        live = len(self.__balances)
+        if len(self.__max_heap) > 2 * live + 64:
+            self.__max_heap = [(-b, n, self.__versions[n]) for n, b in self.__balances.items()]
+            self.__min_heap = [(b, n, self.__versions[n]) for n, b in self.__balances.items()]
+            heapq.heapify(self.__max_heap)
+            heapq.heapify(self.__min_heap)
+
+    def _top(self, heap, n, keep):
+        """Pop up to n live entries accepted by keep(entry), then restore them"""
+        versions = self.__versions
+        taken = []
+        while heap and len(taken) < n:
+            entry = heapq.heappop(heap)
+            if versions.get(entry[1]) != entry[2]:
+                continue  # stale entry, drop it for good
+            taken.append(entry)
+            if not keep(entry):
+                break
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [entry for entry in taken if keep(entry)]
+
+    def largest(self, n):
+        """[(account number, balance)] with the largest balances"""
+        entries = self._top(self.__max_heap, n, lambda entry: True)
+        return [(number, -negative) for negative, number, _ in entries]
+
+    def smallest(self, n, below=None):
+        """[(account number, balance)] with the smallest balances (optionally < below)"""
+        if below is None:
+            keep = lambda entry: True
+        else:
+            keep = lambda entry: entry[0] < below
+        entries = self._top(self.__min_heap, n, keep)
+        return [(number, balance) for balance, number, _ in entries]
+
+
+class ActivityCounter:
+    """Per-day transaction counts per account for "most active" queries"""
+
+    def __init__(self):
+        self.__days = []  # sorted dates
+        self.__counts = {}  # date -> Counter(account number -> transactions)
+
+    def add(self, day, account_number, count=1):
+        counts = self.__counts.get(day)
+        if counts is None:
+            counts = self.__counts[day] = Counter()
+            if not self.__days or day > self.__days[-1]:
+                self.__days.append(day)
+            else:
+                insort(self.__days, day)
+        counts[account_number] += count
+
+    def most_active(self, n, start_day=None, end_day=None):
+        """[(account number, count)] for start_day <= day <= end_day"""
+        lo = 0 if start_day is None else bisect_left(self.__days, start_day)
+        hi = len(self.__days) if end_day is None else bisect_right(self.__days, end_day)
+        if hi - lo == 1:
+            return self.__counts[self.__days[lo]].most_common(n)
+        totals = Counter()
+        for day in self.__days[lo:hi]:
+            totals.update(self.__counts[day])
+        return heapq.nlargest(n, totals.items(), key=lambda item: item[1])
@@ -0,0 +1,220 @@
+"""
+File Name: ledger_chain.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Hash chain over the transaction ledger with HMAC-signed checkpoints
+"""
+import hashlib
+import hmac
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+GENESIS_HASH = bytes(32)
+# Stands in for a record that is neither stored nor pruned, so its segment fails to verify
+MISSING_DIGEST = b"missing"
+
+
+def transaction_fields(transaction):
+    """Plain tuple of every stored transaction field (picklable, hashed by encode_fields)"""
+    return (transaction.get_transaction_id(), transaction.get_account_number(), transaction.get_username(),
+            transaction.get_account_type(), transaction.get_amount(), transaction.get_transaction_type(),
+            transaction.get_transaction_date().isoformat(), transaction.get_details())
+
+
+def encode_fields(fields):
+    """Canonical bytes of a transaction; identical after storage and archive round trips"""
+    details = fields[-1]
+    if details is None:
+        return repr(fields[:-1]).encode("utf-8")
+    return (repr(fields[:-1]) + json.dumps(details, sort_keys=True, separators=(",", ":"),
+                                          default=str)).encode("utf-8")
+
+
+def record_digest(fields):
+    return hashlib.sha256(encode_fields(fields)).digest()
+
+
+def chain_hash(previous_hash, digest):
+    """Hash of the chain after appending a record with this digest"""
+    return hashlib.sha256(previous_hash + digest).digest()
+
+
+def _signature(key, position, head_hash):
+    return hmac.new(key, position.to_bytes(8, "big") + head_hash, hashlib.sha256).digest()
+
+
+def verify_segment(start_hash, expected_hash, records, pruned):
+    """Recompute the chain over one segment; returns (hash, matches expected_hash)"""
+    head = start_hash
+    sha256 = hashlib.sha256
+    for index, fields in enumerate(records):
+        digest = pruned[index] if fields is None else sha256(encode_fields(fields)).digest()
+        head = sha256(head + digest).digest()
+    return head, hmac.compare_digest(head, expected_hash)
+
+
+class ChainCheckpoint:
+    """Chain head after the first `position` ledger records (signature is None without a key)"""
+
+    def __init__(self, position, head_hash, signature, created_date=None):
+        self.__position = position
+        self.__head_hash = head_hash
+        self.__signature = signature
+        self.__created_date = created_date
+
+    def get_position(self):
+        return self.__position
+
+    def get_head_hash(self):
+        return self.__head_hash
+
+    def get_signature(self):
+        return self.__signature
+
+    def get_created_date(self):
+        return self.__created_date
+
+    def to_dict(self):
+        return {
+            "position": self.__position,
+            "hash": self.__head_hash.hex(),
+            "signature": None if self.__signature is None else self.__signature.hex(),
+            "created_date": self.__created_date,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        signature = data.get("signature")
+        return cls(data["position"], bytes.fromhex(data["hash"]),
+                   None if signature is None else bytes.fromhex(signature), data.get("created_date"))
+
+
+class LedgerChain:
+    """Running hash chain over ledger records in posting order with periodic signed checkpoints"""
+
+    def __init__(self, key=None, interval=1000):
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        self.__key = key
+        self.__interval = interval
+        self.__head = GENESIS_HASH
+        self.__length = 0
+        self.__checkpoints = []
+        self.__pruned = {}  # ledger position -> digest of a compacted record
+
+    def __len__(self):
+        return self.__length
+
+    def append(self, transaction, created_date=None):
+        """Chain the next record; returns a new ChainCheckpoint when one is due, else None"""
+        return self.append_digest(record_digest(transaction_fields(transaction)), created_date)
+
+    def append_digest(self, digest, created_date=None):
+        self.__head = chain_hash(self.__head, digest)
+        self.__length += 1
+        if self.__length % self.__interval == 0:
+            return self.seal(created_date)
+        return None
+
+    def seal(self, created_date=None):
+        """Sign the current head (None if the last checkpoint already covers it)"""
+        if self.__checkpoints and self.__checkpoints[-1].get_position() == self.__length:
+            return None
+        checkpoint = ChainCheckpoint(self.__length, self.__head, self.sign(self.__length, self.__head),
+                                     created_date)
+        self.__checkpoints.append(checkpoint)
+        return checkpoint
+
+    def sign(self, position, head_hash):
+        """HMAC of a chain head, or None without a key"""
+        return None if self.__key is None else _signature(self.__key, position, head_hash)
+
+    def restore(self, checkpoints, pruned):
+        """Resume from stored checkpoints and pruned digests (signatures are checked on verify)"""
+        checkpoints = sorted(checkpoints, key=lambda cp: cp.get_position())
+        self.__checkpoints = checkpoints
+        self.__pruned = dict(pruned)
+        if checkpoints:
+            self.__head = checkpoints[-1].get_head_hash()
+            self.__length = checkpoints[-1].get_position()
+
+    def prune(self, position, transaction):
+        """Keep the digest of a record that is about to be compacted; returns it"""
+        digest = record_digest(transaction_fields(transaction))
+        self.__pruned[position] = digest
+        return digest
+
+    def get_pruned_digest(self, position):
+        return self.__pruned.get(position)
+
+    def is_keyed(self):
+        """True if checkpoints are signed with a secret key"""
+        return self.__key is not None
+
+    def is_signed(self, checkpoint):
+        """True if checkpoint carries a valid signature under this chain's key"""
+        if self.__key is None or checkpoint.get_signature() is None:
+            return False
+        expected = _signature(self.__key, checkpoint.get_position(), checkpoint.get_head_hash())
+        return hmac.compare_digest(expected, checkpoint.get_signature())
+
+    def is_trusted(self, checkpoint):
+        """Signed checkpoints must verify; without a key only the hashes can be checked"""
+        return self.is_signed(checkpoint) if self.__key is not None else True
+
+    # Getter methods
+    def get_head(self):
+        return self.__head
+
+    def get_checkpoints(self):
+        return list(self.__checkpoints)
+
+    def get_last_checkpoint(self):
+        return self.__checkpoints[-1] if self.__checkpoints else None
+
+    def get_interval(self):
+        return self.__interval
+
+    def segments(self, start_index=0):
+        """(start position, end position, start hash, expected hash) from checkpoint start_index on"""
+        bounds = [(0, GENESIS_HASH)] + [(cp.get_position(), cp.get_head_hash()) for cp in self.__checkpoints]
+        bounds.append((self.__length, self.__head))
+        result = []
+        for (start, start_hash), (end, end_hash) in zip(bounds[start_index:], bounds[start_index + 1:]):
+            if end > start:
+                result.append((start, end, start_hash, end_hash))
+        return result
+
+
+def verify_segments(segments, load_records, workers=1):
+    """Recompute each segment's chain; returns [(start, end)] of segments that do not match"""
+    failures = []
+    if workers <= 1 or len(segments) <= 1:
+        for start, end, start_hash, expected_hash in segments:
+            if not verify_segment(start_hash, expected_hash, *load_records(start, end))[1]:
+                failures.append((start, end))
+        return failures
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for start, end, start_hash, expected_hash in segments:
+            if len(in_flight) >= 2 * workers:
+                _collect(in_flight.popleft(), failures)
+            in_flight.append((start, end, executor.submit(verify_segment, start_hash, expected_hash,
+                                                          *load_records(start, end))))
+        while in_flight:
+            _collect(in_flight.popleft(), failures)
+    return failures
+
+
+def _collect(entry, failures):
+    start, end, future = entry
+    if not future.result()[1]:
+        failures.append((start, end))
+
+
+def default_workers():
+    return os.cpu_count() or 1
@@ -0,0 +1,77 @@
+"""
+File Name: ledger_columns.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Column-oriented copy of the transaction ledger for scans and aggregates
+"""
+from array import array
+
+
+class _Dictionary:
+    """Maps repeated strings to small integer codes"""
+
+    def __init__(self):
+        self.__codes = {}
+        self.__values = []
+
+    def encode(self, value):
+        code = self.__codes.get(value)
+        if code is None:
+            code = self.__codes[value] = len(self.__values)
+            self.__values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.__values)
+
+    def lookup(self, value):
+        """Code for value, or None if it never occurred"""
+        return self.__codes.get(value)
+
+    def decode(self, code):
+        return self.__values[code]
+
+
+class LedgerColumns:
+    """One typed array per transaction field, indexed by ledger position"""
+
+    def __init__(self):
+        self.account_numbers = array("q")
+        self.amounts = array("q")
+        self.username_codes = array("l")
+        self.type_codes = array("l")
+        self.account_type_codes = array("l")
+        self.usernames = _Dictionary()
+        self.transaction_types = _Dictionary()
+        self.account_types = _Dictionary()
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def append(self, transaction):
+        """Append one transaction's fields"""
+        self.account_numbers.append(transaction.get_account_number())
+        self.amounts.append(transaction.get_amount())
+        self.username_codes.append(self.usernames.encode(transaction.get_username()))
+        self.type_codes.append(self.transaction_types.encode(transaction.get_transaction_type()))
+        self.account_type_codes.append(self.account_types.encode(transaction.get_account_type()))
+
+    def append_placeholder(self):
+        """Append an empty row for a position whose transaction is gone"""
+        self.account_numbers.append(0)
+        self.amounts.append(0)
+        self.username_codes.append(self.usernames.encode(""))
+        self.type_codes.append(self.transaction_types.encode(""))
+        self.account_type_codes.append(self.account_types.encode(""))
+
+    def clear_rows(self, positions):
+        """Turn rows of compacted transactions into placeholder rows"""
+        empty_username = self.usernames.encode("")
+        empty_type = self.transaction_types.encode("")
+        empty_account_type = self.account_types.encode("")
+        for p in positions:
+            self.account_numbers[p] = 0
+            self.amounts[p] = 0
+            self.username_codes[p] = empty_username
+            self.type_codes[p] = empty_type
+            self.account_type_codes[p] = empty_account_type
@@ -4,6 +4,7 @@ Created Date: 2025-07-19
 Programmer: Kwanju Eun
 Description: Main entry point for the bank system application
 """
+import sys
 from bank import Bank
 from accounts.types import SavingAccount, TimeDepositAccount
 from ui_helpers import (
@@ -104,4 +105,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Non-interactive mode: python main.py <command file | -> [-o results]
+        from command_driver import main as run_commands
+        sys.exit(run_commands(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+File Name: money.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Fixed-point money helpers (int64 minor units)
+"""
+from array import array
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from exceptions import InvalidAmountError
+
+
+# Korean won has no minor unit, so one minor unit is one won
+MINOR_UNITS_PER_UNIT = 1
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+def to_minor(amount):
+    """Convert int, Decimal, str or integral float to int64 minor units"""
+    if type(amount) is int:
+        value = amount * MINOR_UNITS_PER_UNIT
+    elif isinstance(amount, bool):
+        raise InvalidAmountError("Amount must be a number.")
+    else:
+        try:
+            scaled = Decimal(str(amount).strip()) * MINOR_UNITS_PER_UNIT
+        except (InvalidOperation, ValueError):
+            raise InvalidAmountError(f"Invalid amount: {amount}")
+        if not scaled.is_finite() or scaled != scaled.to_integral_value():
+            raise InvalidAmountError(f"Amount must be a whole number of minor units: {amount}")
+        value = int(scaled)
+    return check_minor(value)
+
+
+def check_minor(value):
+    """Validate that value is an int64 minor-unit amount and return it"""
+    if type(value) is not int:
+        raise InvalidAmountError(f"Amount must be an integer number of minor units: {value!r}")
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise InvalidAmountError("Amount out of range.")
+    return value
+
+
+def round_half_even(value):
+    """Round a Fraction to the nearest int, ties to even"""
+    return round(value)
+
+
+def interest_amount(principal, rate, period=Fraction(1), rate_factor=Fraction(1)):
+    """Interest in minor units: principal * rate * rate_factor * period, rounded half to even"""
+    exact = Fraction(principal) * Fraction(str(rate)) * Fraction(rate_factor) * Fraction(period)
+    return check_minor(round_half_even(exact))
+
+
+def format_money(minor):
+    """Format minor units for display"""
+    if MINOR_UNITS_PER_UNIT == 1:
+        return str(minor)
+    units, cents = divmod(abs(minor), MINOR_UNITS_PER_UNIT)
+    digits = len(str(MINOR_UNITS_PER_UNIT)) - 1
+    sign = "-" if minor < 0 else ""
+    return f"{sign}{units}.{cents:0{digits}d}"
+
+
+def pack(amounts):
+    """Pack minor-unit amounts into a typed int64 array"""
+    return array("q", amounts)
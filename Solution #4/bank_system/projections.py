@@ -0,0 +1,337 @@
+"""
+File Name: projections.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Account state and read models rebuilt from the ledger and the account event stream
+"""
+import os
+from array import array
+from datetime import datetime
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from transaction import TRANSACTION_SIGNS
+from reconcile import InlineExecutor, partition_of
+
+
+ACCOUNT_OPENED = "Account Opened"
+ACCOUNT_CLOSED = "Account Closed"
+CONTRACT_TERMINATION = "Contract Termination"
+CONTRACT_ACCOUNT_TYPES = ("SavingAccount", "TimeDepositAccount")
+
+# Slots of a partial account state while folding (a list, updated in place)
+_COUNT, _NET, _DEPOSITED, _LAST, _ACCOUNT_TYPE, _TERMINATION = range(6)
+
+
+def _new_partial():
+    return [0, 0, 0, None, None, None]
+
+
+class AccountEvent:
+    """Account lifecycle event ("Account Opened" or "Account Closed"), kept apart from the ledger"""
+
+    def __init__(self, event_type, account_number, username, account_type, amount, event_date, details=None):
+        self.__event_type = event_type
+        self.__account_number = account_number
+        self.__username = username
+        self.__account_type = account_type
+        self.__amount = amount
+        self.__event_date = event_date
+        self.__details = details  # account settings of an opening (BankAccount._opening_details())
+
+    # Getter methods
+    def get_event_type(self):
+        return self.__event_type
+
+    def get_account_number(self):
+        return self.__account_number
+
+    def get_username(self):
+        return self.__username
+
+    def get_account_type(self):
+        return self.__account_type
+
+    def get_amount(self):
+        return self.__amount
+
+    def get_event_date(self):
+        return self.__event_date
+
+    def get_details(self):
+        return self.__details
+
+    def to_dict(self):
+        return {
+            "event_type": self.__event_type,
+            "account_number": self.__account_number,
+            "username": self.__username,
+            "account_type": self.__account_type,
+            "amount": self.__amount,
+            "event_date": self.__event_date.isoformat(),
+            "details": self.__details,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["event_type"], data["account_number"], data["username"], data["account_type"],
+                   data["amount"], datetime.fromisoformat(data["event_date"]), data.get("details"))
+
+
+def fold_chunk(first_position, account_bytes, amount_bytes, type_bytes, account_type_bytes,
+               type_names, account_type_names, partitions):
+    """Map step: fold one chunk of ledger columns into partial account states per partition"""
+    account_numbers = array("q")
+    account_numbers.frombytes(account_bytes)
+    amounts = array("q")
+    amounts.frombytes(amount_bytes)
+    type_codes = array("l")
+    type_codes.frombytes(type_bytes)
+    account_type_codes = array("l")
+    account_type_codes.frombytes(account_type_bytes)
+
+    signs = [TRANSACTION_SIGNS.get(name, 0) for name in type_names]
+    termination_code = type_names.index(CONTRACT_TERMINATION) if CONTRACT_TERMINATION in type_names else -1
+    deposit_code = type_names.index("Deposit") if "Deposit" in type_names else -1
+    contract_codes = {code for code, name in enumerate(account_type_names) if name in CONTRACT_ACCOUNT_TYPES}
+
+    states = {}
+    position = first_position
+    for account_number, amount, type_code, account_type_code in zip(account_numbers, amounts, type_codes,
+                                                                    account_type_codes):
+        if type_names[type_code]:  # "" marks the placeholder row of a compacted entry
+            state = states.get(account_number)
+            if state is None:
+                state = states[account_number] = _new_partial()
+            state[_COUNT] += 1
+            state[_NET] += signs[type_code] * amount
+            if type_code == deposit_code and account_type_code in contract_codes:
+                state[_DEPOSITED] += amount
+            if type_code == termination_code:
+                state[_TERMINATION] = position
+            state[_LAST] = position
+            state[_ACCOUNT_TYPE] = account_type_names[account_type_code]
+        position += 1
+
+    result = [{} for _ in range(partitions)]
+    for account_number, state in states.items():
+        result[partition_of(account_number, partitions)][account_number] = state
+    return result
+
+
+def merge_partition(partials):
+    """Reduce step: combine one partition's partial states, given in ledger order"""
+    merged = {}
+    for partial in partials:
+        for account_number, state in partial.items():
+            total = merged.get(account_number)
+            if total is None:
+                merged[account_number] = list(state)
+                continue
+            total[_COUNT] += state[_COUNT]
+            total[_NET] += state[_NET]
+            total[_DEPOSITED] += state[_DEPOSITED]
+            for slot in (_LAST, _ACCOUNT_TYPE, _TERMINATION):
+                if state[slot] is not None:
+                    total[slot] = state[slot]
+    return merged
+
+
+class AccountState:
+    """Account state as rebuilt from the ledger (read-only)"""
+
+    def __init__(self, account_number, username, account_type, opening_balance, balance, transaction_count,
+                 is_terminated=False, is_matured=False, total_deposited=None, is_closed=False,
+                 created_date=None, last_transaction_id=None):
+        self.__account_number = account_number
+        self.__username = username
+        self.__account_type = account_type
+        self.__opening_balance = opening_balance
+        self.__balance = balance
+        self.__transaction_count = transaction_count
+        self.__is_terminated = is_terminated
+        self.__is_matured = is_matured
+        self.__total_deposited = total_deposited  # None unless a contract account
+        self.__is_closed = is_closed
+        self.__created_date = created_date
+        self.__last_transaction_id = last_transaction_id
+
+    # Getter methods
+    def get_account_number(self):
+        return self.__account_number
+
+    def get_username(self):
+        return self.__username
+
+    def get_account_type(self):
+        return self.__account_type
+
+    def get_opening_balance(self):
+        return self.__opening_balance
+
+    def get_balance(self):
+        return self.__balance
+
+    def get_transaction_count(self):
+        return self.__transaction_count
+
+    def is_terminated(self):
+        return self.__is_terminated
+
+    def is_matured(self):
+        return self.__is_matured
+
+    def get_total_deposited(self):
+        return self.__total_deposited
+
+    def is_closed(self):
+        return self.__is_closed
+
+    def get_created_date(self):
+        return self.__created_date
+
+    def get_last_transaction_id(self):
+        return self.__last_transaction_id
+
+    def get_fields(self):
+        """Same keys as BankAccount._projected_fields() of a live account"""
+        return {
+            "account_type": self.__account_type,
+            "balance": self.__balance,
+            "is_terminated": self.__is_terminated,
+            "is_matured": self.__is_matured,
+            "total_deposited": self.__total_deposited,
+        }
+
+
+def build_account_state(account_number, partial, records, checkpoint=None, opened=None, closed=False):
+    """Finish one account from its merged partial state"""
+    count, net, deposited, last, account_type, terminated_at = partial
+    termination = records.get(terminated_at)
+    last_record = records.get(last)
+
+    if opened is not None:
+        username = opened.get_username()
+        opening_balance = opened.get_amount()
+        created_date = opened.get_event_date()
+        if account_type is None:  # no entries left in the ledger
+            account_type = opened.get_account_type()
+    else:  # account opened before account events were recorded
+        username = last_record.get_username() if last_record is not None else None
+        opening_balance = 0
+        created_date = None
+
+    if checkpoint is not None:
+        balance = checkpoint.get_balance() + net
+        count += checkpoint.get_transaction_count()
+        deposits = checkpoint.get_type_totals().get("Deposit", (0, 0))[1]
+    else:
+        balance = opening_balance + net
+        deposits = 0
+
+    # A compacted termination is remembered by the checkpoint
+    details = None
+    if termination is not None:
+        details = termination.get_details() or {}
+    elif checkpoint is not None:
+        details = checkpoint.get_termination()
+
+    is_terminated = is_matured = False
+    if details is not None:
+        if details.get("converted"):
+            account_type = "BankAccount"  # settled and replaced by a normal account
+        else:
+            is_terminated = details.get("outcome") == "terminated"
+            is_matured = details.get("outcome") == "matured"
+
+    total_deposited = None
+    if account_type in CONTRACT_ACCOUNT_TYPES:
+        total_deposited = opening_balance + deposited + (deposits if checkpoint is not None else 0)
+
+    return AccountState(account_number, username, account_type, opening_balance, balance, count,
+                        is_terminated, is_matured, total_deposited, closed,
+                        created_date, None if last is None else last + 1)
+
+
+class UserTotals:
+    """Read model: open accounts and total balance per username"""
+
+    def __init__(self):
+        self.__totals = {}  # username -> [accounts, balance]
+
+    def add(self, state):
+        if state.is_closed():
+            return
+        totals = self.__totals.setdefault(state.get_username(), [0, 0])
+        totals[0] += 1
+        totals[1] += state.get_balance()
+
+    def get_result(self):
+        """{username: {"accounts": count, "balance": total}}"""
+        return {username: {"accounts": count, "balance": balance}
+                for username, (count, balance) in self.__totals.items()}
+
+
+def project_ledger(columns, read_records, checkpoints=None, events=(), read_models=(), workers=None,
+                   partitions=None, chunk_size=200000):
+    """Rebuild every account's state from the ledger columns and account events"""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    partitions = partitions if partitions is not None else max(1, workers * 2)
+    checkpoints = checkpoints or {}
+    type_names = [columns.transaction_types.decode(code) for code in range(len(columns.transaction_types))]
+    account_type_names = [columns.account_types.decode(code) for code in range(len(columns.account_types))]
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else InlineExecutor()
+    with executor:
+        chunks = []
+        for start in range(0, len(columns), chunk_size):
+            stop = start + chunk_size
+            chunks.append(executor.submit(fold_chunk, start,
+                                          columns.account_numbers[start:stop].tobytes(),
+                                          columns.amounts[start:stop].tobytes(),
+                                          columns.type_codes[start:stop].tobytes(),
+                                          columns.account_type_codes[start:stop].tobytes(),
+                                          type_names, account_type_names, partitions))
+        per_partition = [[] for _ in range(partitions)]
+        for future in chunks:
+            for partition, partial in enumerate(future.result()):
+                if partial:
+                    per_partition[partition].append(partial)
+        merges = [executor.submit(merge_partition, partials) for partials in per_partition]
+        merged = {}
+        for future in merges:
+            merged.update(future.result())
+
+    # Accounts whose every entry was compacted exist only as checkpoints, and
+    # accounts without any entry only as events
+    opened = {}
+    closed = set()
+    for event in events:
+        if event.get_event_type() == ACCOUNT_OPENED:
+            opened[event.get_account_number()] = event
+        elif event.get_event_type() == ACCOUNT_CLOSED:
+            closed.add(event.get_account_number())
+    for account_number in chain(checkpoints, opened):
+        if account_number not in merged:
+            merged[account_number] = _new_partial()
+
+    positions = set()
+    for account_number, partial in merged.items():
+        if partial[_TERMINATION] is not None:
+            positions.add(partial[_TERMINATION])
+        if account_number not in opened and partial[_LAST] is not None:
+            positions.add(partial[_LAST])  # username of an account opened before account events
+    positions = sorted(positions)
+    records = dict(zip(positions, read_records(positions)))
+
+    states = {}
+    for account_number, partial in merged.items():
+        state = build_account_state(account_number, partial, records, checkpoints.get(account_number),
+                                    opened.get(account_number), account_number in closed)
+        states[account_number] = state
+        for model in read_models:
+            model.add(state)
+    return states
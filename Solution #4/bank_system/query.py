@@ -0,0 +1,225 @@
+"""
+File Name: query.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Ad-hoc transaction queries with filter / group-by / aggregate
+"""
+import math
+
+
+FILTER_FIELDS = (
+    "account_number",
+    "username",
+    "transaction_type",
+    "account_type",
+    "min_amount",
+    "max_amount",
+    "start",
+    "end",
+)
+
+GROUP_FIELDS = ("account_number", "username", "transaction_type", "account_type", "day")
+
+BASIC_AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+def _check_aggregate(name):
+    if name in BASIC_AGGREGATES:
+        return
+    if name.startswith("p"):
+        try:
+            if 0 <= float(name[1:]) <= 100:
+                return
+        except ValueError:
+            pass
+    raise ValueError(f"Unknown aggregate: {name}")
+
+
+def percentile(sorted_values, q):
+    """q-th percentile (0-100) of sorted values, linear interpolation"""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class TransactionQuery:
+    """Builder for filtering, grouping and aggregating the ledger through its narrowest index"""
+
+    def __init__(self, columns, time_index, transactions):
+        self.__columns = columns
+        self.__time_index = time_index
+        self.__transactions = transactions
+        self.__filters = {}
+        self.__group_by = ()
+        self.__aggregates = ("count", "sum")
+
+    def where(self, **filters):
+        for field in filters:
+            if field not in FILTER_FIELDS:
+                raise ValueError(f"Unknown filter: {field}")
+        self.__filters.update((k, v) for k, v in filters.items() if v is not None)
+        return self
+
+    def group_by(self, *fields):
+        for field in fields:
+            if field not in GROUP_FIELDS:
+                raise ValueError(f"Cannot group by {field}")
+        self.__group_by = fields
+        return self
+
+    def aggregate(self, *names):
+        for name in names:
+            _check_aggregate(name)
+        self.__aggregates = names
+        return self
+
+    def _plan(self):
+        """Choose candidate positions: (description, positions or range, fields already applied)"""
+        filters = self.__filters
+        time_index = self.__time_index
+        start = filters.get("start")
+        end = filters.get("end")
+
+        lists = []
+        if "account_number" in filters:
+            lists.append(("account index", time_index.positions_for_account(filters["account_number"]),
+                          "account_number"))
+        if "username" in filters:
+            lists.append(("username index", time_index.positions_for_username(filters["username"]),
+                          "username"))
+        if lists:
+            name, positions, applied = min(lists, key=lambda item: len(item[1]))
+            lo, hi = time_index.time_bounds(positions, start, end)
+            if start is not None or end is not None:
+                name += " + time range"
+            return name, positions[lo:hi], {applied, "start", "end"}
+
+        lo, hi = time_index.time_bounds(None, start, end)
+        name = "time index" if start is not None or end is not None else "full scan"
+        return name, range(lo, hi), {"start", "end"}
+
+    def explain(self):
+        """Describe the chosen access path"""
+        name, positions, _ = self._plan()
+        return f"{name}: {len(positions)} candidate rows"
+
+    def positions(self):
+        """Yield ledger positions of matching transactions in time order"""
+        _, candidates, applied = self._plan()
+        columns = self.__columns
+        filters = self.__filters
+        # Account/username position lists never hold removed (compacted) positions
+        is_removed = None
+        if isinstance(candidates, range) and self.__time_index.get_removed_total():
+            is_removed = self.__time_index.is_removed
+
+        # Translate remaining filters to column comparisons
+        account_number = filters.get("account_number") if "account_number" not in applied else None
+        username_code = type_code = account_type_code = None
+        if "username" in filters and "username" not in applied:
+            username_code = columns.usernames.lookup(filters["username"])
+            if username_code is None:
+                return
+        if "transaction_type" in filters:
+            type_code = columns.transaction_types.lookup(filters["transaction_type"])
+            if type_code is None:
+                return
+        if "account_type" in filters:
+            account_type_code = columns.account_types.lookup(filters["account_type"])
+            if account_type_code is None:
+                return
+        min_amount = filters.get("min_amount")
+        max_amount = filters.get("max_amount")
+
+        account_numbers = columns.account_numbers
+        amounts = columns.amounts
+        username_codes = columns.username_codes
+        type_codes = columns.type_codes
+        account_type_codes = columns.account_type_codes
+        for p in candidates:
+            if is_removed is not None and is_removed(p):
+                continue
+            if account_number is not None and account_numbers[p] != account_number:
+                continue
+            if username_code is not None and username_codes[p] != username_code:
+                continue
+            if type_code is not None and type_codes[p] != type_code:
+                continue
+            if account_type_code is not None and account_type_codes[p] != account_type_code:
+                continue
+            if min_amount is not None and amounts[p] < min_amount:
+                continue
+            if max_amount is not None and amounts[p] > max_amount:
+                continue
+            yield p
+
+    def transactions(self):
+        """Yield matching Transaction objects"""
+        ledger = self.__transactions
+        for p in self.positions():
+            yield ledger[p]
+
+    def _group_key_function(self):
+        columns = self.__columns
+        getters = []
+        for field in self.__group_by:
+            if field == "account_number":
+                getters.append(columns.account_numbers.__getitem__)
+            elif field == "username":
+                codes, names = columns.username_codes, columns.usernames
+                getters.append(lambda p, c=codes, d=names: d.decode(c[p]))
+            elif field == "transaction_type":
+                codes, names = columns.type_codes, columns.transaction_types
+                getters.append(lambda p, c=codes, d=names: d.decode(c[p]))
+            elif field == "account_type":
+                codes, names = columns.account_type_codes, columns.account_types
+                getters.append(lambda p, c=codes, d=names: d.decode(c[p]))
+            else:  # day
+                getters.append(lambda p, t=self.__time_index: t.time_at(p).date())
+        if not getters:
+            return lambda p: ()
+        return lambda p: tuple(get(p) for get in getters)
+
+    def run(self):
+        """Execute query: {group key tuple: {aggregate name: value}}"""
+        amounts = self.__columns.amounts
+        key_of = self._group_key_function()
+        needs_values = any(name not in ("count", "sum", "mean") for name in self.__aggregates)
+
+        groups = {}  # key -> [count, sum, values or None]
+        for p in self.positions():
+            key = key_of(p)
+            amount = amounts[p]
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [0, 0, [] if needs_values else None]
+            group[0] += 1
+            group[1] += amount
+            if needs_values:
+                group[2].append(amount)
+
+        results = {}
+        for key, (count, total, values) in groups.items():
+            if values is not None:
+                values.sort()
+            row = {}
+            for name in self.__aggregates:
+                if name == "count":
+                    row[name] = count
+                elif name == "sum":
+                    row[name] = total
+                elif name == "mean":
+                    row[name] = total / count
+                elif name == "min":
+                    row[name] = values[0]
+                elif name == "max":
+                    row[name] = values[-1]
+                else:
+                    row[name] = percentile(values, float(name[1:]))
+            results[key] = row
+        return results
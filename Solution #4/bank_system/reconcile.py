@@ -0,0 +1,143 @@
+"""
+File Name: reconcile.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Parallel reconciliation of account balances against the ledger
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+def partition_of(account_number, partitions):
+    """Partition an account's ledger entries and balance are grouped into"""
+    return hash(account_number) % partitions
+
+
+def aggregate_chunk(account_bytes, amount_bytes, partitions):
+    """Map step: {account number: [count, signed total]} per partition for one chunk"""
+    account_numbers = array("q")
+    account_numbers.frombytes(account_bytes)
+    amounts = array("q")
+    amounts.frombytes(amount_bytes)
+
+    totals = {}
+    for account_number, amount in zip(account_numbers, amounts):
+        entry = totals.get(account_number)
+        if entry is None:
+            totals[account_number] = [1, amount]
+        else:
+            entry[0] += 1
+            entry[1] += amount
+
+    result = [{} for _ in range(partitions)]
+    for account_number, entry in totals.items():
+        result[partition_of(account_number, partitions)][account_number] = entry
+    return result
+
+
+def join_partition(partials, accounts):
+    """Reduce and join step for one partition; returns (entries counted, mismatch rows)"""
+    totals = {}
+    for partial in partials:
+        for account_number, (count, amount) in partial.items():
+            entry = totals.get(account_number)
+            if entry is None:
+                totals[account_number] = [count, amount]
+            else:
+                entry[0] += count
+                entry[1] += amount
+
+    entries = 0
+    mismatches = []
+    for account_number, base, balance in accounts:
+        count, amount = totals.get(account_number, (0, 0))
+        entries += count
+        if base + amount != balance:
+            mismatches.append({
+                "account_number": account_number,
+                "balance": balance,
+                "expected": base + amount,
+                "difference": balance - (base + amount),
+                "entries": count,
+            })
+    return entries, mismatches
+
+
+class InlineExecutor:
+    """Executor stand-in that runs tasks immediately (workers=1)"""
+
+    class _Done:
+        def __init__(self, value):
+            self.__value = value
+
+        def result(self):
+            return self.__value
+
+    def submit(self, function, *args):
+        return self._Done(function(*args))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def reconcile_ledger(transactions, account_rows, workers=None, partitions=None, chunk_size=200000):
+    """Check balance == base + signed ledger sum for every account; returns a report"""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    partitions = partitions if partitions is not None else max(1, workers * 2)
+
+    grouped_accounts = [[] for _ in range(partitions)]
+    account_count = 0
+    for row in account_rows:
+        grouped_accounts[partition_of(row[0], partitions)].append(row)
+        account_count += 1
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else InlineExecutor()
+    with executor:
+        chunks = []
+        rows = 0
+        account_numbers = array("q")
+        amounts = array("q")
+        for transaction in transactions:
+            rows += 1
+            account_numbers.append(transaction.get_account_number())
+            amounts.append(transaction.get_signed_amount())
+            if len(amounts) == chunk_size:
+                chunks.append(executor.submit(aggregate_chunk, account_numbers.tobytes(), amounts.tobytes(),
+                                              partitions))
+                account_numbers = array("q")
+                amounts = array("q")
+        if amounts:
+            chunks.append(executor.submit(aggregate_chunk, account_numbers.tobytes(), amounts.tobytes(),
+                                          partitions))
+        per_partition = [[] for _ in range(partitions)]
+        for future in chunks:
+            for partition, partial in enumerate(future.result()):
+                if partial:
+                    per_partition[partition].append(partial)
+        joins = [executor.submit(join_partition, per_partition[p], grouped_accounts[p])
+                 for p in range(partitions)]
+        entries = 0
+        mismatches = []
+        for future in joins:
+            counted, found = future.result()
+            entries += counted
+            mismatches.extend(found)
+
+    mismatches.sort(key=lambda row: row["account_number"])
+    return {
+        "accounts_checked": account_count,
+        "ledger_rows_scanned": rows,
+        "entries_matched": entries,
+        "chunks": len(chunks),
+        "partitions": partitions,
+        "workers": workers,
+        "mismatches": mismatches,
+    }
@@ -0,0 +1,92 @@
+"""
+File Name: rollups.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Incrementally maintained daily transaction rollups
+"""
+from bisect import bisect_left, bisect_right, insort
+
+
+ROLLUP_GROUP_FIELDS = ("transaction_type", "account_type")
+
+
+class DailyRollups:
+    """Per-day count/sum/min/max of amounts by (transaction type, account type)"""
+
+    def __init__(self):
+        self.__days = []  # sorted dates that have rollups
+        self.__cells = {}  # date -> {(transaction type, account type): [count, sum, min, max]}
+
+    def _day_cells(self, day):
+        cells = self.__cells.get(day)
+        if cells is None:
+            cells = self.__cells[day] = {}
+            if not self.__days or day > self.__days[-1]:
+                self.__days.append(day)
+            else:
+                insort(self.__days, day)
+        return cells
+
+    def add(self, transaction):
+        """Fold one transaction into its day's rollup"""
+        cells = self._day_cells(transaction.get_transaction_date().date())
+        key = (transaction.get_transaction_type(), transaction.get_account_type())
+        amount = transaction.get_amount()
+        cell = cells.get(key)
+        if cell is None:
+            cells[key] = [1, amount, amount, amount]
+        else:
+            cell[0] += 1
+            cell[1] += amount
+            if amount < cell[2]:
+                cell[2] = amount
+            if amount > cell[3]:
+                cell[3] = amount
+
+    def add_cell(self, day, key, count, total, low, high):
+        """Merge precomputed stats (e.g. of compacted transactions) into a day's rollup"""
+        cells = self._day_cells(day)
+        cell = cells.get(key)
+        if cell is None:
+            cells[key] = [count, total, low, high]
+        else:
+            cell[0] += count
+            cell[1] += total
+            cell[2] = min(cell[2], low)
+            cell[3] = max(cell[3], high)
+
+    def get_days(self):
+        return list(self.__days)
+
+    def get_day(self, day):
+        """Rollup rows for one date: {(transaction type, account type): stats dict}"""
+        return {key: _stats(cell) for key, cell in self.__cells.get(day, {}).items()}
+
+    def summarize(self, start_day=None, end_day=None, group_by=ROLLUP_GROUP_FIELDS):
+        """Merge daily rollups for start_day <= day <= end_day by group_by"""
+        for field in group_by:
+            if field not in ROLLUP_GROUP_FIELDS:
+                raise ValueError(f"Cannot group rollups by {field}")
+        indexes = [ROLLUP_GROUP_FIELDS.index(field) for field in group_by]
+
+        lo = 0 if start_day is None else bisect_left(self.__days, start_day)
+        hi = len(self.__days) if end_day is None else bisect_right(self.__days, end_day)
+
+        merged = {}
+        for day in self.__days[lo:hi]:
+            for key, (count, total, low, high) in self.__cells[day].items():
+                group = tuple(key[i] for i in indexes)
+                cell = merged.get(group)
+                if cell is None:
+                    merged[group] = [count, total, low, high]
+                else:
+                    cell[0] += count
+                    cell[1] += total
+                    cell[2] = min(cell[2], low)
+                    cell[3] = max(cell[3], high)
+        return {group: _stats(cell) for group, cell in merged.items()}
+
+
+def _stats(cell):
+    count, total, low, high = cell
+    return {"count": count, "sum": total, "min": low, "max": high}
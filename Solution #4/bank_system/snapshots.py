@@ -0,0 +1,125 @@
+"""
+File Name: snapshots.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Copy-on-write point-in-time views of a bank for reports and exports
+"""
+import copy
+from itertools import takewhile
+
+
+class BankSnapshot:
+    """Accounts, balances and ledger as they were when the snapshot was taken"""
+
+    def __init__(self, bank, account_numbers, transaction_count, created_date=None):
+        self.__bank = bank
+        self.__account_numbers = account_numbers  # int64 array, account list order
+        self.__number_set = None  # frozenset of account_numbers, built by the first lookup
+        self.__transaction_count = transaction_count
+        self.__created_date = created_date
+        self.__preserved = {}  # account number -> frozen copy from before its first change
+        self.__closed = False
+
+    def _preserve(self, account):
+        """Called by the bank before an account changes"""
+        account_number = account.get_account_number()
+        if account_number not in self.__preserved:
+            self.__preserved[account_number] = copy.copy(account)
+
+    def _account(self, account_number, frozen):
+        """Account as of the snapshot (None if it did not exist then)"""
+        preserved = self.__preserved.get(account_number)
+        if preserved is not None:
+            return preserved
+        account = self.__bank.get_storage().get_account(account_number)
+        if account is not None and frozen:
+            account = copy.copy(account)
+        return self.__preserved.get(account_number, account)
+
+    def _balance(self, account_number):
+        preserved = self.__preserved.get(account_number)
+        if preserved is not None:
+            return preserved.get_balance()
+        account = self.__bank.get_storage().get_account(account_number)
+        balance = 0 if account is None else account.get_balance()
+        preserved = self.__preserved.get(account_number)
+        return balance if preserved is None else preserved.get_balance()
+
+    def close(self):
+        """Stop preserving accounts for this snapshot"""
+        if not self.__closed:
+            self.__closed = True
+            self.__bank._release_snapshot(self)
+            self.__preserved = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    # Getter methods
+    def get_created_date(self):
+        return self.__created_date
+
+    def get_account_count(self):
+        return len(self.__account_numbers)
+
+    def get_transaction_count(self):
+        """Ledger length at the snapshot (transaction ids 1..count)"""
+        return self.__transaction_count
+
+    def get_preserved_count(self):
+        """Accounts changed since the snapshot (copies held)"""
+        return len(self.__preserved)
+
+    def get_account_by_number(self, account_number):
+        """Frozen copy of the account as of the snapshot, or None"""
+        if self.__number_set is None:
+            self.__number_set = frozenset(self.__account_numbers)
+        if account_number not in self.__number_set:
+            return None
+        return self._account(account_number, frozen=True)
+
+    def iter_accounts(self):
+        """Frozen copies of the accounts, in account list order at the snapshot"""
+        for account_number in self.__account_numbers:
+            account = self._account(account_number, frozen=True)
+            if account is not None:
+                yield account
+
+    def iter_balances(self):
+        """(account number, balance) pairs without copying accounts"""
+        for account_number in self.__account_numbers:
+            yield account_number, self._balance(account_number)
+
+    def get_total_balance(self):
+        """Sum of the balances listed by iter_accounts()"""
+        return sum(balance for _, balance in self.iter_balances())
+
+    def get_total_overdraft(self):
+        """Total overdraft limit of the accounts listed by iter_accounts()"""
+        overdraft_of = self.__bank._overdraft_of
+        accounts = (self._account(number, frozen=False) for number in self.__account_numbers)
+        return sum(overdraft_of(account) for account in accounts if account is not None)
+
+    def iter_transactions(self, start=None, end=None, account_number=None, username=None):
+        """Bank.iter_transactions() cut at the snapshot's ledger length"""
+        limit = self.__transaction_count
+        return takewhile(lambda t: t.get_transaction_id() <= limit,
+                         self.__bank.iter_transactions(start, end, account_number, username))
+
+    def show_all_accounts(self):
+        """Display all accounts and totals as of the snapshot"""
+        print("\n=== All Accounts in Bank ===")
+        total_balance = 0
+        total_overdraft = 0
+        overdraft_of = self.__bank._overdraft_of
+        for acc in self.iter_accounts():
+            acc.show_account_info()
+            print("--------------------------")
+            total_balance += acc.get_balance()
+            total_overdraft += overdraft_of(acc)
+        print(f"Total amount in bank: {total_balance}")
+        print(f"Max overdraft allowed: {total_overdraft}")
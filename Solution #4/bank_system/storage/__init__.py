@@ -0,0 +1,11 @@
+"""
+File Name: storage/__init__.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: storage package
+Storage backends that hold the bank's accounts and transaction ledger
+"""
+from .base import StorageBackend
+from .memory import MemoryStorage
+from .sqlite import SQLiteStorage
+from .tiered import TieredStorage
@@ -0,0 +1,197 @@
+"""
+File Name: storage/base.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Storage backend interface used by Bank, plus helpers shared by backends
+"""
+import pickle
+from array import array
+from contextlib import nullcontext
+from collections.abc import Sequence
+from clock import get_default_clock
+
+
+# Runtime references that are restored from the owning bank, never stored
+_UNSTORED_ACCOUNT_FIELDS = ("_bank", "_clock")
+
+
+def encode_account(account):
+    """Serialize an account's state (without its bank and clock references)"""
+    state = {k: v for k, v in vars(account).items() if k not in _UNSTORED_ACCOUNT_FIELDS}
+    return pickle.dumps((type(account), state), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_account(data, bank=None):
+    """Rebuild an account from encode_account() output and attach it to bank"""
+    cls, state = pickle.loads(data)
+    account = cls.__new__(cls)
+    account.__dict__.update(state)
+    account._bank = bank
+    account._clock = bank.get_clock() if bank is not None else get_default_clock()
+    return account
+
+
+class StoredSequence(Sequence):
+    """Sequence over records a backend fetches on demand by position"""
+
+    __slots__ = ("_count", "_at", "_iterate")
+
+    def __init__(self, count, at, iterate):
+        self._count = count
+        self._at = at
+        self._iterate = iterate
+
+    def __len__(self):
+        return self._count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._at(i) for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("index out of range")
+        return self._at(index)
+
+    def __iter__(self):
+        return self._iterate()
+
+
+class StorageBackend:
+    """Primary store for accounts and the transaction ledger"""
+
+    def attach(self, bank):
+        """Called once by Bank; accounts loaded later are attached to it"""
+        self._bank = bank
+
+    # Accounts
+    def account_count(self):
+        raise NotImplementedError
+
+    def account_at(self, slot):
+        raise NotImplementedError
+
+    def get_account(self, account_number):
+        """Account with this number, or None"""
+        raise NotImplementedError
+
+    def add_accounts(self, accounts, events=()):
+        """Append numbered accounts and store their AccountEvent dicts in the same write"""
+        raise NotImplementedError
+
+    def save_account(self, account):
+        """Persist changed state of a stored account"""
+        raise NotImplementedError
+
+    def replace_account(self, account):
+        """Store account in place of the account with the same number"""
+        raise NotImplementedError
+
+    def remove_account(self, account_number, event=None):
+        """Remove account and store its AccountEvent dict; returns True if removed"""
+        raise NotImplementedError
+
+    def iter_accounts(self):
+        """Iterate accounts in slot order"""
+        raise NotImplementedError
+
+    def account_numbers(self):
+        """Account numbers in slot order, as an int64 array"""
+        return array("q", (account.get_account_number() for account in self.iter_accounts()))
+
+    def accounts_view(self):
+        """Indexable live sequence of accounts"""
+        return StoredSequence(self.account_count, self.account_at, self.iter_accounts)
+
+    def load_account_events(self):
+        """AccountEvent dicts in the order they were stored"""
+        raise NotImplementedError
+
+    # Ledger
+    def append_transaction(self, transaction):
+        raise NotImplementedError
+
+    def transaction_count(self):
+        raise NotImplementedError
+
+    def transaction_at(self, position):
+        raise NotImplementedError
+
+    def transactions_at(self, positions):
+        """Transactions at ledger positions (as produced by Bank's indexes), in order"""
+        return [self.transaction_at(p) for p in positions]
+
+    def iter_transactions(self):
+        """Iterate held (not released) transactions in posting order"""
+        raise NotImplementedError
+
+    def released_count(self):
+        """Number of oldest ledger positions no longer held by the backend"""
+        return 0
+
+    def release_transactions(self, count):
+        """Drop the oldest count held transactions"""
+        raise NotImplementedError
+
+    def discard_transactions(self, positions):
+        """Drop compacted transactions; their positions then read as None"""
+        raise NotImplementedError
+
+    def transactions_view(self):
+        """Indexable live sequence of transactions"""
+        return StoredSequence(self.transaction_count, self.transaction_at, self.iter_transactions)
+
+    # Aggregates
+    def total_balance(self):
+        return sum(account.get_balance() for account in self.iter_accounts())
+
+    def ledger_totals(self):
+        """{account number: (transaction count, sum of signed amounts)}"""
+        totals = {}
+        for transaction in self.iter_transactions():
+            number = transaction.get_account_number()
+            count, total = totals.get(number, (0, 0))
+            totals[number] = (count + 1, total + transaction.get_signed_amount())
+        return totals
+
+    # Idempotency cache persistence
+    def deferred_flush(self):
+        """Context manager that holds automatic flushes until it exits"""
+        return nullcontext()
+
+    def save_idempotency_entries(self, entries, forget=()):
+        """Store or replace (key, stored_at, fingerprint, result) entries and delete forgotten keys"""
+
+    def load_idempotency_entries(self):
+        return []
+
+    # Checkpoint persistence
+    def save_checkpoints(self, checkpoints):
+        """Store or replace checkpoint dicts (AccountCheckpoint.to_dict())"""
+
+    def load_checkpoints(self):
+        return []
+
+    # Ledger chain persistence
+    def save_chain_checkpoints(self, checkpoints):
+        """Store chain checkpoint dicts (ChainCheckpoint.to_dict()); the records they cover must be durable first"""
+
+    def load_chain_checkpoints(self):
+        return []
+
+    def load_chain_head(self):
+        """Chain head (ChainCheckpoint dict) stored with the last flush of transactions, or None"""
+        return None
+
+    def save_pruned_digests(self, digests):
+        """Store {ledger position: digest} of compacted records"""
+
+    def load_pruned_digests(self):
+        return {}
+
+    def flush(self):
+        """Write buffered changes"""
+
+    def close(self):
+        self.flush()
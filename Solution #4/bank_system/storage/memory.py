@@ -0,0 +1,101 @@
+"""
+File Name: storage/memory.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: In-memory storage backend (Python lists, the default)
+"""
+from storage.base import StorageBackend
+
+
+class MemoryStorage(StorageBackend):
+    """Accounts and transactions kept in Python lists"""
+
+    def __init__(self):
+        self.__accounts = []
+        self.__slots = {}  # account number -> position in __accounts
+        self.__transactions = []  # ledger positions from __released on
+        self.__released = 0
+        self.__events = []  # AccountEvent dicts
+
+    # Accounts
+    def account_count(self):
+        return len(self.__accounts)
+
+    def account_at(self, slot):
+        return self.__accounts[slot]
+
+    def get_account(self, account_number):
+        slot = self.__slots.get(account_number)
+        return None if slot is None else self.__accounts[slot]
+
+    def add_accounts(self, accounts, events=()):
+        first_slot = len(self.__accounts)
+        self.__accounts.extend(accounts)
+        self.__slots.update((acc.get_account_number(), slot)
+                            for slot, acc in enumerate(accounts, first_slot))
+        self.__events.extend(events)
+
+    def save_account(self, account):
+        pass  # the stored object is the live object
+
+    def replace_account(self, account):
+        self.__accounts[self.__slots[account.get_account_number()]] = account
+
+    def remove_account(self, account_number, event=None):
+        slot = self.__slots.pop(account_number, None)
+        if slot is None:
+            return False
+        last = self.__accounts.pop()
+        if slot < len(self.__accounts):
+            self.__accounts[slot] = last
+            self.__slots[last.get_account_number()] = slot
+        if event is not None:
+            self.__events.append(event)
+        return True
+
+    def iter_accounts(self):
+        return iter(self.__accounts)
+
+    def accounts_view(self):
+        return self.__accounts
+
+    def load_account_events(self):
+        return list(self.__events)
+
+    # Ledger
+    def append_transaction(self, transaction):
+        self.__transactions.append(transaction)
+
+    def transaction_count(self):
+        return self.__released + len(self.__transactions)
+
+    def transaction_at(self, position):
+        if position < self.__released:
+            raise IndexError("transaction has been released")
+        return self.__transactions[position - self.__released]
+
+    def transactions_at(self, positions):
+        if self.__released:
+            return [self.transaction_at(p) for p in positions]
+        transactions = self.__transactions
+        return [transactions[p] for p in positions]
+
+    def iter_transactions(self):
+        return (t for t in self.__transactions if t is not None)
+
+    def transactions_view(self):
+        if self.__released:
+            return super().transactions_view()
+        return self.__transactions  # positions match list indexes until a release
+
+    def released_count(self):
+        return self.__released
+
+    def release_transactions(self, count):
+        del self.__transactions[:count]
+        self.__released += count
+
+    def discard_transactions(self, positions):
+        for p in positions:
+            if p >= self.__released:
+                self.__transactions[p - self.__released] = None
@@ -0,0 +1,404 @@
+"""
+File Name: storage/sqlite.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: SQLite storage backend (single local database file)
+"""
+import json
+import pickle
+import sqlite3
+import weakref
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+from transaction import Transaction, TRANSACTION_SIGNS
+from storage.base import StorageBackend, encode_account, decode_account
+
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS accounts (
+        account_number INTEGER PRIMARY KEY,
+        slot INTEGER NOT NULL UNIQUE,
+        username TEXT NOT NULL,
+        account_type TEXT NOT NULL,
+        balance INTEGER NOT NULL,
+        state BLOB NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY,
+        account_number INTEGER NOT NULL,
+        username TEXT NOT NULL,
+        account_type TEXT NOT NULL,
+        amount INTEGER NOT NULL,
+        transaction_type TEXT NOT NULL,
+        transaction_date TEXT NOT NULL,
+        details TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS transactions_by_account ON transactions (account_number)",
+    """CREATE TABLE IF NOT EXISTS account_events (
+        id INTEGER PRIMARY KEY,
+        account_number INTEGER NOT NULL,
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS checkpoints (
+        account_number INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS chain_checkpoints (
+        position INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS chain_head (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS pruned_digests (
+        position INTEGER PRIMARY KEY,
+        digest BLOB NOT NULL
+    )""",
+    # Rows are replaced on every store, so rowid order is least to most recently used
+    """CREATE TABLE IF NOT EXISTS idempotency_keys (
+        key TEXT PRIMARY KEY,
+        entry BLOB NOT NULL
+    )""",
+)
+
+# Statements are constant strings, so sqlite3's per-connection statement
+# cache prepares each one once and reuses it.
+INSERT_ACCOUNT = (
+    "INSERT INTO accounts (account_number, slot, username, account_type, balance, state) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+UPDATE_ACCOUNT = (
+    "UPDATE accounts SET username = ?, account_type = ?, balance = ?, state = ? "
+    "WHERE account_number = ?"
+)
+INSERT_TRANSACTION = (
+    "INSERT INTO transactions (id, account_number, username, account_type, amount, "
+    "transaction_type, transaction_date, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+TRANSACTION_COLUMNS = ("id, account_number, username, account_type, amount, "
+                       "transaction_type, transaction_date, details")
+INSERT_ACCOUNT_EVENT = "INSERT INTO account_events (account_number, data) VALUES (?, ?)"
+SELECT_TRANSACTION = f"SELECT {TRANSACTION_COLUMNS} FROM transactions WHERE id = ?"
+SELECT_TRANSACTION_PAGE = f"SELECT {TRANSACTION_COLUMNS} FROM transactions WHERE id > ? ORDER BY id LIMIT ?"
+SELECT_ACCOUNT = "SELECT state FROM accounts WHERE account_number = ?"
+SELECT_ACCOUNT_AT = "SELECT account_number, state FROM accounts WHERE slot = ?"
+SELECT_ACCOUNT_PAGE = "SELECT account_number, state, slot FROM accounts WHERE slot >= ? ORDER BY slot LIMIT ?"
+SELECT_ACCOUNT_NUMBERS = "SELECT account_number FROM accounts ORDER BY slot"
+SELECT_SLOT = "SELECT slot FROM accounts WHERE account_number = ?"
+
+# Sign of each transaction type as SQL, for ledger aggregates
+SIGNED_AMOUNT = "CASE transaction_type {} ELSE 0 END * amount".format(
+    " ".join(f"WHEN '{name}' THEN {sign}" for name, sign in TRANSACTION_SIGNS.items()))
+
+# Largest number of host parameters used in one IN (...) lookup
+MAX_IN_PARAMETERS = 500
+
+
+def _event_row(event):
+    return event["account_number"], json.dumps(event)
+
+
+def _transaction_row(transaction):
+    details = transaction.get_details()
+    return (
+        transaction.get_transaction_id(),
+        transaction.get_account_number(),
+        transaction.get_username(),
+        transaction.get_account_type(),
+        transaction.get_amount(),
+        transaction.get_transaction_type(),
+        transaction.get_transaction_date().isoformat(),
+        None if details is None else json.dumps(details),
+    )
+
+
+def _transaction_from_row(row):
+    transaction_id, account_number, username, account_type, amount, transaction_type, date, details = row
+    return Transaction(account_number, username, account_type, amount, transaction_type,
+                       None if details is None else json.loads(details),
+                       datetime.fromisoformat(date), transaction_id)
+
+
+class SQLiteStorage(StorageBackend):
+    """Accounts and transactions in a SQLite database file, written in batches"""
+
+    def __init__(self, path, batch_size=1000):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        self.__path = path
+        self.__batch_size = batch_size
+        # Used by one thread at a time, not always the one that opened it (see writer.BankWriter)
+        self.__connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.__connection.execute(statement)
+        self._bank = None
+        self.__loaded = weakref.WeakValueDictionary()  # account number -> live account
+        self.__dirty = {}  # account number -> account with unwritten changes
+        self.__pending = []  # transactions not yet written
+        self.__pending_keys = {}  # idempotency key -> pickled entry to write, or None to delete
+        self.__deferring = 0  # open deferred_flush() blocks
+        self.__account_count = self._scalar("SELECT COUNT(*) FROM accounts")
+        self.__released = self._scalar("SELECT COALESCE(MAX(value), 0) FROM meta WHERE key = 'released'")
+        self.__written_transactions = max(self.__released,
+                                          self._scalar("SELECT COALESCE(MAX(id), 0) FROM transactions"))
+
+    def get_path(self):
+        return self.__path
+
+    def _scalar(self, sql, params=()):
+        return self.__connection.execute(sql, params).fetchone()[0]
+
+    def _live_account(self, account_number, state):
+        account = self.__loaded.get(account_number)
+        if account is None:
+            account = decode_account(state, self._bank)
+            self.__loaded[account_number] = account
+        return account
+
+    # Accounts
+    def account_count(self):
+        return self.__account_count
+
+    def account_at(self, slot):
+        if not 0 <= slot < self.__account_count:
+            raise IndexError("account slot out of range")
+        account_number, state = self.__connection.execute(SELECT_ACCOUNT_AT, (slot,)).fetchone()
+        return self._live_account(account_number, state)
+
+    def get_account(self, account_number):
+        account = self.__loaded.get(account_number)
+        if account is not None:
+            return account
+        row = self.__connection.execute(SELECT_ACCOUNT, (account_number,)).fetchone()
+        return None if row is None else self._live_account(account_number, row[0])
+
+    def add_accounts(self, accounts, events=()):
+        rows = []
+        for slot, account in enumerate(accounts, self.__account_count):
+            rows.append((account.get_account_number(), slot, account.get_username(),
+                         account.get_account_type(), account.get_balance(), encode_account(account)))
+            self.__loaded[account.get_account_number()] = account
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            self.__connection.executemany(INSERT_ACCOUNT, rows)
+            self.__connection.executemany(INSERT_ACCOUNT_EVENT, map(_event_row, events))
+        self.__account_count += len(rows)
+
+    def save_account(self, account):
+        self.__dirty[account.get_account_number()] = account
+
+    def replace_account(self, account):
+        self.__loaded[account.get_account_number()] = account
+        self.save_account(account)
+
+    def remove_account(self, account_number, event=None):
+        row = self.__connection.execute(SELECT_SLOT, (account_number,)).fetchone()
+        if row is None:
+            return False
+        slot = row[0]
+        last_slot = self.__account_count - 1
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            self.__connection.execute("DELETE FROM accounts WHERE account_number = ?", (account_number,))
+            if slot != last_slot:
+                self.__connection.execute("UPDATE accounts SET slot = ? WHERE slot = ?", (slot, last_slot))
+            if event is not None:
+                self.__connection.execute(INSERT_ACCOUNT_EVENT, _event_row(event))
+        self.__loaded.pop(account_number, None)
+        self.__dirty.pop(account_number, None)
+        self.__account_count -= 1
+        return True
+
+    def account_numbers(self):
+        return array("q", (row[0] for row in self.__connection.execute(SELECT_ACCOUNT_NUMBERS)))
+
+    def iter_accounts(self, page_size=1000):
+        """Iterate accounts in slot order, reading page_size rows at a time"""
+        slot = 0
+        while True:
+            rows = self.__connection.execute(SELECT_ACCOUNT_PAGE, (slot, page_size)).fetchall()
+            for account_number, state, _ in rows:
+                yield self._live_account(account_number, state)
+            if len(rows) < page_size:
+                return
+            slot = rows[-1][2] + 1
+
+    # Ledger
+    def append_transaction(self, transaction):
+        self.__pending.append(transaction)
+        if len(self.__pending) >= self.__batch_size and not self.__deferring:
+            self.flush()
+
+    def transaction_count(self):
+        return self.__written_transactions + len(self.__pending)
+
+    def transaction_at(self, position):
+        if position < self.__released:
+            raise IndexError("transaction has been released")
+        if position >= self.__written_transactions:
+            return self.__pending[position - self.__written_transactions]
+        row = self.__connection.execute(SELECT_TRANSACTION, (position + 1,)).fetchone()
+        return None if row is None else _transaction_from_row(row)
+
+    def transactions_at(self, positions):
+        written = self.__written_transactions
+        stored_ids = [p + 1 for p in positions if p < written]
+        found = {}
+        for i in range(0, len(stored_ids), MAX_IN_PARAMETERS):
+            chunk = stored_ids[i:i + MAX_IN_PARAMETERS]
+            sql = (f"SELECT {TRANSACTION_COLUMNS} FROM transactions "
+                   f"WHERE id IN ({', '.join('?' * len(chunk))})")
+            for row in self.__connection.execute(sql, chunk):
+                found[row[0]] = _transaction_from_row(row)
+        pending = self.__pending
+        return [found.get(p + 1) if p < written else pending[p - written] for p in positions]
+
+    def iter_transactions(self, page_size=1000):
+        """Iterate transactions in posting order, reading page_size rows at a time"""
+        position = self.__released
+        while position < self.transaction_count():
+            if position < self.__written_transactions:
+                rows = self.__connection.execute(SELECT_TRANSACTION_PAGE, (position, page_size)).fetchall()
+                for row in rows:
+                    yield _transaction_from_row(row)
+                position = rows[-1][0] if rows else self.__written_transactions
+            else:
+                yield self.__pending[position - self.__written_transactions]
+                position += 1
+
+    def released_count(self):
+        return self.__released
+
+    def release_transactions(self, count):
+        self.flush()
+        released = self.__released + count
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            self.__connection.execute("DELETE FROM transactions WHERE id <= ?", (released,))
+            self.__connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('released', ?)",
+                                      (released,))
+        self.__released = released
+
+    def discard_transactions(self, positions):
+        self.flush()
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            self.__connection.executemany("DELETE FROM transactions WHERE id = ?",
+                                          ((p + 1,) for p in positions))
+
+    # Aggregates
+    def total_balance(self):
+        self.flush()  # balances are written only together with their ledger batch
+        return self._scalar("SELECT COALESCE(SUM(balance), 0) FROM accounts")
+
+    def ledger_totals(self):
+        self.flush()
+        sql = (f"SELECT account_number, COUNT(*), SUM({SIGNED_AMOUNT}) "
+               f"FROM transactions GROUP BY account_number")
+        return {number: (count, total) for number, count, total in self.__connection.execute(sql)}
+
+    # Idempotency cache persistence
+    @contextmanager
+    def deferred_flush(self):
+        self.__deferring += 1
+        try:
+            yield
+        finally:
+            self.__deferring -= 1
+            if not self.__deferring and len(self.__pending) >= self.__batch_size:
+                self.flush()
+
+    def save_idempotency_entries(self, entries, forget=()):
+        for key in forget:
+            self.__pending_keys[key] = None
+        for entry in entries:
+            self.__pending_keys.pop(entry[0], None)  # keep the newest store last
+            self.__pending_keys[entry[0]] = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        if not self.__pending and not self.__deferring:
+            self.flush()  # nothing buffered to ride along with
+
+    def load_idempotency_entries(self):
+        rows = self.__connection.execute("SELECT entry FROM idempotency_keys ORDER BY rowid")
+        return [pickle.loads(entry) for entry, in rows]
+
+    def load_account_events(self):
+        rows = self.__connection.execute("SELECT data FROM account_events ORDER BY id")
+        return [json.loads(data) for data, in rows]
+
+    # Checkpoint persistence
+    def save_checkpoints(self, checkpoints):
+        rows = [(data["account_number"], json.dumps(data)) for data in checkpoints]
+        self._write("INSERT OR REPLACE INTO checkpoints (account_number, data) VALUES (?, ?)", rows)
+
+    def load_checkpoints(self):
+        return [json.loads(data) for data, in self.__connection.execute("SELECT data FROM checkpoints")]
+
+    # Ledger chain persistence
+    def save_chain_checkpoints(self, checkpoints):
+        self.flush()  # a checkpoint must never cover transactions lost in a crash
+        rows = [(data["position"], json.dumps(data)) for data in checkpoints]
+        self._write("INSERT OR REPLACE INTO chain_checkpoints (position, data) VALUES (?, ?)", rows)
+
+    def load_chain_checkpoints(self):
+        rows = self.__connection.execute("SELECT data FROM chain_checkpoints ORDER BY position")
+        return [json.loads(data) for data, in rows]
+
+    def load_chain_head(self):
+        row = self.__connection.execute("SELECT data FROM chain_head WHERE id = 0").fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save_pruned_digests(self, digests):
+        self._write("INSERT OR REPLACE INTO pruned_digests (position, digest) VALUES (?, ?)",
+                    list(digests.items()))
+
+    def load_pruned_digests(self):
+        return dict(self.__connection.execute("SELECT position, digest FROM pruned_digests"))
+
+    # Writing
+    def _write(self, sql, rows):
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            self.__connection.executemany(sql, rows)
+
+    def _account_rows(self):
+        for account_number, account in self.__dirty.items():
+            yield (account.get_username(), account.get_account_type(), account.get_balance(),
+                   encode_account(account), account_number)
+
+    def flush(self):
+        """Write buffered accounts, transactions and idempotency keys in one database transaction"""
+        if not self.__dirty and not self.__pending and not self.__pending_keys:
+            return
+        with self.__connection:
+            self.__connection.execute("BEGIN")
+            if self.__dirty:
+                self.__connection.executemany(UPDATE_ACCOUNT, list(self._account_rows()))
+            if self.__pending:
+                self.__connection.executemany(INSERT_TRANSACTION, map(_transaction_row, self.__pending))
+                head = self._bank._chain_head() if self._bank is not None else None
+                if head is not None and head["position"] == self.__written_transactions + len(self.__pending):
+                    self.__connection.execute("INSERT OR REPLACE INTO chain_head (id, data) VALUES (0, ?)",
+                                              (json.dumps(head),))
+            if self.__pending_keys:
+                self.__connection.executemany(
+                    "DELETE FROM idempotency_keys WHERE key = ?",
+                    ((key,) for key, entry in self.__pending_keys.items() if entry is None))
+                self.__connection.executemany(
+                    "INSERT OR REPLACE INTO idempotency_keys (key, entry) VALUES (?, ?)",
+                    ((key, entry) for key, entry in self.__pending_keys.items() if entry is not None))
+        self.__dirty.clear()
+        self.__written_transactions += len(self.__pending)
+        self.__pending.clear()
+        self.__pending_keys.clear()
+
+    def close(self):
+        self.flush()
+        self.__connection.close()
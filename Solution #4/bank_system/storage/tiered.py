@@ -0,0 +1,211 @@
+"""
+File Name: storage/tiered.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Tiered storage: recently used accounts in memory, the rest on disk
+"""
+import os
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from storage.base import StorageBackend
+from storage.sqlite import SQLiteStorage
+
+
+def estimate_account_size(account):
+    """Approximate bytes held by an account object and its attribute values"""
+    state = vars(account)
+    size = sys.getsizeof(account) + sys.getsizeof(state)
+    for key, value in state.items():
+        if key not in ("_bank", "_clock"):
+            size += sys.getsizeof(value)
+    return size
+
+
+class TieredStorage(StorageBackend):
+    """Hot LRU of account objects in front of a cold on-disk backend"""
+
+    def __init__(self, cold=None, memory_budget=64 * 1024 * 1024):
+        if memory_budget <= 0:
+            raise ValueError("memory_budget must be greater than 0")
+        self.__directory = None
+        if cold is None:
+            self.__directory = tempfile.mkdtemp(prefix="bank_cold_")
+            cold = SQLiteStorage(os.path.join(self.__directory, "cold.db"))
+        self.__cold = cold
+        self.__memory_budget = memory_budget
+        self.__hot = OrderedDict()  # account number -> (account, estimated size), oldest first
+        self.__hot_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def attach(self, bank):
+        super().attach(bank)
+        self.__cold.attach(bank)
+
+    def get_cold_storage(self):
+        return self.__cold
+
+    def _admit(self, account):
+        """Make account the most recently used hot entry, then enforce the budget"""
+        account_number = account.get_account_number()
+        size = estimate_account_size(account)
+        old = self.__hot.pop(account_number, None)
+        if old is not None:
+            self.__hot_bytes -= old[1]
+        self.__hot[account_number] = (account, size)
+        self.__hot_bytes += size
+        while self.__hot_bytes > self.__memory_budget and len(self.__hot) > 1:
+            _, (_, evicted_size) = self.__hot.popitem(last=False)
+            self.__hot_bytes -= evicted_size
+            self.__evictions += 1
+
+    def _forget(self, account_number):
+        entry = self.__hot.pop(account_number, None)
+        if entry is not None:
+            self.__hot_bytes -= entry[1]
+
+    def _record_access(self, account_number):
+        if account_number in self.__hot:
+            self.__hits += 1
+        else:
+            self.__misses += 1
+
+    # Accounts
+    def account_count(self):
+        return self.__cold.account_count()
+
+    def account_at(self, slot):
+        account = self.__cold.account_at(slot)
+        self._record_access(account.get_account_number())
+        self._admit(account)
+        return account
+
+    def get_account(self, account_number):
+        entry = self.__hot.get(account_number)
+        if entry is not None:
+            self.__hits += 1
+            self.__hot.move_to_end(account_number)
+            return entry[0]
+        self.__misses += 1
+        account = self.__cold.get_account(account_number)
+        if account is not None:
+            self._admit(account)
+        return account
+
+    def add_accounts(self, accounts, events=()):
+        self.__cold.add_accounts(accounts, events)
+        for account in accounts:
+            self._admit(account)
+
+    def save_account(self, account):
+        self.__cold.save_account(account)
+        self._admit(account)
+
+    def replace_account(self, account):
+        self.__cold.replace_account(account)
+        self._admit(account)
+
+    def remove_account(self, account_number, event=None):
+        self._forget(account_number)
+        return self.__cold.remove_account(account_number, event)
+
+    def iter_accounts(self):
+        return self.__cold.iter_accounts()
+
+    def account_numbers(self):
+        return self.__cold.account_numbers()
+
+    # Ledger
+    def append_transaction(self, transaction):
+        self.__cold.append_transaction(transaction)
+
+    def transaction_count(self):
+        return self.__cold.transaction_count()
+
+    def transaction_at(self, position):
+        return self.__cold.transaction_at(position)
+
+    def transactions_at(self, positions):
+        return self.__cold.transactions_at(positions)
+
+    def iter_transactions(self):
+        return self.__cold.iter_transactions()
+
+    def transactions_view(self):
+        return self.__cold.transactions_view()
+
+    def released_count(self):
+        return self.__cold.released_count()
+
+    def release_transactions(self, count):
+        self.__cold.release_transactions(count)
+
+    def discard_transactions(self, positions):
+        self.__cold.discard_transactions(positions)
+
+    # Aggregates
+    def total_balance(self):
+        return self.__cold.total_balance()
+
+    def ledger_totals(self):
+        return self.__cold.ledger_totals()
+
+    # Idempotency cache persistence
+    def deferred_flush(self):
+        return self.__cold.deferred_flush()
+
+    def save_idempotency_entries(self, entries, forget=()):
+        self.__cold.save_idempotency_entries(entries, forget)
+
+    def load_idempotency_entries(self):
+        return self.__cold.load_idempotency_entries()
+
+    def load_account_events(self):
+        return self.__cold.load_account_events()
+
+    def save_checkpoints(self, checkpoints):
+        self.__cold.save_checkpoints(checkpoints)
+
+    def load_checkpoints(self):
+        return self.__cold.load_checkpoints()
+
+    def save_chain_checkpoints(self, checkpoints):
+        self.__cold.save_chain_checkpoints(checkpoints)
+
+    def load_chain_checkpoints(self):
+        return self.__cold.load_chain_checkpoints()
+
+    def load_chain_head(self):
+        return self.__cold.load_chain_head()
+
+    def save_pruned_digests(self, digests):
+        self.__cold.save_pruned_digests(digests)
+
+    def load_pruned_digests(self):
+        return self.__cold.load_pruned_digests()
+
+    def flush(self):
+        self.__cold.flush()
+
+    def close(self):
+        self.__cold.close()
+        self.__hot.clear()
+        self.__hot_bytes = 0
+        if self.__directory is not None:
+            shutil.rmtree(self.__directory, ignore_errors=True)
+            self.__directory = None
+
+    def get_stats(self):
+        lookups = self.__hits + self.__misses
+        return {
+            "hot_accounts": len(self.__hot),
+            "hot_bytes": self.__hot_bytes,
+            "memory_budget": self.__memory_budget,
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "hit_rate": self.__hits / lookups if lookups else 0.0,
+            "evictions": self.__evictions,
+        }
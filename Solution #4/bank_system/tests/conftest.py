@@ -0,0 +1,65 @@
+"""
+File Name: tests/conftest.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Shared pytest fixtures; puts the flat bank_system modules on the import path
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank import Bank  # noqa: E402
+from clock import SimulatedClock  # noqa: E402
+from accounts.base import BankAccount  # noqa: E402
+from storage import MemoryStorage, SQLiteStorage, TieredStorage  # noqa: E402
+
+
+PASSWORD = "1234"
+
+
+@pytest.fixture
+def clock():
+    return SimulatedClock()
+
+
+@pytest.fixture
+def bank(clock):
+    return Bank(clock=clock)
+
+
+class StorageFactory:
+    """Opens storage of one backend kind; SQLite and tiered storage reopen the same file"""
+
+    def __init__(self, kind, path):
+        self.kind = kind
+        self.path = str(path)
+        self.__memory = None
+
+    @property
+    def persistent(self):
+        return self.kind != "memory"
+
+    def open(self, batch_size=1000):
+        if self.kind == "memory":
+            if self.__memory is None:
+                self.__memory = MemoryStorage()
+            return self.__memory
+        if self.kind == "sqlite":
+            return SQLiteStorage(self.path, batch_size=batch_size)
+        return TieredStorage(cold=SQLiteStorage(self.path, batch_size=batch_size))
+
+
+@pytest.fixture(params=("memory", "sqlite", "tiered"))
+def backend(request, tmp_path):
+    return StorageFactory(request.param, tmp_path / "bank.db")
+
+
+def open_account(bank, username="kwanju", balance=0):
+    """Create a normal account with an opening balance in bank"""
+    account = BankAccount(username, PASSWORD, 0.05)
+    if balance:
+        account.set_opening_balance(balance)
+    return bank.create_account(account)
@@ -0,0 +1,46 @@
+"""
+File Name: tests/test_accounts.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Account dates and contract maturity follow the bank's clock
+"""
+from datetime import datetime, timedelta
+
+from bank import Bank
+from clock import SimulatedClock
+from accounts.types import SavingAccount, TimeDepositAccount
+from conftest import PASSWORD
+
+
+START = datetime(2020, 1, 1)
+
+
+def test_account_dates_follow_the_bank_clock():
+    bank = Bank(clock=SimulatedClock(START))
+    deposit = bank.create_account(TimeDepositAccount("kwanju", PASSWORD, 0.05, 30))
+    saving = bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 10000, 12))
+    assert deposit.get_created_date() == START
+    assert deposit._contract_end_date == START + timedelta(days=30)
+    assert saving._contract_end_date == START + timedelta(days=360)
+
+
+def test_time_deposit_matures_on_simulated_clock():
+    clock = SimulatedClock(START)
+    bank = Bank(clock=clock)
+    account = bank.create_account(TimeDepositAccount("kwanju", PASSWORD, 0.05, 30))
+    assert account.deposit(100000) is True
+    clock.advance(days=31)
+    assert account.withdraw(0, PASSWORD) is True
+    assert account._is_matured and not account._is_terminated
+    termination = bank.get_transactions_by_account(account.get_account_number())[1]
+    assert termination.get_details()["outcome"] == "matured"
+
+
+def test_early_termination_before_the_end_date():
+    clock = SimulatedClock(START)
+    bank = Bank(clock=clock)
+    account = bank.create_account(TimeDepositAccount("kwanju", PASSWORD, 0.05, 30))
+    account.deposit(100000)
+    clock.advance(days=29)
+    account.withdraw(0, PASSWORD)
+    assert account._is_terminated and not account._is_matured
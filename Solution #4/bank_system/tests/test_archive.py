@@ -0,0 +1,60 @@
+"""
+File Name: tests/test_archive.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Archived transactions stay readable through every bank query and across reopen
+"""
+from datetime import timedelta
+
+import pytest
+
+from archive import TransactionArchive
+from bank import Bank
+from storage import SQLiteStorage
+from conftest import PASSWORD, open_account
+
+
+def post_two_months(bank, clock):
+    first = open_account(bank, "first", 1000).get_account_number()
+    second = open_account(bank, "second", 0).get_account_number()
+    for _ in range(5):
+        bank.deposit(first, 100)
+        bank.transfer(first, second, 10, PASSWORD)
+    clock.advance(days=60)
+    bank.deposit(second, 7)
+    return first, second
+
+
+def test_archived_transactions_stay_queryable(clock, tmp_path):
+    bank = Bank(clock=clock, archive=TransactionArchive(str(tmp_path / "archive")))
+    first, second = post_two_months(bank, clock)
+    everything = [t.get_transaction_id() for t in bank.iter_transactions()]
+    assert bank.archive_transactions(clock.now() - timedelta(days=30), segment_size=4) == 15
+    assert len(bank.get_archive().get_segments()) == 4
+
+    assert [t.get_transaction_id() for t in bank.iter_transactions()] == everything
+    assert bank.get_transaction(2).get_transaction_type() == "Transfer Out"
+    assert len(bank.get_transactions_by_account(second)) == 6
+    old = list(bank.iter_transactions(end=clock.now() - timedelta(days=30), account_number=first))
+    assert len(old) == 10
+    assert bank.reconcile_balances(workers=1)["mismatches"] == []
+    assert bank.verify_ledger()["valid"]
+
+
+def test_archive_survives_reopen(clock, tmp_path):
+    path = str(tmp_path / "bank.db")
+    archive_dir = str(tmp_path / "archive")
+    bank = Bank(clock=clock, storage=SQLiteStorage(path), archive=TransactionArchive(archive_dir))
+    first, second = post_two_months(bank, clock)
+    bank.archive_transactions(clock.now() - timedelta(days=30), segment_size=4)
+    bank.close()
+
+    bank = Bank(clock=clock, storage=SQLiteStorage(path), archive=TransactionArchive(archive_dir))
+    assert len(list(bank.iter_transactions())) == 16
+    assert bank.get_account_by_number(second).get_balance() == 57
+    assert bank.audit_ledger(workers=1)["valid"]
+
+
+def test_archiving_needs_an_archive(bank):
+    with pytest.raises(ValueError):
+        bank.archive_transactions(bank.get_clock().now())
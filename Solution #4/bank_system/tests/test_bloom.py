@@ -0,0 +1,43 @@
+"""
+File Name: tests/test_bloom.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Bloom filters never forget an added key and keep false positives near their target rate
+"""
+import pytest
+
+from bloom import BloomFilter, ScalableBloomFilter
+from conftest import open_account
+
+
+def test_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(10000, 0.01)
+    for key in range(0, 20000, 2):
+        bloom.add(key)
+    assert all(key in bloom for key in range(0, 20000, 2))
+    false_positives = sum(1 for key in range(1, 200001, 2) if key in bloom)
+    assert false_positives / 100000 < 0.02
+
+
+def test_scalable_filter_grows_past_its_capacity():
+    bloom = ScalableBloomFilter(expected_items=100, false_positive_rate=0.01)
+    for key in range(1000):
+        bloom.add(key)
+    assert len(bloom) == 1000
+    assert bloom.get_stats()["layers"] > 1
+    assert all(key in bloom for key in range(1000))
+    assert bloom.expected_false_positive_rate() < 0.02
+
+
+@pytest.mark.parametrize("rate", [0, 1])
+def test_invalid_rate_is_rejected(rate):
+    with pytest.raises(ValueError):
+        BloomFilter(10, rate)
+
+
+def test_bank_skips_storage_for_unknown_numbers(bank):
+    numbers = {open_account(bank, f"user_{i}").get_account_number() for i in range(200)}
+    assert all(bank.get_account_by_number(number).get_account_number() == number for number in numbers)
+    assert bank.get_account_by_number(1) is None
+    fresh = bank.allocate_account_numbers(500)
+    assert len(set(fresh)) == 500 and not numbers & set(fresh)
@@ -0,0 +1,90 @@
+"""
+File Name: tests/test_command_driver.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Command scripts run end to end and report errors per command
+"""
+import io
+import json
+
+from command_driver import CommandDriver, main
+
+
+def run(driver, text):
+    out = io.StringIO()
+    counts = driver.run(io.StringIO(text), out)
+    return counts, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_script_runs_end_to_end(bank):
+    driver = CommandDriver(bank)
+    (succeeded, failed), results = run(driver, "\n".join([
+        "# two accounts, money moves between them",
+        "create normal kim 1234 0.05",
+        "deposit 5000",
+        "create overdraft lee 1234 0.05 1000 key=open-lee",
+    ]))
+    assert (succeeded, failed) == (3, 0)
+    assert [result["line"] for result in results] == [2, 3, 4]
+    lee = results[-1]["account_number"]
+
+    (succeeded, failed), results = run(driver, "\n".join([
+        "select kim",
+        f"transfer {lee} 2000 1234",
+        json.dumps({"op": "withdraw", "amount": 500, "password": "1234", "account": lee}),
+        "reverse 2",
+        "history",
+        "totals",
+        "reconcile 1",
+    ]))
+    assert (succeeded, failed) == (7, 0), results
+    by_op = {result["op"]: result for result in results}
+    assert by_op["transfer"]["balance"] == 3000
+    assert by_op["withdraw"]["balance"] == 1500
+    assert by_op["reverse"]["transaction_type"] == "Reversal"
+    assert [row["transaction_type"] for row in by_op["history"]["transactions"]] == [
+        "Deposit", "Transfer Out", "Reversal"]
+    assert by_op["totals"]["accounts"] == 2 and by_op["totals"]["total_balance"] == 5000 - 500
+    assert by_op["reconcile"]["mismatches"] == []
+
+
+def test_errors_are_reported_per_command(bank):
+    (succeeded, failed), results = run(CommandDriver(bank), "\n".join([
+        "deposit 100",  # nothing selected
+        "create normal kim 1234 0.05",
+        "withdraw 100 1234",  # insufficient balance
+        "deposit 10.5",
+        "transfer 12345678 10 1234",
+        "launch rockets",
+        "withdraw 100",
+        '{"op": "deposit"',
+        "reverse 99",
+        "deposit 100",
+    ]))
+    assert (succeeded, failed) == (2, 8)
+    errors = {result["line"]: result.get("error") for result in results if not result["ok"]}
+    assert errors[1] == "No account selected."
+    assert "Insufficient" in errors[3]
+    assert "whole number" in errors[4]
+    assert errors[5].startswith("ValueError")
+    assert errors[6] == "Unknown command: launch"
+    assert errors[7] == "Missing arguments for withdraw"
+    assert errors[8].startswith("Invalid JSON")
+    assert errors[9] == "ValueError: Transaction not found: 99"
+    assert results[-1]["balance"] == 100
+
+
+def test_main_keeps_state_in_the_database(tmp_path, capsys):
+    db = str(tmp_path / "bank.db")
+    commands = tmp_path / "commands.txt"
+    output = tmp_path / "results.jsonl"
+    commands.write_text("create normal kim 1234 0.05\ndeposit 700\n", encoding="utf-8")
+    assert main([str(commands), "-o", str(output), "--db", db]) == 0
+    number = json.loads(output.read_text(encoding="utf-8").splitlines()[0])["account_number"]
+
+    commands.write_text(f"info {number}\nwithdraw 800 1234 {number}\n", encoding="utf-8")
+    assert main([str(commands), "-o", str(output), "--db", db]) == 1
+    info, withdraw = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert info["balance"] == 700
+    assert not withdraw["ok"]
+    assert "Commands succeeded: 1, failed: 1" in capsys.readouterr().err
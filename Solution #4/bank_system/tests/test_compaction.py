@@ -0,0 +1,65 @@
+"""
+File Name: tests/test_compaction.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: History compaction keeps balances, rollups and activity counts across reopen and archive
+"""
+from datetime import timedelta
+
+import pytest
+
+from archive import TransactionArchive
+from bank import Bank
+from conftest import open_account
+
+
+def post_history(bank, clock):
+    """One account with 6 ledger entries; the first 5 are a day older than the last"""
+    account = open_account(bank, "kwanju", 0)
+    number = account.get_account_number()
+    for amount in (100, 100, 100, 100, 100):
+        bank.deposit(number, amount)
+    clock.advance(days=1)
+    bank.deposit(number, 1)
+    return number
+
+
+def aggregates(bank):
+    return bank.get_period_summary(group_by=()), [(acc.get_account_number(), count)
+                                                 for acc, count in bank.get_most_active(5)]
+
+
+@pytest.mark.parametrize("archived", [False, True])
+def test_rollups_and_activity_survive_reopen(backend, clock, tmp_path, archived):
+    if not backend.persistent:
+        pytest.skip("needs a store that can be reopened")
+    archive_dir = str(tmp_path / "archive")
+    bank = Bank(clock=clock, storage=backend.open(), archive=TransactionArchive(archive_dir))
+    number = post_history(bank, clock)
+    if archived:
+        bank.archive_transactions(clock.now() - timedelta(hours=12), segment_size=4)
+    assert bank.compact_history(clock.now() - timedelta(hours=12)) == (1, 5)
+    before = aggregates(bank)
+    assert before[0][()]["count"] == 6 and before[0][()]["sum"] == 501
+    assert before[1] == [(number, 6)]
+
+    bank.close()
+    bank = Bank(clock=clock, storage=backend.open(), archive=TransactionArchive(archive_dir))
+    assert aggregates(bank) == before
+    assert bank.get_account_by_number(number).get_balance() == 501
+
+    # Compacting again after the reopen must not count anything twice
+    clock.advance(days=1)
+    bank.compact_history(clock.now() - timedelta(hours=12))
+    assert aggregates(bank) == before
+    bank.close()
+    bank = Bank(clock=clock, storage=backend.open(), archive=TransactionArchive(archive_dir))
+    assert aggregates(bank) == before
+
+
+def test_compacted_entries_leave_history(bank, clock):
+    number = post_history(bank, clock)
+    bank.compact_history(clock.now() - timedelta(hours=12))
+    assert [t.get_amount() for t in bank.get_transactions_by_account(number)] == [1]
+    assert bank.get_checkpoint(number).get_transaction_count() == 5
+    assert bank.verify_account_history(bank.get_account_by_number(number))
@@ -0,0 +1,86 @@
+"""
+File Name: tests/test_exporter.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Ledger export to CSV / JSON Lines, gzip output and export filters
+"""
+import csv
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+
+from exporter import EXPORT_FIELDS, export_transactions
+from conftest import PASSWORD, open_account
+
+
+@pytest.fixture
+def ledger(bank, clock):
+    day_0 = clock.now()
+    kim = open_account(bank, "kim", 1000).get_account_number()
+    lee = open_account(bank, "lee", 1000).get_account_number()
+    kim_2 = open_account(bank, "kim").get_account_number()
+    bank.deposit(kim, 100)
+    clock.advance(days=1)
+    bank.transfer(kim, lee, 200, PASSWORD)
+    clock.advance(days=1)
+    bank.withdraw(lee, 50, PASSWORD)
+    bank.deposit(kim_2, 30)
+    return {"kim": kim, "lee": lee, "kim_2": kim_2, "day_0": day_0}
+
+
+def read_csv(path, compress=False):
+    opener = gzip.open if compress else open
+    with opener(path, "rt", encoding="utf-8", newline="") as stream:
+        return list(csv.DictReader(stream))
+
+
+def test_csv_and_jsonl_hold_the_same_rows(bank, ledger, tmp_path):
+    assert export_transactions(bank, tmp_path / "ledger.csv") == 5
+    assert export_transactions(bank, tmp_path / "ledger.jsonl", fmt="jsonl") == 5
+    csv_rows = read_csv(tmp_path / "ledger.csv")
+    with open(tmp_path / "ledger.jsonl", encoding="utf-8") as stream:
+        json_rows = [json.loads(line) for line in stream]
+    assert list(csv_rows[0]) == EXPORT_FIELDS
+    assert [{k: str(v) for k, v in row.items()} for row in json_rows] == csv_rows
+    assert [row["transaction_id"] for row in json_rows] == [1, 2, 3, 4, 5]
+    assert json_rows[1]["transaction_type"] == "Transfer Out" and json_rows[1]["amount"] == 200
+
+
+def test_gzip_output_in_small_chunks(bank, ledger, tmp_path):
+    path = tmp_path / "ledger.csv.gz"
+    assert export_transactions(bank, path, compress=True, chunk_size=2) == 5
+    assert [row["transaction_id"] for row in read_csv(path, compress=True)] == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ({"username": "kim"}, [1, 2, 5]),
+    ({"username": "lee", "transaction_type": "Withdrawal"}, [4]),
+    ({"account_number": "kim_2"}, [5]),
+    ({"account_number": "kim", "username": "kim"}, [1, 2]),
+    ({"account_number": "lee", "username": "kim"}, []),
+    ({"transaction_type": "Deposit"}, [1, 5]),
+    ({"start": 1, "end": 2}, [2, 3]),
+    ({"username": "kim", "start": 1}, [2, 5]),
+    ({"username": "nobody"}, []),
+])
+def test_filters(bank, ledger, tmp_path, filters, expected):
+    filters = dict(filters)
+    if "account_number" in filters:
+        filters["account_number"] = ledger[filters["account_number"]]
+    for key in ("start", "end"):
+        if key in filters:
+            filters[key] = ledger["day_0"] + timedelta(days=filters[key])
+    path = tmp_path / "ledger.jsonl"
+    export_transactions(bank, path, fmt="jsonl", **filters)
+    with open(path, encoding="utf-8") as stream:
+        assert [json.loads(line)["transaction_id"] for line in stream] == expected
+
+
+def test_username_filter_reads_only_that_users_positions(bank, ledger, tmp_path, monkeypatch):
+    def full_scan():
+        raise AssertionError("username export scanned the whole ledger")
+
+    monkeypatch.setattr(bank.get_storage(), "iter_transactions", full_scan)
+    assert export_transactions(bank, tmp_path / "lee.csv", username="lee") == 2
@@ -0,0 +1,61 @@
+"""
+File Name: tests/test_idempotency.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Idempotency keys: retries, conflicts and failed operations
+"""
+import pytest
+
+from accounts.base import BankAccount
+from accounts.types import SavingAccount
+from exceptions import IdempotencyConflictError
+from conftest import PASSWORD, open_account
+
+
+def test_retry_returns_first_result_without_posting_again(bank):
+    account = open_account(bank)
+    assert bank.deposit(account.get_account_number(), 1000, idempotency_key="k1") is True
+    assert bank.deposit(account.get_account_number(), 1000, idempotency_key="k1") is True
+    assert account.get_balance() == 1000
+
+
+def test_reused_key_with_other_arguments_conflicts(bank):
+    account = open_account(bank)
+    bank.deposit(account.get_account_number(), 1000, idempotency_key="k1")
+    with pytest.raises(IdempotencyConflictError):
+        bank.deposit(account.get_account_number(), 2000, idempotency_key="k1")
+
+
+def test_failed_withdrawal_is_not_remembered(bank):
+    account = open_account(bank)
+    number = account.get_account_number()
+    assert bank.withdraw(number, 500, PASSWORD, idempotency_key="w1") is False
+    bank.deposit(number, 1000)
+    assert bank.withdraw(number, 500, PASSWORD, idempotency_key="w1") is True
+    assert account.get_balance() == 500
+
+
+def test_create_account_retry_returns_same_account(bank):
+    first = bank.create_account(BankAccount("kwanju", PASSWORD, 0.05), idempotency_key="c1")
+    again = bank.create_account(BankAccount("kwanju", PASSWORD, 0.05), idempotency_key="c1")
+    assert again is first
+    assert len(bank.get_all_accounts()) == 1
+
+
+@pytest.mark.parametrize("other", [
+    BankAccount("kwanju", PASSWORD, 0.07),
+    BankAccount("kwanju", "9999", 0.05),
+    SavingAccount("kwanju", PASSWORD, 0.05, 100000, 12),
+])
+def test_create_account_fingerprint_covers_every_argument(bank, other):
+    bank.create_account(BankAccount("kwanju", PASSWORD, 0.05), idempotency_key="c1")
+    with pytest.raises(IdempotencyConflictError):
+        bank.create_account(other, idempotency_key="c1")
+
+
+def test_create_account_fingerprint_covers_contract_terms(bank, clock):
+    bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 100000, 12), idempotency_key="c1")
+    clock.advance(seconds=5)  # a retry is built later; its end date moves but the request is the same
+    assert bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 100000, 12), idempotency_key="c1")
+    with pytest.raises(IdempotencyConflictError):
+        bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 100000, 24), idempotency_key="c1")
@@ -0,0 +1,73 @@
+"""
+File Name: tests/test_importer.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: CSV account import loads valid rows in one batch and rejects bad rows by line number
+"""
+import csv
+
+from accounts.types import OverdraftAccount, SavingAccount, TimeDepositAccount
+from importer import IMPORT_FIELDS, import_accounts_csv
+
+
+ROWS = [
+    {"account_type": "normal", "username": "kim", "password": "1234", "interest_rate": "0.05",
+     "opening_balance": "1000"},
+    {"account_type": "Saving Account", "username": "lee", "password": "1234", "interest_rate": "0.03",
+     "monthly_amount": "10000", "contract_months": "12"},
+    {"account_type": "stock", "username": "park", "password": "1234", "interest_rate": "0.05"},
+    {"account_type": "timedeposit", "username": "choi", "password": "1234", "interest_rate": "0.04",
+     "deposit_period": "90"},
+    {"account_type": "normal", "username": "jung", "password": "1234", "interest_rate": "five"},
+    {"account_type": "normal", "username": "kang", "password": "1234", "interest_rate": "0.05",
+     "opening_balance": "10.5"},
+    {"account_type": "overdraft", "username": "yoon", "password": "1234", "interest_rate": "0.05",
+     "opening_balance": "-600", "overdraft_limit": "500"},
+    {"account_type": "overdraft", "username": "han", "password": "1234", "interest_rate": "0.05",
+     "opening_balance": "-500", "overdraft_limit": "500"},
+]
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=IMPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def test_valid_rows_load_and_bad_rows_are_rejected_by_line(bank, tmp_path):
+    result = import_accounts_csv(bank, write_csv(tmp_path / "accounts.csv", ROWS))
+    assert [acc.get_username() for acc in result.get_accounts()] == ["kim", "lee", "choi", "han"]
+    assert [type(acc) for acc in result.get_accounts()][1:] == [SavingAccount, TimeDepositAccount,
+                                                                OverdraftAccount]
+    rejected = dict(result.get_rejected_rows())
+    assert sorted(rejected) == [4, 6, 7, 8]  # header is line 1
+    assert rejected[4] == "Unknown account type: stock"
+    assert "five" in rejected[6]
+    assert "whole number" in rejected[7]
+    assert rejected[8] == "Opening balance exceeds overdraft limit (500)"
+
+    kim = next(bank.find_accounts_by_username("kim", exact=True))
+    assert kim.get_balance() == 1000
+    assert bank.get_account_by_number(result.get_accounts()[3].get_account_number()).get_balance() == -500
+    assert bank.get_total_overdraft() == 500
+
+
+def test_accounts_are_inserted_in_one_batch(bank, tmp_path, monkeypatch):
+    storage = bank.get_storage()
+    calls = []
+    original = storage.add_accounts
+
+    def add_accounts(accounts, events):
+        calls.append(len(accounts))
+        original(accounts, events)
+
+    monkeypatch.setattr(storage, "add_accounts", add_accounts)
+    result = import_accounts_csv(bank, write_csv(tmp_path / "accounts.csv", ROWS))
+    assert calls == [result.get_loaded_count()] == [4]
+
+
+def test_empty_file_loads_nothing(bank, tmp_path):
+    result = import_accounts_csv(bank, write_csv(tmp_path / "accounts.csv", []))
+    assert result.get_loaded_count() == result.get_rejected_count() == 0
@@ -0,0 +1,78 @@
+"""
+File Name: tests/test_leaderboard.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Top-balance and most-overdrawn leaderboards agree with a sort of the live balances
+"""
+import random
+
+from bank import Bank
+from leaderboard import BalanceLeaderboard
+from storage import SQLiteStorage
+from accounts.types import OverdraftAccount
+from conftest import PASSWORD, open_account
+
+
+def test_matches_sorted_balances_through_updates_and_removals():
+    rng = random.Random(11)
+    board = BalanceLeaderboard()
+    balances = {number: rng.randrange(-500, 500) for number in range(50)}
+    board.update_many(balances.items())
+    for _ in range(2000):
+        number = rng.randrange(60)
+        if number in balances and rng.random() < 0.1:
+            board.remove(number)
+            del balances[number]
+        else:
+            balances[number] = rng.randrange(-500, 500)
+            board.update(number, balances[number])
+        if rng.random() < 0.05:
+            by_balance = sorted(balances.items(), key=lambda item: item[1])
+            assert [b for _, b in board.largest(5)] == [b for _, b in by_balance[::-1][:5]]
+            assert [b for _, b in board.smallest(5)] == [b for _, b in by_balance[:5]]
+            assert all(balances[number] == b for number, b in board.largest(5) + board.smallest(5))
+    assert len(board) == len(balances)
+    negative = sorted(b for b in balances.values() if b < 0)
+    assert [b for _, b in board.smallest(len(balances), below=0)] == negative
+
+
+def test_reads_do_not_change_the_board():
+    board = BalanceLeaderboard()
+    board.update_many([(1, 10), (2, 30), (3, -5)])
+    assert board.largest(2) == board.largest(2) == [(2, 30), (1, 10)]
+    assert board.smallest(10, below=0) == [(3, -5)]
+    assert board.largest(0) == []
+
+
+def test_bank_leaderboards_follow_postings(bank):
+    rich = open_account(bank, "rich", 9000).get_account_number()
+    mid = open_account(bank, "mid", 500).get_account_number()
+    overdraft = bank.create_account(OverdraftAccount("od", PASSWORD, 0.05, 1000)).get_account_number()
+    deep = bank.create_account(OverdraftAccount("deep", PASSWORD, 0.05, 1000))
+    bank.withdraw(overdraft, 200, PASSWORD)
+    bank.withdraw(deep.get_account_number(), 900, PASSWORD)
+
+    def top(pairs):
+        return [(account.get_account_number(), balance) for account, balance in pairs]
+
+    assert top(bank.get_top_balances(2)) == [(rich, 9000), (mid, 500)]
+    assert top(bank.get_most_overdrawn()) == [(deep.get_account_number(), -900), (overdraft, -200)]
+    bank.transfer(rich, mid, 8000, PASSWORD)
+    bank.deposit(deep.get_account_number(), 900)
+    assert top(bank.get_top_balances(2)) == [(mid, 8500), (rich, 1000)]
+    assert top(bank.get_most_overdrawn()) == [(overdraft, -200)]
+    bank.remove_account(bank.get_account_by_number(mid))
+    assert top(bank.get_top_balances(1)) == [(rich, 1000)]
+
+
+def test_leaderboards_are_rebuilt_on_reopen(tmp_path, clock):
+    path = str(tmp_path / "bank.db")
+    bank = Bank(clock=clock, storage=SQLiteStorage(path))
+    numbers = [open_account(bank, f"user_{i}", 100 * i).get_account_number() for i in range(1, 6)]
+    overdraft = bank.create_account(OverdraftAccount("od", PASSWORD, 0.05, 1000)).get_account_number()
+    bank.withdraw(overdraft, 300, PASSWORD)
+    bank.close()
+    bank = Bank(clock=clock, storage=SQLiteStorage(path))
+    assert [account.get_account_number() for account, _ in bank.get_top_balances(3)] == numbers[:-4:-1]
+    assert [(account.get_account_number(), balance) for account, balance in bank.get_most_overdrawn()] == [
+        (overdraft, -300)]
@@ -0,0 +1,109 @@
+"""
+File Name: tests/test_ledger_chain.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Ledger hash chain verification, checkpoint signatures and tampering after a crash
+"""
+import sqlite3
+
+import pytest
+
+from bank import Bank
+from ledger_chain import ChainCheckpoint
+from storage import SQLiteStorage, TieredStorage
+from conftest import open_account
+
+
+KEY = b"test-ledger-key"
+
+
+def open_storage(kind, path):
+    if kind == "sqlite":
+        return SQLiteStorage(path, batch_size=1)
+    return TieredStorage(cold=SQLiteStorage(path, batch_size=1))
+
+
+def tamper(path, transaction_id, amount):
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("UPDATE transactions SET amount = ? WHERE id = ?", (amount, transaction_id))
+    connection.close()
+
+
+def test_untouched_ledger_verifies(bank):
+    number = open_account(bank, balance=500).get_account_number()
+    for _ in range(5):
+        bank.deposit(number, 100)
+    assert bank.verify_ledger()["valid"]
+    assert bank.audit_ledger(workers=1)["valid"]
+
+
+def test_checkpoints_without_key_are_unsigned(clock):
+    bank = Bank(clock=clock, chain_interval=2)
+    number = open_account(bank).get_account_number()
+    for _ in range(4):
+        bank.deposit(number, 100)
+    report = bank.audit_ledger(workers=1)
+    assert report["valid"]
+    assert report["signed"] is False
+    assert report["unsigned_checkpoints"]
+    assert all(cp.get_signature() is None for cp in bank.get_ledger_chain().get_checkpoints())
+
+
+def test_forged_checkpoint_signature_fails(clock, tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = Bank(clock=clock, storage=SQLiteStorage(path), ledger_key=KEY, chain_interval=2)
+    number = open_account(bank).get_account_number()
+    for _ in range(4):
+        bank.deposit(number, 100)
+    assert bank.audit_ledger(workers=1)["signed"] is True
+    bank.close()
+
+    # A checkpoint re-signed with another key (or with its signature stripped) is not trusted
+    storage = SQLiteStorage(path)
+    checkpoints = [ChainCheckpoint.from_dict(data) for data in storage.load_chain_checkpoints()]
+    forged = Bank(clock=clock, ledger_key=b"other-key").get_ledger_chain()
+    first = checkpoints[0]
+    storage.save_chain_checkpoints([
+        ChainCheckpoint(first.get_position(), first.get_head_hash(),
+                        forged.sign(first.get_position(), first.get_head_hash()), first.get_created_date()).to_dict()])
+    storage.close()
+    report = Bank(clock=clock, storage=SQLiteStorage(path), ledger_key=KEY, chain_interval=2).audit_ledger(workers=1)
+    assert not report["valid"]
+    assert first.get_position() in report["unsigned_checkpoints"]
+
+
+@pytest.mark.parametrize("kind", ("sqlite", "tiered"))
+def test_tampered_tail_after_crash_fails(kind, clock, tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = Bank(clock=clock, storage=open_storage(kind, path), ledger_key=KEY)
+    number = open_account(bank).get_account_number()
+    for _ in range(5):
+        bank.deposit(number, 100)
+    last_id = len(bank.get_ledger_chain())
+
+    # Crash before any checkpoint is sealed, then change a record written after it
+    tamper(path, last_id - 1, 9999)
+    recovered = Bank(clock=clock, storage=open_storage(kind, path), ledger_key=KEY)
+    report = recovered.verify_ledger()
+    assert not report["valid"]
+    assert report["failed_segments"]
+    assert not recovered.audit_ledger(workers=1)["valid"]
+
+    # Sealing on close does not launder the tampered record into a trusted checkpoint
+    recovered.close()
+    reopened = Bank(clock=clock, storage=open_storage(kind, path), ledger_key=KEY)
+    assert not reopened.audit_ledger(workers=1)["valid"]
+
+
+def test_untouched_tail_after_crash_verifies(clock, tmp_path):
+    path = str(tmp_path / "bank.db")
+    bank = Bank(clock=clock, storage=SQLiteStorage(path, batch_size=1), ledger_key=KEY)
+    number = open_account(bank).get_account_number()
+    for _ in range(5):
+        bank.deposit(number, 100)
+
+    recovered = Bank(clock=clock, storage=SQLiteStorage(path, batch_size=1), ledger_key=KEY)
+    assert recovered.verify_ledger()["valid"]
+    recovered.deposit(number, 100)
+    assert recovered.audit_ledger(workers=1)["valid"]
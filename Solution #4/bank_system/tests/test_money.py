@@ -0,0 +1,63 @@
+"""
+File Name: tests/test_money.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Money amounts stay whole int64 minor units and interest rounds half to even
+"""
+from datetime import datetime
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from bank import Bank
+from clock import SimulatedClock
+from exceptions import InvalidAmountError
+from money import INT64_MAX, INT64_MIN, interest_amount, to_minor
+from accounts.types import SavingAccount, TimeDepositAccount
+from conftest import PASSWORD
+
+
+@pytest.mark.parametrize("principal, expected", [(50, 2), (70, 4), (30, 2), (10, 0), (-50, -2)])
+def test_interest_ties_round_to_even(principal, expected):
+    # principal * 5% lands exactly on .5 for these principals
+    assert interest_amount(principal, 0.05) == expected
+
+
+def test_interest_is_exact_before_rounding():
+    assert interest_amount(1000, 0.1, Fraction(1, 3)) == 33
+    assert interest_amount(100000, 0.05, Fraction(30, 365), Fraction(1, 2)) == 205  # 205.47...
+    assert type(interest_amount(12345, "0.031", Fraction(7, 12))) is int
+
+
+@pytest.mark.parametrize("amount, expected", [(100, 100), ("250", 250), (" 7 ", 7), (Decimal("12.0"), 12),
+                                              (3.0, 3), (INT64_MAX, INT64_MAX), (INT64_MIN, INT64_MIN)])
+def test_to_minor_accepts_whole_amounts(amount, expected):
+    value = to_minor(amount)
+    assert value == expected and type(value) is int
+
+
+@pytest.mark.parametrize("amount", [0.5, "10.25", Decimal("1.1"), True, False, "ten", "", None, float("nan"),
+                                    float("inf"), INT64_MAX + 1, INT64_MIN - 1, str(INT64_MAX + 1)])
+def test_to_minor_rejects_fractions_bools_and_out_of_range(amount):
+    with pytest.raises(InvalidAmountError):
+        to_minor(amount)
+
+
+def test_balances_stay_int_after_interest_settlement():
+    clock = SimulatedClock(datetime(2020, 1, 1))
+    bank = Bank(clock=clock)
+    deposit = bank.create_account(TimeDepositAccount("kwanju", PASSWORD, 0.037, 30))
+    saving = bank.create_account(SavingAccount("kwanju", PASSWORD, 0.041, 3333, 12))
+    deposit.deposit(100001)
+    saving.deposit(3333)
+    clock.advance(days=31)
+    assert deposit.withdraw(0, PASSWORD) is True
+    assert saving.withdraw(0, PASSWORD) is True  # early termination
+    for account in (deposit, saving):
+        assert type(account.get_balance()) is int
+        assert all(type(t.get_amount()) is int for t in bank.get_transactions_by_account(account.get_account_number()))
+    settlement = bank.get_transactions_by_account(deposit.get_account_number())[1]
+    assert settlement.get_transaction_type() == "Contract Termination"
+    assert settlement.get_amount() == 304  # 100001 * 3.7% * 30/365, rounded
+    assert type(bank.get_total_balance()) is int
@@ -0,0 +1,82 @@
+"""
+File Name: tests/test_projections.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Account state rebuilt from the ledger and account events; events stay out of user-visible history
+"""
+from datetime import timedelta
+
+from bank import Bank
+from exporter import export_transactions
+from projections import UserTotals
+from accounts.base import BankAccount
+from accounts.types import SavingAccount
+from conftest import PASSWORD, open_account
+
+
+def test_account_events_stay_out_of_history(bank, capsys, tmp_path):
+    first = open_account(bank, "first", 1000)
+    second = open_account(bank, "second", 0)
+    bank.deposit(first.get_account_number(), 100)
+    gone = open_account(bank, "gone", 0)
+    bank.remove_account(gone)
+
+    transactions = list(bank.iter_transactions())
+    assert [(t.get_transaction_id(), t.get_transaction_type()) for t in transactions] == [(1, "Deposit")]
+    assert bank.get_transactions_by_account(second.get_account_number()) == []
+    assert bank.get_transactions_by_username("gone") == []
+    assert bank.query().run() == {(): {"count": 1, "sum": 100}}
+    assert list(bank.get_period_summary(group_by=("transaction_type",))) == [("Deposit",)]
+    assert [acc.get_account_number() for acc, _ in bank.get_most_active(5)] == [first.get_account_number()]
+    assert export_transactions(bank, str(tmp_path / "ledger.csv")) == 1
+
+    capsys.readouterr()
+    bank.show_all_transactions()
+    assert "Account Opened" not in capsys.readouterr().out
+
+
+def test_add_accounts_posts_no_ledger_entries(bank):
+    accounts = bank.add_accounts(BankAccount(f"user_{i}", PASSWORD, 0.01) for i in range(50))
+    assert len(bank.get_all_transactions()) == 0
+    states = bank.project_accounts(workers=1)
+    assert sorted(states) == sorted(acc.get_account_number() for acc in accounts)
+
+
+def test_projections_rebuild_accounts(backend, clock):
+    bank = Bank(clock=clock, storage=backend.open())
+    rich = open_account(bank, "kwanju", 5000)
+    idle = open_account(bank, "kwanju", 300)
+    gone = open_account(bank, "other", 0)
+    bank.deposit(rich.get_account_number(), 250)
+    bank.transfer(rich.get_account_number(), gone.get_account_number(), 50, PASSWORD)
+    bank.remove_account(gone)
+    if backend.persistent:
+        bank.close()
+        bank = Bank(clock=clock, storage=backend.open())
+
+    totals = UserTotals()
+    states = bank.project_accounts(workers=1, read_models=(totals,))
+    assert states[idle.get_account_number()].get_opening_balance() == 300
+    assert states[idle.get_account_number()].get_transaction_count() == 0
+    assert states[rich.get_account_number()].get_balance() == 5200
+    assert states[gone.get_account_number()].is_closed()
+    assert totals.get_result() == {"kwanju": {"accounts": 2, "balance": 5500}}
+    assert bank.verify_projections(workers=1) == []
+
+
+def test_conversion_survives_compaction(clock):
+    bank = Bank(clock=clock)
+    saving = bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 10000, 12))
+    number = saving.get_account_number()
+    bank.deposit(number, 10000)
+    clock.advance(days=400)
+    converted = bank.convert_contract_account(saving, PASSWORD)
+    assert converted.get_account_type() == "BankAccount"
+    clock.advance(days=400)
+    assert bank.compact_history(clock.now() - timedelta(days=395))[1] >= 2
+    assert bank.get_transactions_by_account(number) == []
+
+    state = bank.project_accounts(workers=1)[number]
+    assert state.get_account_type() == "BankAccount"
+    assert state.get_total_deposited() is None
+    assert bank.verify_projections(workers=1) == []
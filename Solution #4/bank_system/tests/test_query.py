@@ -0,0 +1,122 @@
+"""
+File Name: tests/test_query.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Ad-hoc queries pick the narrowest index and aggregate like a plain ledger scan
+"""
+import random
+from datetime import timedelta
+
+import pytest
+
+from query import percentile
+from conftest import PASSWORD, open_account
+
+
+@pytest.fixture
+def ledger(bank, clock):
+    rng = random.Random(5)
+    numbers = [open_account(bank, f"user_{i % 3}", 100000).get_account_number() for i in range(6)]
+    day_0 = clock.now()
+    for _ in range(120):
+        number = rng.choice(numbers)
+        if rng.random() < 0.6:
+            bank.deposit(number, rng.randrange(1, 5000))
+        else:
+            bank.withdraw(number, rng.randrange(1, 500), PASSWORD)
+        clock.advance(seconds=3600 * 5)
+    return bank, day_0, numbers
+
+
+def scan(bank, start=None, end=None, **filters):
+    rows = []
+    for t in bank.get_all_transactions():
+        if start is not None and t.get_transaction_date() < start:
+            continue
+        if end is not None and t.get_transaction_date() >= end:
+            continue
+        if any(getattr(t, f"get_{field}")() != value for field, value in filters.items()):
+            continue
+        rows.append(t)
+    return rows
+
+
+def test_explain_picks_the_narrowest_index(ledger):
+    bank, day_0, numbers = ledger
+    assert bank.query().explain() == "full scan: 120 candidate rows"
+    start = day_0 + timedelta(days=10)
+    assert bank.query().where(start=start).explain() == f"time index: {len(scan(bank, start))} candidate rows"
+    by_account = len(scan(bank, account_number=numbers[0]))
+    assert bank.query().where(account_number=numbers[0], username="user_0").explain() == (
+        f"account index: {by_account} candidate rows")
+    assert bank.query().where(username="user_1", start=start).explain().startswith("username index + time range")
+
+
+@pytest.mark.parametrize("filters", [
+    {"transaction_type": "Deposit"},
+    {"username": "user_2", "transaction_type": "Withdrawal"},
+    {"account_number": 1, "username": "user_1"},
+    {"account_number": 1, "username": "user_0"},
+    {"username": "nobody"},
+])
+def test_filters_match_a_ledger_scan(ledger, filters):
+    bank, day_0, numbers = ledger
+    filters = dict(filters)
+    if "account_number" in filters:
+        filters["account_number"] = numbers[filters["account_number"]]
+    start, end = day_0 + timedelta(days=3), day_0 + timedelta(days=20)
+    query = bank.query().where(start=start, end=end, **filters)
+    expected = scan(bank, start, end, **filters)
+    assert list(query.transactions()) == expected
+    assert list(query.where(min_amount=100, max_amount=1000).transactions()) == [
+        t for t in expected if 100 <= t.get_amount() <= 1000]
+
+
+def test_grouped_aggregates_and_percentiles(ledger):
+    bank, *_ = ledger
+    result = bank.query().group_by("username", "transaction_type").aggregate(
+        "count", "sum", "mean", "min", "max", "p50", "p95").run()
+    for (username, transaction_type), row in result.items():
+        amounts = sorted(t.get_amount() for t in scan(bank, username=username, transaction_type=transaction_type))
+        assert row["count"] == len(amounts) and row["sum"] == sum(amounts)
+        assert row["mean"] == sum(amounts) / len(amounts)
+        assert (row["min"], row["max"]) == (amounts[0], amounts[-1])
+        assert row["p50"] == percentile(amounts, 50)
+        assert amounts[0] <= row["p95"] <= amounts[-1]
+    assert sum(row["count"] for row in result.values()) == 120
+
+
+def test_group_by_day(ledger):
+    bank, day_0, _ = ledger
+    result = bank.query().group_by("day").aggregate("count").run()
+    assert result[(day_0.date(),)]["count"] == len(scan(bank, day_0, day_0.replace(hour=0) + timedelta(days=1)))
+    assert sum(row["count"] for row in result.values()) == 120
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([10], 95) == 10
+    assert percentile([10, 20, 30, 40], 50) == 25
+    assert percentile([10, 20, 30, 40], 100) == 40
+    assert percentile([10, 20, 30, 40], 0) == 10
+
+
+@pytest.mark.parametrize("call", [
+    lambda q: q.where(amount=5),
+    lambda q: q.group_by("balance"),
+    lambda q: q.aggregate("median"),
+    lambda q: q.aggregate("p101"),
+])
+def test_unknown_names_are_rejected(bank, call):
+    with pytest.raises(ValueError):
+        call(bank.query())
+
+
+def test_compacted_rows_are_skipped(bank, clock):
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 300)
+    clock.advance(days=40)
+    bank.deposit(number, 5)
+    bank.compact_history(clock.now() - timedelta(days=1))
+    assert bank.query().run() == {(): {"count": 1, "sum": 5}}
+    assert [t.get_amount() for t in bank.query().where(account_number=number).transactions()] == [5]
@@ -0,0 +1,59 @@
+"""
+File Name: tests/test_reconcile.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Parallel balance reconciliation finds balances that disagree with the ledger
+"""
+from datetime import timedelta
+
+import pytest
+
+from bank import Bank
+from conftest import PASSWORD, open_account
+
+
+def post_transfers(bank, count=6):
+    numbers = [open_account(bank, f"user_{i}", 1000 * (i + 1)).get_account_number() for i in range(count)]
+    for i, number in enumerate(numbers):
+        bank.deposit(number, 100 + i)
+        bank.transfer(number, numbers[(i + 1) % count], 50, PASSWORD)
+    return numbers
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 200000), (1, 3), (2, 5)])
+def test_clean_ledger_reconciles(bank, workers, chunk_size):
+    numbers = post_transfers(bank)
+    report = bank.reconcile_balances(workers=workers, chunk_size=chunk_size)
+    assert report["mismatches"] == []
+    assert report["accounts_checked"] == len(numbers)
+    assert report["entries_matched"] == report["ledger_rows_scanned"] == 3 * len(numbers)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_balance_change_outside_the_ledger_is_reported(bank, workers):
+    numbers = post_transfers(bank)
+    account = bank.get_account_by_number(numbers[2])
+    account._apply_balance_change(7)
+    report = bank.reconcile_balances(workers=workers, partitions=3, chunk_size=4)
+    assert [(row["account_number"], row["difference"]) for row in report["mismatches"]] == [(numbers[2], 7)]
+    assert not bank.verify_account_history(account)
+
+
+def test_compacted_accounts_reconcile_from_their_checkpoint(bank, clock):
+    numbers = post_transfers(bank)
+    clock.advance(days=30)
+    bank.deposit(numbers[0], 1)
+    accounts, compacted = bank.compact_history(clock.now() - timedelta(days=1))
+    assert accounts == len(numbers) and compacted == 3 * len(numbers)
+    assert bank.reconcile_balances(workers=1)["mismatches"] == []
+
+
+def test_rows_missing_from_storage_are_reported(backend, clock):
+    bank = Bank(clock=clock, storage=backend.open())
+    numbers = post_transfers(bank)
+    deposit = next(t for t in bank.get_transactions_by_account(numbers[1]) if t.get_transaction_type() == "Deposit")
+    bank.get_storage().discard_transactions([deposit.get_transaction_id() - 1])
+    report = bank.reconcile_balances(workers=1)
+    assert [(row["account_number"], row["difference"]) for row in report["mismatches"]] == [
+        (numbers[1], deposit.get_amount())]
+    assert report["ledger_rows_scanned"] == 3 * len(numbers) - 1
@@ -0,0 +1,72 @@
+"""
+File Name: tests/test_reversals.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Reversals undo both legs of a transfer, once, and never touch contract accounts
+"""
+import pytest
+
+from accounts.types import TimeDepositAccount
+from exceptions import ContractValueError
+from conftest import PASSWORD, open_account
+
+
+def test_reversing_either_leg_reverses_the_transfer(bank):
+    src = open_account(bank, "src", 1000).get_account_number()
+    dst = open_account(bank, "dst").get_account_number()
+    bank.transfer(src, dst, 300, PASSWORD)
+    transfer_in = bank.get_transactions_by_account(dst)[0]
+    transfer_out = bank.get_transaction(transfer_in.get_transaction_id() - 1)
+    assert transfer_in.get_transaction_type() == "Transfer In"
+
+    reversal = bank.reverse(transfer_in.get_transaction_id())
+    assert reversal.get_details() == {"reverses": transfer_in.get_transaction_id()}
+    assert bank.get_account_by_number(src).get_balance() == 1000
+    assert bank.get_account_by_number(dst).get_balance() == 0
+    assert bank.is_reversed(transfer_in.get_transaction_id()) and bank.is_reversed(transfer_out.get_transaction_id())
+    reversed_ids = [t.get_details()["reverses"] for t in bank.get_all_transactions()
+                    if t.get_transaction_type() == "Reversal"]
+    assert sorted(reversed_ids) == [transfer_out.get_transaction_id(), transfer_in.get_transaction_id()]
+    assert bank.verify_account_history(bank.get_account_by_number(src))
+
+
+def test_reversal_gets_its_own_transaction_id(bank):
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 500)
+    deposit = bank.get_transactions_by_account(number)[0]
+    reversal = bank.reverse(deposit.get_transaction_id())
+    assert reversal.get_transaction_id() not in (None, deposit.get_transaction_id())
+    assert bank.get_transaction(reversal.get_transaction_id()) is reversal
+    assert bank.get_account_by_number(number).get_balance() == 0
+
+
+@pytest.mark.parametrize("leg", [0, 1])
+def test_double_reversal_is_refused(bank, leg):
+    src = open_account(bank, "src", 1000).get_account_number()
+    dst = open_account(bank, "dst").get_account_number()
+    bank.transfer(src, dst, 300, PASSWORD)
+    first = len(bank.get_all_transactions()) - 1
+    bank.reverse(first)
+    posted = len(bank.get_all_transactions())
+    with pytest.raises(ValueError, match="already reversed"):
+        bank.reverse(first + leg)  # either leg of the same transfer
+    assert len(bank.get_all_transactions()) == posted
+    assert bank.get_account_by_number(src).get_balance() == 1000
+
+
+def test_reversals_themselves_cannot_be_reversed(bank):
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 500)
+    reversal = bank.reverse(1)
+    with pytest.raises(ValueError):
+        bank.reverse(reversal.get_transaction_id())
+
+
+def test_contract_account_postings_are_refused(bank):
+    account = bank.create_account(TimeDepositAccount("td", PASSWORD, 0.05, 30))
+    account.deposit(1000)
+    deposit = bank.get_transactions_by_account(account.get_account_number())[0]
+    with pytest.raises(ContractValueError):
+        bank.reverse(deposit.get_transaction_id())
+    assert account.get_balance() == 1000
+    assert not bank.is_reversed(deposit.get_transaction_id())
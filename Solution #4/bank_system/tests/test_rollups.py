@@ -0,0 +1,78 @@
+"""
+File Name: tests/test_rollups.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Daily rollups and period summaries match the postings, through compaction and reopen
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from bank import Bank
+from rollups import DailyRollups
+from accounts.types import OverdraftAccount
+from conftest import PASSWORD, open_account
+
+
+@pytest.fixture
+def posted(bank, clock):
+    normal = open_account(bank, "kim").get_account_number()
+    overdraft = bank.create_account(OverdraftAccount("lee", PASSWORD, 0.05, 1000)).get_account_number()
+    day_0 = clock.now().date()
+    bank.deposit(normal, 300)
+    bank.deposit(normal, 100)
+    bank.withdraw(overdraft, 50, PASSWORD)
+    clock.advance(days=1)
+    bank.deposit(normal, 700)
+    bank.transfer(normal, overdraft, 200, PASSWORD)
+    return bank, day_0, normal, overdraft
+
+
+def test_daily_rollup_cells(posted):
+    bank, day_0, *_ = posted
+    assert bank.get_daily_rollup(day_0) == {
+        ("Deposit", "BankAccount"): {"count": 2, "sum": 400, "min": 100, "max": 300},
+        ("Withdrawal", "OverdraftAccount"): {"count": 1, "sum": 50, "min": 50, "max": 50},
+    }
+    day_1 = bank.get_daily_rollup(day_0 + timedelta(days=1))
+    assert day_1[("Transfer In", "OverdraftAccount")]["sum"] == 200
+    assert bank.get_daily_rollup(day_0 - timedelta(days=1)) == {}
+
+
+def test_period_summary_groups(posted):
+    bank, day_0, *_ = posted
+    assert bank.get_period_summary(group_by=("transaction_type",))[("Deposit",)] == {
+        "count": 3, "sum": 1100, "min": 100, "max": 700}
+    assert bank.get_period_summary(day_0 + timedelta(days=1), group_by=()) == {
+        (): {"count": 3, "sum": 1100, "min": 200, "max": 700}}
+    assert bank.get_period_summary(end_day=day_0, group_by=("account_type",))[("OverdraftAccount",)]["count"] == 1
+    with pytest.raises(ValueError):
+        bank.get_period_summary(group_by=("username",))
+
+
+def test_rollups_survive_compaction_and_reopen(backend, clock):
+    bank = Bank(clock=clock, storage=backend.open())
+    number = open_account(bank).get_account_number()
+    day_0 = clock.now().date()
+    bank.deposit(number, 300)
+    bank.deposit(number, 100)
+    clock.advance(days=40)
+    bank.deposit(number, 5)
+    before = bank.get_period_summary()
+    _, compacted = bank.compact_history(clock.now() - timedelta(days=1))
+    assert compacted == 2
+    assert bank.get_period_summary() == before
+    if backend.persistent:
+        bank.close()
+        bank = Bank(clock=clock, storage=backend.open())
+    assert bank.get_daily_rollup(day_0) == {("Deposit", "BankAccount"): {"count": 2, "sum": 400, "min": 100,
+                                                                         "max": 300}}
+    assert bank.get_period_summary() == before
+
+
+def test_out_of_order_days_stay_sorted():
+    rollups = DailyRollups()
+    for d in (date(2020, 1, 3), date(2020, 1, 1), date(2020, 1, 2)):
+        rollups.add_cell(d, ("Deposit", "BankAccount"), 1, 10, 10, 10)
+    assert rollups.get_days() == [date(2020, 1, 1), date(2020, 1, 2), date(2020, 1, 3)]
+    assert rollups.summarize(date(2020, 1, 2))[("Deposit", "BankAccount")]["count"] == 2
@@ -0,0 +1,70 @@
+"""
+File Name: tests/test_snapshots.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Copy-on-write bank snapshots keep accounts, balances and the ledger as of the snapshot
+"""
+from datetime import timedelta
+
+import pytest
+
+from bank import Bank
+from accounts.types import SavingAccount
+from conftest import PASSWORD, open_account
+
+
+def test_snapshot_keeps_state_while_bank_changes(bank):
+    first = open_account(bank, "first", 1000)
+    second = open_account(bank, "second", 500)
+    with bank.snapshot() as snapshot:
+        bank.deposit(first.get_account_number(), 250)
+        bank.transfer(first.get_account_number(), second.get_account_number(), 100, PASSWORD)
+        bank.remove_account(second)
+        late = open_account(bank, "late", 70)
+
+        assert snapshot.get_account_by_number(first.get_account_number()).get_balance() == 1000
+        assert snapshot.get_account_by_number(second.get_account_number()).get_balance() == 500
+        assert snapshot.get_account_by_number(late.get_account_number()) is None
+        assert snapshot.get_account_by_number(12345678) is None
+        assert snapshot.get_total_balance() == 1500
+        assert sorted(balance for _, balance in snapshot.iter_balances()) == [500, 1000]
+        assert list(snapshot.iter_transactions()) == []
+        assert snapshot.get_transaction_count() == 0
+    assert bank.get_open_snapshot_count() == 0
+    assert bank.get_total_balance() == 1220
+
+
+def test_snapshot_copies_only_changed_accounts(bank):
+    numbers = [open_account(bank, f"user_{i}", 100).get_account_number() for i in range(10)]
+    with bank.snapshot() as snapshot:
+        bank.deposit(numbers[3], 1)
+        bank.deposit(numbers[3], 1)
+        assert snapshot.get_preserved_count() == 1
+        frozen = snapshot.get_account_by_number(numbers[3])
+        bank.deposit(numbers[3], 1)
+        assert frozen.get_balance() == 100
+
+
+def test_snapshot_keeps_contract_account_before_conversion(clock):
+    bank = Bank(clock=clock)
+    saving = bank.create_account(SavingAccount("kwanju", PASSWORD, 0.05, 10000, 12))
+    number = saving.get_account_number()
+    bank.deposit(number, 10000)
+    with bank.snapshot() as snapshot:
+        clock.advance(days=400)
+        bank.convert_contract_account(saving, PASSWORD)
+        assert snapshot.get_account_by_number(number).get_account_type() == "SavingAccount"
+        assert bank.get_account_by_number(number).get_account_type() == "BankAccount"
+
+
+def test_compaction_waits_for_open_snapshots(bank, clock):
+    number = open_account(bank, "kwanju", 0).get_account_number()
+    for _ in range(3):
+        bank.deposit(number, 100)
+    clock.advance(days=30)
+    horizon = clock.now() - timedelta(days=1)
+    with bank.snapshot() as snapshot:
+        with pytest.raises(ValueError):
+            bank.compact_history(horizon)
+        assert len(list(snapshot.iter_transactions())) == snapshot.get_transaction_count() == 3
+    assert bank.compact_history(horizon) == (1, 3)
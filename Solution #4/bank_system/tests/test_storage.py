@@ -0,0 +1,136 @@
+"""
+File Name: tests/test_storage.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: The same bank behaviour against every storage backend, including reopen and crash recovery
+"""
+from datetime import timedelta
+
+import pytest
+
+from bank import Bank
+from conftest import PASSWORD, open_account
+
+
+def make_bank(backend, clock, batch_size=1000):
+    return Bank(clock=clock, storage=backend.open(batch_size))
+
+
+def reopen(bank, backend, clock):
+    if not backend.persistent:
+        return bank
+    bank.close()
+    return make_bank(backend, clock)
+
+
+def test_round_trip(backend, clock):
+    bank = make_bank(backend, clock)
+    first = open_account(bank, "first", 5000)
+    second = open_account(bank, "second", 100)
+    bank.deposit(first.get_account_number(), 700)
+    bank.transfer(first.get_account_number(), second.get_account_number(), 1200, PASSWORD)
+    count = len(bank.get_all_transactions())
+
+    bank = reopen(bank, backend, clock)
+    assert bank.get_account_by_number(first.get_account_number()).get_balance() == 4500
+    assert bank.get_account_by_number(second.get_account_number()).get_balance() == 1300
+    assert bank.get_total_balance() == 5800
+    assert len(bank.get_all_transactions()) == count
+    assert [t.get_transaction_id() for t in bank.iter_transactions()] == list(range(1, count + 1))
+    assert not bank.reconcile_balances(workers=1)["mismatches"]
+
+
+def test_removed_account_stays_removed(backend, clock):
+    bank = make_bank(backend, clock)
+    keep = open_account(bank, "keep", 100)
+    gone = open_account(bank, "gone", 200)
+    bank.remove_account(gone)
+
+    bank = reopen(bank, backend, clock)
+    assert bank.get_account_by_number(gone.get_account_number()) is None
+    assert [acc.get_account_number() for acc in bank.iter_accounts()] == [keep.get_account_number()]
+    assert bank.get_total_balance() == 100
+
+
+def test_compaction_survives_reopen(backend, clock):
+    bank = make_bank(backend, clock)
+    account = open_account(bank, "kwanju", 1000)
+    number = account.get_account_number()
+    for _ in range(5):
+        bank.deposit(number, 100)
+    clock.advance(days=30)
+    bank.deposit(number, 1)
+
+    accounts, compacted = bank.compact_history(clock.now() - timedelta(days=1))
+    assert (accounts, compacted) == (1, 5)
+    assert [t.get_amount() for t in bank.get_transactions_by_account(number)] == [1]
+
+    bank = reopen(bank, backend, clock)
+    account = bank.get_account_by_number(number)
+    assert account.get_balance() == 1501
+    assert bank.get_checkpoint(number).get_balance() == 1500
+    assert bank.verify_account_history(account)
+    assert [t.get_amount() for t in bank.get_transactions_by_account(number)] == [1]
+    assert not bank.reconcile_balances(workers=1)["mismatches"]
+
+
+def test_idempotency_key_survives_reopen(backend, clock):
+    bank = make_bank(backend, clock)
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 1000, idempotency_key="k1")
+
+    bank = reopen(bank, backend, clock)
+    assert bank.deposit(number, 1000, idempotency_key="k1") is True
+    assert bank.get_account_by_number(number).get_balance() == 1000
+
+
+def test_idempotency_key_is_written_with_its_ledger_batch(backend, clock):
+    if not backend.persistent:
+        pytest.skip("memory storage does not survive a crash")
+    bank = make_bank(backend, clock, batch_size=1)
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 1000, idempotency_key="k1")
+
+    # Crash: reopen the file without closing the bank
+    recovered = make_bank(backend, clock)
+    assert recovered.deposit(number, 1000, idempotency_key="k1") is True
+    assert recovered.get_account_by_number(number).get_balance() == 1000
+    assert len(recovered.get_transactions_by_account(number)) == len(bank.get_transactions_by_account(number))
+
+
+def test_evicted_idempotency_keys_are_deleted(backend, clock):
+    bank = make_bank(backend, clock)
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 10, idempotency_key="old")
+    clock.advance(days=2)  # past the default one day TTL
+    bank.deposit(number, 10, idempotency_key="new")
+    bank.flush()
+    keys = [entry[0] for entry in bank.get_storage().load_idempotency_entries()]
+    assert keys == (["new"] if backend.persistent else [])
+
+
+def test_total_balance_writes_accounts_with_their_ledger_batch(backend, clock):
+    if not backend.persistent:
+        pytest.skip("memory storage does not survive a crash")
+    bank = make_bank(backend, clock, batch_size=1000)
+    number = open_account(bank).get_account_number()
+    for _ in range(10):
+        bank.deposit(number, 100)
+    assert bank.get_total_balance() == 1000
+
+    # Crash: whatever reached the file must still reconcile
+    recovered = make_bank(backend, clock)
+    assert not recovered.reconcile_balances(workers=1)["mismatches"]
+    balance = recovered.get_account_by_number(number).get_balance()
+    assert balance == 100 * len(recovered.get_transactions_by_account(number))
+
+
+def test_removed_account_number_is_not_reissued_after_reopen(backend, clock, monkeypatch):
+    bank = make_bank(backend, clock)
+    account = open_account(bank)  # no opening balance, so no ledger rows
+    number = account.get_account_number()
+    bank.remove_account(account)
+    bank = reopen(bank, backend, clock)
+    candidates = iter([number, 12345678])
+    monkeypatch.setattr("bank.random.randint", lambda low, high: next(candidates))
+    assert bank.generate_unique_account_number() == 12345678
@@ -0,0 +1,49 @@
+"""
+File Name: tests/test_tiered_storage.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Tiered storage keeps recently used accounts in memory and faults evicted ones back from disk
+"""
+import pytest
+
+from bank import Bank
+from storage import SQLiteStorage, TieredStorage
+from storage.tiered import estimate_account_size
+from conftest import open_account
+
+
+def test_hot_tier_stays_within_budget(clock, tmp_path):
+    probe = Bank(clock=clock)
+    budget = 5 * estimate_account_size(open_account(probe))
+    storage = TieredStorage(cold=SQLiteStorage(str(tmp_path / "bank.db")), memory_budget=budget)
+    bank = Bank(clock=clock, storage=storage)
+    numbers = [open_account(bank, f"user_{i}", 100).get_account_number() for i in range(40)]
+    stats = storage.get_stats()
+    assert stats["hot_bytes"] <= budget
+    assert stats["hot_accounts"] < 40 and stats["evictions"] > 0
+
+    # Evicted accounts come back from disk with every change
+    bank.deposit(numbers[0], 55)
+    for number in numbers[1:]:
+        bank.get_account_by_number(number)
+    assert bank.get_account_by_number(numbers[0]).get_balance() == 155
+    assert storage.get_stats()["misses"] > 0
+    assert bank.get_total_balance() == 40 * 100 + 55
+
+
+def test_full_scans_do_not_promote(clock, tmp_path):
+    storage = TieredStorage(cold=SQLiteStorage(str(tmp_path / "bank.db")))
+    bank = Bank(clock=clock, storage=storage)
+    hot = open_account(bank, "hot").get_account_number()
+    for i in range(20):
+        open_account(bank, f"user_{i}")
+    before = storage.get_stats()["hot_accounts"]
+    assert len(list(bank.iter_accounts())) == 21
+    assert storage.get_stats()["hot_accounts"] == before
+    assert bank.get_account_by_number(hot) is not None
+    assert storage.get_stats()["hits"] >= 1
+
+
+def test_budget_must_be_positive():
+    with pytest.raises(ValueError):
+        TieredStorage(memory_budget=0)
@@ -0,0 +1,66 @@
+"""
+File Name: tests/test_time_index.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Time-range queries page by date, account and username through the time index
+"""
+from datetime import timedelta
+
+import pytest
+
+import time_index
+from conftest import PASSWORD, open_account
+
+
+@pytest.fixture
+def dated(bank, clock):
+    """Ten days with one posting per account per day; kim owns two accounts"""
+    kim_1 = open_account(bank, "kim", 10000).get_account_number()
+    kim_2 = open_account(bank, "kim").get_account_number()
+    lee = open_account(bank, "lee").get_account_number()
+    day_0 = clock.now()
+    for _ in range(10):
+        bank.transfer(kim_1, kim_2, 10, PASSWORD)  # kim_1 out, kim_2 in
+        bank.transfer(kim_1, lee, 10, PASSWORD)  # kim_1 out, lee in
+        clock.advance(days=1)
+    return bank, day_0, kim_1, kim_2, lee
+
+
+def test_paging_by_time_range(dated):
+    bank, day_0, *_ = dated
+    start, end = day_0 + timedelta(days=2), day_0 + timedelta(days=5)
+    assert bank.count_transactions_between(start, end) == 12
+    pages = [bank.get_transactions_between(start, end, offset=offset, limit=5) for offset in (0, 5, 10)]
+    assert [len(page) for page in pages] == [5, 5, 2]
+    ids = [t.get_transaction_id() for page in pages for t in page]
+    assert ids == list(range(9, 21))  # four postings a day
+    assert bank.get_transactions_between(start, end, offset=12, limit=5) == []
+
+
+def test_paging_by_account_and_username(dated):
+    bank, day_0, kim_1, kim_2, lee = dated
+    start = day_0 + timedelta(days=3)
+    assert bank.count_transactions_between(start, account_number=kim_1) == 14
+    assert bank.count_transactions_between(start, username="kim") == 21
+    assert bank.count_transactions_between(start, username="lee") == 7
+    page = bank.get_transactions_between(start, account_number=lee, offset=2, limit=3)
+    assert [t.get_transaction_type() for t in page] == ["Transfer In"] * 3
+    assert [t.get_transaction_date() for t in page] == [day_0 + timedelta(days=d) for d in (5, 6, 7)]
+
+
+def test_account_and_username_together_intersect_positions(dated, monkeypatch):
+    bank, day_0, kim_1, kim_2, lee = dated
+    start, end = day_0 + timedelta(days=1), day_0 + timedelta(days=9)
+    monkeypatch.setattr(bank, "_transactions_at", None)  # counting must not read transactions
+    assert bank.count_transactions_between(start, end, account_number=kim_2, username="kim") == 8
+    assert bank.count_transactions_between(start, end, account_number=lee, username="kim") == 0
+    monkeypatch.undo()
+    page = bank.get_transactions_between(start, end, account_number=kim_2, username="kim", offset=6, limit=5)
+    assert [t.get_transaction_date() for t in page] == [day_0 + timedelta(days=d) for d in (7, 8)]
+    assert all(t.get_account_number() == kim_2 for t in page)
+
+
+def test_intersect_sorted_positions():
+    assert time_index._intersect([1, 4, 5, 9], [0, 4, 9, 10, 12]) == [4, 9]
+    assert time_index._intersect([], [1, 2]) == []
+    assert time_index._intersect([7], [1, 2, 3]) == []
@@ -0,0 +1,93 @@
+"""
+File Name: tests/test_transfers.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Transfers are all-or-nothing and batches net balance changes per account
+"""
+import pytest
+
+from accounts.base import BankAccount
+from accounts.types import OverdraftAccount, TimeDepositAccount
+from exceptions import ContractValueError, InvalidAmountError, InvalidPasswordError
+from conftest import PASSWORD, open_account
+
+
+def balances(bank, *numbers):
+    return [bank.get_account_by_number(number).get_balance() for number in numbers]
+
+
+def test_transfer_moves_money_and_posts_both_legs(bank):
+    src = open_account(bank, "src", 1000).get_account_number()
+    dst = open_account(bank, "dst").get_account_number()
+    transfer_id = bank.transfer(src, dst, 400, PASSWORD)
+    assert balances(bank, src, dst) == [600, 400]
+    legs = [t for t in bank.get_all_transactions() if (t.get_details() or {}).get("transfer_id") == transfer_id]
+    assert sorted((t.get_account_number(), t.get_transaction_type(), t.get_amount()) for t in legs) == sorted(
+        [(src, "Transfer Out", 400), (dst, "Transfer In", 400)])
+
+
+@pytest.mark.parametrize("dst, amount, password, error", [
+    ("dst", 1001, PASSWORD, InvalidAmountError),
+    ("dst", 0, PASSWORD, InvalidAmountError),
+    ("dst", 0.5, PASSWORD, InvalidAmountError),
+    ("dst", 100, "0000", InvalidPasswordError),
+    ("src", 100, PASSWORD, ValueError),
+    (12345678, 100, PASSWORD, ValueError),
+    ("deposit", 100, PASSWORD, ContractValueError),
+])
+def test_failed_transfer_changes_nothing(bank, dst, amount, password, error):
+    numbers = {"src": open_account(bank, "src", 1000).get_account_number(),
+               "dst": open_account(bank, "dst", 50).get_account_number(),
+               "deposit": bank.create_account(TimeDepositAccount("td", PASSWORD, 0.05, 30)).get_account_number()}
+    posted = len(bank.get_all_transactions())
+    with pytest.raises(error):
+        bank.transfer(numbers["src"], numbers.get(dst, dst), amount, password)
+    assert balances(bank, numbers["src"], numbers["dst"]) == [1000, 50]
+    assert len(bank.get_all_transactions()) == posted
+
+
+def test_overdraft_limit_is_enforced(bank):
+    src = bank.create_account(OverdraftAccount("od", PASSWORD, 0.05, overdraft_limit=500)).get_account_number()
+    dst = open_account(bank, "dst").get_account_number()
+    bank.transfer(src, dst, 300, PASSWORD)
+    bank.transfer(src, dst, 200, PASSWORD)  # exactly at the limit
+    with pytest.raises(InvalidAmountError):
+        bank.transfer(src, dst, 1, PASSWORD)
+    assert balances(bank, src, dst) == [-500, 500]
+
+
+def test_batch_nets_each_account_once(bank, monkeypatch):
+    a = open_account(bank, "a", 1000).get_account_number()
+    b = open_account(bank, "b").get_account_number()
+    c = open_account(bank, "c").get_account_number()
+    changes = []
+    original = BankAccount._apply_balance_change
+
+    def record(account, delta):
+        changes.append((account.get_account_number(), delta))
+        original(account, delta)
+
+    monkeypatch.setattr(BankAccount, "_apply_balance_change", record)
+    # b forwards money it only receives earlier in the same batch
+    results = bank.transfer_batch([(a, b, 700, PASSWORD), (b, c, 500, PASSWORD), (c, a, 100, PASSWORD)])
+    assert all(transfer_id is not None and error is None for transfer_id, error in results)
+    assert sorted(changes) == sorted([(a, -600), (b, 200), (c, 400)])
+    assert balances(bank, a, b, c) == [400, 200, 400]
+    assert len(bank.get_all_transactions()) == 6  # three linked pairs
+
+
+def test_batch_reports_errors_per_transfer(bank):
+    a = open_account(bank, "a", 1000).get_account_number()
+    b = open_account(bank, "b").get_account_number()
+    results = bank.transfer_batch([
+        (a, b, 600, PASSWORD),
+        (a, b, 600, PASSWORD),  # only 400 left after the first
+        (a, b, 100, "0000"),
+        (a, 12345678, 100, PASSWORD),
+        (b, a, 100, PASSWORD),
+    ])
+    assert [error is None for _, error in results] == [True, False, False, False, True]
+    assert "Insufficient balance." in results[1][1]
+    assert results[3][1] == "Account not found"
+    assert results[0][0] != results[4][0]
+    assert balances(bank, a, b) == [500, 500]
@@ -0,0 +1,70 @@
+"""
+File Name: tests/test_username_index.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Username index search stays correct through adds, bulk adds and removals
+"""
+import random
+
+import username_index
+from username_index import UsernameIndex
+from conftest import open_account
+
+
+def expected(entries, text, exact):
+    key = text.casefold()
+    return [number for name, number in sorted(entries)
+            if (name == key if exact else name.startswith(key))]
+
+
+def test_matches_a_sorted_list_through_random_changes(monkeypatch):
+    monkeypatch.setattr(username_index, "BLOCK_SIZE", 4)  # many small blocks
+    rng = random.Random(3)
+    index = UsernameIndex()
+    entries = set()
+    index.add_many([("Kim", 1), ("lee", 2)])
+    entries.update({("kim", 1), ("lee", 2)})
+    for number in range(3, 600):
+        name = rng.choice(["kim", "KIM", "kimberly", "lee", "park", "parker", "choi"]) + str(rng.randrange(5))
+        index.add(name, number)
+        entries.add((name.casefold(), number))
+        if rng.random() < 0.4:
+            gone = rng.choice(sorted(entries))
+            index.remove(gone[0], gone[1])
+            entries.discard(gone)
+    assert len(index) == len(entries)
+    for text in ("", "k", "Kim", "kim1", "kimberly3", "park", "parker0", "z", "choi4"):
+        assert list(index.search(text)) == expected(entries, text, False)
+        assert list(index.search(text, exact=True)) == expected(entries, text, True)
+
+
+def test_removing_an_unknown_entry_is_ignored():
+    index = UsernameIndex()
+    index.remove("nobody", 1)
+    index.add("kwanju", 1)
+    index.remove("kwanju", 2)
+    assert list(index.search("kwanju", exact=True)) == [1]
+
+
+def test_bank_search_by_username(bank):
+    kept = open_account(bank, "Kwanju")
+    gone = open_account(bank, "kwanju_2")
+    open_account(bank, "other")
+    bank.remove_account(gone)
+    assert [acc.get_account_number() for acc in bank.find_accounts_by_username("KWAN")] == [
+        kept.get_account_number()]
+
+
+def test_removal_marks_entries_until_half_are_removed(monkeypatch):
+    monkeypatch.setattr(username_index, "BLOCK_SIZE", 4)
+    index = UsernameIndex()
+    index.add_many([("user", number) for number in range(10)])
+    monkeypatch.setattr(username_index, "bisect_left", None)  # removal must not search the blocks
+    for number in range(5):
+        index.remove("user", number)
+    monkeypatch.undo()
+    assert list(index.search("user", exact=True)) == [5, 6, 7, 8, 9]
+    index.add("USER", 2)
+    index.remove("user", 5)  # more than half removed: blocks are rebuilt
+    assert len(index) == 5
+    assert list(index.search("us")) == [2, 6, 7, 8, 9]
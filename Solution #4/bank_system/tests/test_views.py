@@ -0,0 +1,35 @@
+"""
+File Name: tests/test_views.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Bank getters return live read-only views; snapshots return isolated copies
+"""
+import pytest
+
+from views import ReadOnlySequence
+from conftest import open_account
+
+
+def test_views_are_live_and_read_only(bank):
+    number = open_account(bank, "kim", 100).get_account_number()
+    accounts = bank.get_all_accounts()
+    transactions = bank.get_all_transactions()
+    assert isinstance(accounts, ReadOnlySequence) and isinstance(transactions, ReadOnlySequence)
+    assert len(transactions) == 0
+    bank.deposit(number, 50)
+    assert len(transactions) == 1 and transactions[0].get_amount() == 50
+    open_account(bank, "lee")
+    assert len(accounts) == 2
+    with pytest.raises(TypeError):
+        transactions[0] = None
+    assert not hasattr(accounts, "append")
+
+
+def test_snapshots_are_isolated_copies(bank):
+    number = open_account(bank).get_account_number()
+    bank.deposit(number, 50)
+    copy = bank.snapshot_transactions()
+    bank.deposit(number, 70)
+    assert [t.get_amount() for t in copy] == [50]
+    assert len(bank.get_all_transactions()) == 2
+    assert len(bank.snapshot_accounts()) == 1
@@ -0,0 +1,89 @@
+"""
+File Name: tests/test_writer.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Single-writer command queue: ordering, published read state and failure of the writer thread
+"""
+import threading
+
+import pytest
+
+from writer import BankWriter
+from accounts.base import BankAccount
+from conftest import PASSWORD, open_account
+
+
+def test_published_state_follows_operations(bank):
+    first = open_account(bank, "kwanju", 1000)
+    with BankWriter(bank, batch_size=4) as writer:
+        state = writer.get_state()
+        assert state.get_balance(first.get_account_number()) == 1000
+        assert state.get_account_numbers("kwanju") == (first.get_account_number(),)
+
+        second = writer.call("create_account", BankAccount("kwanju", PASSWORD, 0.05))
+        writer.call("transfer", first.get_account_number(), second.get_account_number(), 300, PASSWORD)
+        state = writer.get_state()
+        assert state.get_balance(first.get_account_number()) == 700
+        assert state.get_balance(second.get_account_number()) == 300
+        assert state.get_account_info(second.get_account_number()) == ("kwanju", "BankAccount")
+        assert set(state.get_account_numbers("kwanju")) == {first.get_account_number(),
+                                                            second.get_account_number()}
+        assert state.get_total_balance() == 1000
+        assert state.get_transaction_count() == 2
+
+        writer.call("remove_account", first)
+        state = writer.get_state()
+        assert state.get_balance(first.get_account_number()) is None
+        assert state.get_account_info(first.get_account_number()) is None
+        assert state.get_account_numbers("kwanju") == (second.get_account_number(),)
+        assert state.get_account_count() == 1
+        assert state.get_total_balance() == 300
+
+
+def test_operation_errors_reach_their_future_only(bank):
+    number = open_account(bank, "kwanju", 100).get_account_number()
+    with BankWriter(bank) as writer:
+        with pytest.raises(ValueError):
+            writer.call("reverse", 999)
+        assert writer.call("deposit", number, 50) is True
+        assert writer.get_error() is None
+    assert bank.get_account_by_number(number).get_balance() == 150
+
+
+def test_writer_failure_fails_every_future(bank):
+    number = open_account(bank, "kwanju", 100).get_account_number()
+    release = threading.Event()
+
+    def stop_the_writer(_):
+        release.wait()
+        raise SystemExit
+
+    writer = BankWriter(bank, batch_size=1)
+    fatal = writer.submit(stop_the_writer)
+    queued = [writer.submit("deposit", number, 10) for _ in range(3)]
+    release.set()
+    for future in [fatal] + queued:
+        with pytest.raises(RuntimeError) as info:
+            future.result(timeout=5)
+        assert isinstance(info.value.__cause__, SystemExit)
+    assert isinstance(writer.get_error(), SystemExit)
+    with pytest.raises(RuntimeError):
+        writer.submit("deposit", number, 10)
+    writer.close()
+    assert bank.get_account_by_number(number).get_balance() == 100
+
+
+def test_publish_failure_stops_the_writer(bank, monkeypatch):
+    number = open_account(bank, "kwanju", 100).get_account_number()
+    writer = BankWriter(bank)
+
+    def broken_publish(*args):
+        raise MemoryError
+
+    monkeypatch.setattr(BankWriter, "_publish", broken_publish)
+    with pytest.raises(RuntimeError):
+        writer.call("deposit", number, 10)
+    assert isinstance(writer.get_error(), MemoryError)
+    with pytest.raises(RuntimeError):
+        writer.submit("deposit", number, 10)
+    writer.close()
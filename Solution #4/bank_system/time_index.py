@@ -0,0 +1,157 @@
+"""
+File Name: time_index.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Time-ordered index over the transaction ledger
+Supports range queries by transaction date with optional account/username filters.
+"""
+from bisect import bisect_left
+from datetime import datetime
+
+
+def _bisect_positions(positions, times, value):
+    """Leftmost index in sorted ledger positions whose timestamp is >= value"""
+    lo, hi = 0, len(positions)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if times[positions[mid]] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _intersect(first, second):
+    """Positions found in both sorted position lists"""
+    if len(first) > len(second):
+        first, second = second, first
+    common = []
+    lo = 0
+    for p in first:
+        lo = bisect_left(second, p, lo)
+        if lo == len(second):
+            break
+        if second[lo] == p:
+            common.append(p)
+    return common
+
+
+class TransactionTimeIndex:
+    """Timestamp column plus per-account and per-username position lists"""
+
+    def __init__(self):
+        self.__times = []
+        self.__by_account = {}  # account number -> [positions]
+        self.__by_username = {}  # username -> [positions]
+        self.__removed = bytearray()  # 1 per removed position
+        self.__removed_total = 0
+
+    def append(self, timestamp, account_number, username):
+        """Index next ledger position; returns the position"""
+        position = self._append_time(timestamp)
+        self.__removed.append(0)
+        self.__by_account.setdefault(account_number, []).append(position)
+        self.__by_username.setdefault(username, []).append(position)
+        return position
+
+    def append_removed(self, timestamp=None):
+        """Index next ledger position as already removed (timestamp defaults to the previous one)"""
+        position = self._append_time(timestamp)
+        self.__removed.append(1)
+        self.__removed_total += 1
+        return position
+
+    def _append_time(self, timestamp):
+        position = len(self.__times)
+        if timestamp is None:
+            timestamp = self.__times[-1] if self.__times else datetime.min
+        elif self.__times and timestamp < self.__times[-1]:
+            timestamp = self.__times[-1]
+        self.__times.append(timestamp)
+        return position
+
+    def remove_positions(self, account_number, username, positions):
+        """Remove the oldest positions of an account (a prefix of its position list)"""
+        account_positions = self.__by_account.get(account_number, [])
+        if account_positions[:len(positions)] != list(positions):
+            raise ValueError("Only the oldest positions of an account can be removed")
+        del account_positions[:len(positions)]
+        removed = set(positions)
+        username_positions = self.__by_username.get(username)
+        if username_positions is not None:
+            username_positions[:] = [p for p in username_positions if p not in removed]
+        for p in positions:
+            self.__removed[p] = 1
+        self.__removed_total += len(positions)
+
+    def is_removed(self, position):
+        return self.__removed_total > 0 and self.__removed[position] == 1
+
+    def get_removed_total(self):
+        return self.__removed_total
+
+    def __len__(self):
+        return len(self.__times)
+
+    def positions_for_account(self, account_number):
+        return self.__by_account.get(account_number, [])
+
+    def positions_for_username(self, username):
+        return self.__by_username.get(username, [])
+
+    def query(self, start=None, end=None, account_number=None, username=None,
+              offset=0, limit=None):
+        """Ledger positions with start <= date < end in time order; returns (page, total)"""
+        if account_number is not None:
+            positions = self.positions_for_account(account_number)
+        elif username is not None:
+            positions = self.positions_for_username(username)
+        else:
+            positions = None
+
+        lo, hi = self.time_bounds(positions, start, end)
+        if account_number is not None and username is not None:
+            username_positions = self.positions_for_username(username)
+            user_lo, user_hi = self.time_bounds(username_positions, start, end)
+            positions = _intersect(positions[lo:hi], username_positions[user_lo:user_hi])
+            lo, hi = 0, len(positions)
+        total = hi - lo
+        if positions is None and self.__removed_total:
+            return self._live_range(lo, hi, offset, limit)
+        lo += offset
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        if positions is None:
+            return range(lo, max(lo, hi)), total
+        return positions[lo:max(lo, hi)], total
+
+    def _live_range(self, lo, hi, offset, limit):
+        """Paged non-removed positions in lo..hi-1, plus their total count"""
+        removed = self.__removed
+        total = (hi - lo) - removed.count(1, lo, hi)
+        live = []
+        for p in range(lo, hi):
+            if removed[p]:
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if limit is not None and len(live) >= limit:
+                break
+            live.append(p)
+        return live, total
+
+    def time_bounds(self, positions=None, start=None, end=None):
+        """Slice bounds (lo, hi) of sorted positions (None: the whole ledger) with start <= date < end"""
+        times = self.__times
+        if positions is None:
+            lo = 0 if start is None else bisect_left(times, start)
+            hi = len(times) if end is None else bisect_left(times, end)
+        else:
+            lo = 0 if start is None else _bisect_positions(positions, times, start)
+            hi = len(positions) if end is None else _bisect_positions(positions, times, end)
+        return lo, max(lo, hi)
+
+    def time_at(self, position):
+        """Indexed timestamp of a ledger position"""
+        return self.__times[position]
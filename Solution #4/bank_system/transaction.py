@@ -4,21 +4,39 @@ Created Date: 2025-07-19
 Programmer: Kwanju Eun
 Description: Transaction class for recording banking transactions
 """
-from datetime import datetime
+from clock import get_default_clock
+
+
+# Direction of each transaction type on the account balance.
+# Reversal amounts are stored already signed (negative for a debit).
+TRANSACTION_SIGNS = {
+    "Deposit": 1,
+    "Withdrawal": -1,
+    "Transfer In": 1,
+    "Transfer Out": -1,
+    "Contract Termination": 1,
+    "Reversal": 1,
+}
 
 
 class Transaction:
     """Represents a single banking transaction"""
     
-    def __init__(self, account_number, username, account_type, amount, transaction_type):
+    def __init__(self, account_number, username, account_type, amount, transaction_type, details=None,
+                 transaction_date=None, transaction_id=None):
+        self.__transaction_id = transaction_id  # Assigned by Bank
         self.__account_number = account_number
         self.__username = username
         self.__account_type = account_type
         self.__amount = amount
         self.__transaction_type = transaction_type
-        self.__transaction_date = datetime.now()
+        self.__transaction_date = transaction_date if transaction_date is not None else get_default_clock().now()
+        self.__details = details  # Optional extra data, e.g. contract termination outcome
     
     # Getter methods
+    def get_transaction_id(self):
+        return self.__transaction_id
+    
     def get_amount(self):
         return self.__amount
     
@@ -37,8 +55,16 @@ class Transaction:
     def get_account_type(self):
         return self.__account_type
     
+    def get_details(self):
+        return self.__details
+    
+    def get_signed_amount(self):
+        """Amount as its effect on the account balance"""
+        return TRANSACTION_SIGNS.get(self.__transaction_type, 0) * self.__amount
+    
     def show_transaction_info(self):
         """Display transaction information"""
+        print(f"Transaction ID: {self.__transaction_id}")
         print(f"Transaction type: {self.__transaction_type}")
         print(f"Transaction amount: {self.__amount}")
         print(f"Transaction date: {self.__transaction_date}")
@@ -4,8 +4,10 @@ Created Date: 2025-07-19
 Programmer: Kwanju Eun
 Description: Helper functions for user interface operations
 """
+from itertools import islice
 from accounts.base import BankAccount
 from accounts.types import SavingAccount, TimeDepositAccount, OverdraftAccount
+from exceptions import InvalidPasswordError, ContractValueError
 
 
 def create_account_with_input(bank):
@@ -54,84 +56,79 @@ def create_account_with_input(bank):
         return None
 
 
+ACCOUNTS_PER_PAGE = 10
+
+
+def choose_account_from_pages(accounts):
+    """Show accounts one page at a time and let the user pick one"""
+    accounts = iter(accounts)
+    page_number = 1
+    while True:
+        page = list(islice(accounts, ACCOUNTS_PER_PAGE))
+        if not page:
+            print("No matching accounts." if page_number == 1 else "No more accounts.")
+            return None
+        
+        print(f"\n=== Select Account (page {page_number}) ===")
+        for i, acc in enumerate(page, 1):
+            print(f"{i}. {acc.get_username()} - {acc.get_account_type()} (Account: {acc.get_account_number()})")
+        
+        choice = input("Enter list number, 'n' for next page, or Enter to cancel: ").strip()
+        if choice.lower() == 'n':
+            page_number += 1
+            continue
+        if not choice:
+            return None
+        try:
+            list_num = int(choice)
+            if 1 <= list_num <= len(page):
+                return page[list_num - 1]
+        except ValueError:
+            pass
+        print(f"Account not found.")
+        return None
+
+
 def select_account(bank):
-    """Select account from bank"""
-    accounts = bank.get_all_accounts()
-    if not accounts:
+    """Select account by account number or username search"""
+    if not bank.get_all_accounts():
         print("No accounts exist. Please create an account first.")
         return None
     
-    print("\n=== Select Account ===")
-    for i, acc in enumerate(accounts, 1):
-        print(f"{i}. {acc.get_username()} - {acc.get_account_type()} (Account: {acc.get_account_number()})")
-    
-    choice = input("Enter account number or list number: ")
+    choice = input("Enter account number or username (prefix search, Enter for all): ").strip()
     
     # Try to find by account number
     try:
-        acc_num = int(choice)
-        account = bank.get_account_by_number(acc_num)
+        account = bank.get_account_by_number(int(choice))
         if account:
             return account
     except ValueError:
         pass
     
-    # Try list number
+    # Search by username prefix
+    if choice:
+        return choose_account_from_pages(bank.find_accounts_by_username(choice))
+    return choose_account_from_pages(bank.iter_accounts())
+
+
+def terminate_contract_account(account, bank, password, idempotency_key=None):
+    """Terminate contract account and convert it into a normal BankAccount"""
     try:
-        list_num = int(choice)
-        if 1 <= list_num <= len(accounts):
-            return accounts[list_num - 1]
-    except ValueError:
-        pass
+        new_account = bank.convert_contract_account(account, password, idempotency_key)
+    except (InvalidPasswordError, ContractValueError) as e:
+        account._handle_exception(e)
+        return None
     
-    print(f"Account not found.")
-    return None
+    print(f"\nContract account closed.")
+    print(f"Converted to BankAccount with balance: {new_account.get_balance()}")
+    print(f"Account number: {new_account.get_account_number()}")
+    return new_account
 
 
 def handle_contract_termination(account, bank):
     """Handle contract account termination"""
-    # Store account info
-    username = account.get_username()
-    password = account.get_password()
-    interest_rate = account.get_interest_rate()
-    
-    # Get balance before termination
-    balance_before = account.get_balance()
-    
-    # Process termination
     pw = input("Enter password: ")
-    result = account.withdraw(0, pw)  # Withdraw triggers termination
-    
-    if result:
-        # Calculate withdrawn amount
-        withdrawn_amount = balance_before  # After termination, balance should be 0
-        
-        # Create new BankAccount
-        new_account = BankAccount(username, password, interest_rate)
-        bank.create_account(new_account)
-        
-        # Deposit the withdrawn amount
-        new_account.deposit(withdrawn_amount)
-        
-        # Add termination transaction
-        bank.add_transaction(
-            account.get_account_number(),
-            username,
-            account.get_account_type(),
-            withdrawn_amount,
-            "Contract Termination"
-        )
-        
-        # Remove old account
-        bank.remove_account(account)
-        
-        print(f"\nContract account closed.")
-        print(f"New BankAccount created with balance: {withdrawn_amount}")
-        print(f"New account number: {new_account.get_account_number()}")
-        
-        return new_account
-    
-    return None
+    return terminate_contract_account(account, bank, pw)
 
 
 def show_main_menu():
@@ -0,0 +1,87 @@
+"""
+File Name: username_index.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Sorted username index for exact and prefix account search
+"""
+from bisect import bisect_left, insort
+
+
+# Blocks are split when they grow past twice this many entries
+BLOCK_SIZE = 512
+
+
+class UsernameIndex:
+    """Sorted (case-folded username, account number) entries kept in blocks"""
+
+    def __init__(self):
+        self.__blocks = []  # sorted lists; every entry of a block sorts before the next block
+        self.__maxes = []  # last entry of each block
+        self.__size = 0  # entries in blocks, including removed ones
+        self.__live = set()  # entries not removed
+        self.__removed = set()  # entries still in blocks but removed
+
+    def __len__(self):
+        return len(self.__live)
+
+    def add(self, username, account_number):
+        entry = (username.casefold(), account_number)
+        if entry in self.__live:
+            return
+        self.__live.add(entry)
+        if entry in self.__removed:
+            self.__removed.discard(entry)
+            return
+        if not self.__blocks:
+            self.__blocks.append([entry])
+            self.__maxes.append(entry)
+            self.__size = 1
+            return
+        i = min(bisect_left(self.__maxes, entry), len(self.__blocks) - 1)
+        block = self.__blocks[i]
+        insort(block, entry)
+        self.__maxes[i] = block[-1]
+        self.__size += 1
+        if len(block) > 2 * BLOCK_SIZE:
+            self.__blocks[i:i + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+            self.__maxes[i:i + 1] = [block[BLOCK_SIZE - 1], block[-1]]
+
+    def add_many(self, pairs):
+        """Add many (username, account number) pairs, sorting once"""
+        self.__live.update((username.casefold(), number) for username, number in pairs)
+        self._rebuild(sorted(self.__live))
+
+    def _rebuild(self, entries):
+        self.__blocks = [entries[i:i + BLOCK_SIZE] for i in range(0, len(entries), BLOCK_SIZE)]
+        self.__maxes = [block[-1] for block in self.__blocks]
+        self.__size = len(entries)
+        self.__removed = set()
+
+    def remove(self, username, account_number):
+        """Mark the entry removed in O(1); the blocks are purged once half their entries are removed"""
+        entry = (username.casefold(), account_number)
+        if entry not in self.__live:
+            return
+        self.__live.discard(entry)
+        self.__removed.add(entry)
+        if 2 * len(self.__removed) > self.__size:
+            self._rebuild(sorted(self.__live))
+
+    def search(self, text, exact=False):
+        """Yield account numbers whose username equals / starts with text (case-insensitive)"""
+        key = text.casefold()
+        i = bisect_left(self.__maxes, (key,))
+        j = bisect_left(self.__blocks[i], (key,)) if i < len(self.__blocks) else 0
+        while i < len(self.__blocks):
+            block = self.__blocks[i]
+            while j < len(block):
+                entry = block[j]
+                name, account_number = entry
+                matched = name == key if exact else name.startswith(key)
+                if not matched:
+                    return
+                if entry not in self.__removed:
+                    yield account_number
+                j += 1
+            i += 1
+            j = 0
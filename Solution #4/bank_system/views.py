@@ -0,0 +1,36 @@
+"""
+File Name: views.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Read-only views over bank collections (no copying)
+"""
+from collections.abc import Sequence
+
+
+class ReadOnlySequence(Sequence):
+    """Read-only, live view of a list"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        # Slices return a list copy of the requested range only
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(len={len(self._items)})"
+
+    def snapshot(self):
+        """Return an isolated list copy"""
+        return list(self._items)
@@ -0,0 +1,336 @@
+"""
+File Name: writer.py
+Created Date: 2026-10-19
+Programmer: Kwanju Eun
+Description: Single writer thread applying queued Bank operations in batches, with published read state
+"""
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError
+
+
+# Bank methods that may be submitted by name
+WRITE_OPERATIONS = frozenset({
+    "deposit", "withdraw", "transfer", "transfer_batch", "reverse",
+    "create_account", "add_accounts", "remove_account", "convert_contract_account",
+    "compact_history", "archive_transactions", "flush", "snapshot",
+})
+
+# Target number of entries per page of a PagedMap
+PAGE_SIZE = 256
+
+_STOP = object()
+
+
+class PagedMap:
+    """Immutable key -> value map whose updates copy only the pages they touch"""
+
+    def __init__(self, pages=({},), size=0):
+        self.__pages = pages  # tuple of dicts; never changed after construction
+        self.__size = size
+
+    @classmethod
+    def build(cls, items):
+        """Map from (key, value) pairs"""
+        items = list(items)
+        count = max(1, len(items) // PAGE_SIZE)
+        pages = [{} for _ in range(count)]
+        for key, value in items:
+            pages[hash(key) % count][key] = value
+        return cls(tuple(pages), sum(len(page) for page in pages))
+
+    def __len__(self):
+        return self.__size
+
+    def __contains__(self, key):
+        return key in self.__pages[hash(key) % len(self.__pages)]
+
+    def get(self, key, default=None):
+        return self.__pages[hash(key) % len(self.__pages)].get(key, default)
+
+    def items(self):
+        for page in self.__pages:
+            yield from page.items()
+
+    def updated(self, changes, removed=()):
+        """New map with changes ({key: value}) applied and removed keys dropped"""
+        pages = list(self.__pages)
+        count = len(pages)
+        copied = set()
+        size = self.__size
+        for key, value in changes.items():
+            index = hash(key) % count
+            if index not in copied:
+                pages[index] = dict(pages[index])
+                copied.add(index)
+            if key not in pages[index]:
+                size += 1
+            pages[index][key] = value
+        for key in removed:
+            index = hash(key) % count
+            if key not in pages[index]:
+                continue
+            if index not in copied:
+                pages[index] = dict(pages[index])
+                copied.add(index)
+            del pages[index][key]
+            size -= 1
+        result = PagedMap(tuple(pages), size)
+        if size > 2 * count * PAGE_SIZE:
+            return PagedMap.build(result.items())
+        return result
+
+
+class PublishedState:
+    """Read-only bank state as of the end of one writer batch"""
+
+    def __init__(self, version, balances, accounts, usernames, total_balance, transaction_count,
+                 published_date=None):
+        self.__version = version
+        self.__balances = balances  # PagedMap: account number -> balance
+        self.__accounts = accounts  # PagedMap: account number -> (username, account type)
+        self.__usernames = usernames  # PagedMap: username -> tuple of account numbers
+        self.__total_balance = total_balance
+        self.__transaction_count = transaction_count
+        self.__published_date = published_date
+
+    # Getter methods
+    def get_version(self):
+        """Number of batches applied before this state"""
+        return self.__version
+
+    def get_balances(self):
+        """PagedMap of the balance of every open account"""
+        return self.__balances
+
+    def get_balance(self, account_number):
+        """Balance of the account, or None if it does not exist in this state"""
+        return self.__balances.get(account_number)
+
+    def get_accounts(self):
+        """PagedMap of (username, account type) of every open account"""
+        return self.__accounts
+
+    def get_account_info(self, account_number):
+        """(username, account type) of the account, or None if it does not exist in this state"""
+        return self.__accounts.get(account_number)
+
+    def get_usernames(self):
+        """PagedMap of the open account numbers of every username"""
+        return self.__usernames
+
+    def get_account_numbers(self, username):
+        """Numbers of the open accounts of username (exact match)"""
+        return self.__usernames.get(username, ())
+
+    def get_account_count(self):
+        return len(self.__balances)
+
+    def get_total_balance(self):
+        return self.__total_balance
+
+    def get_transaction_count(self):
+        """Ledger length (transaction ids 1..count are posted)"""
+        return self.__transaction_count
+
+    def get_published_date(self):
+        return self.__published_date
+
+
+class BankWriter:
+    """Owns all changes to a Bank: operations are queued and applied by one thread"""
+
+    def __init__(self, bank, batch_size=256):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        self.__bank = bank
+        self.__batch_size = batch_size
+        self.__queue = queue.SimpleQueue()
+        self.__closed = False
+        self.__error = None  # what stopped the writer thread, if it failed
+        self.__batches = 0
+        self.__applied = 0
+        accounts = list(bank.iter_accounts())
+        usernames = {}
+        for acc in accounts:
+            usernames[acc.get_username()] = usernames.get(acc.get_username(), ()) + (acc.get_account_number(),)
+        self.__state = PublishedState(0, PagedMap.build((acc.get_account_number(), acc.get_balance())
+                                                        for acc in accounts),
+                                      PagedMap.build((acc.get_account_number(), _account_info(acc))
+                                                     for acc in accounts),
+                                      PagedMap.build(usernames.items()),
+                                      bank.get_total_balance(), bank._transaction_count(),
+                                      bank.get_clock().now())
+        self.__thread = threading.Thread(target=self._run, name="bank-writer", daemon=True)
+        self.__thread.start()
+
+    def submit(self, operation, *args, **kwargs):
+        """Queue operation(*args, **kwargs) and return a Future for its result"""
+        if self.__error is not None:
+            raise RuntimeError("BankWriter has failed") from self.__error
+        if self.__closed:
+            raise RuntimeError("BankWriter is closed")
+        if not callable(operation) and operation not in WRITE_OPERATIONS:
+            raise ValueError(f"Not a write operation: {operation}")
+        future = Future()
+        self.__queue.put((future, operation, args, kwargs))
+        if self.__error is not None:
+            self._fail_queued()  # the writer failed while this was being queued
+        return future
+
+    def call(self, operation, *args, **kwargs):
+        """submit() and wait for the result (re-raises the operation's exception)"""
+        return self.submit(operation, *args, **kwargs).result()
+
+    def snapshot(self):
+        """BankSnapshot taken by the writer between two operations"""
+        return self.call("snapshot")
+
+    def get_state(self):
+        """Most recently published PublishedState"""
+        return self.__state
+
+    def get_bank(self):
+        return self.__bank
+
+    def get_error(self):
+        """Exception that stopped the writer thread, or None while it is healthy"""
+        return self.__error
+
+    def get_batch_count(self):
+        return self.__batches
+
+    def get_applied_count(self):
+        return self.__applied
+
+    def close(self):
+        """Apply everything already queued, publish, and stop the writer thread"""
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put(_STOP)
+            self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def _run(self):
+        commands = self.__queue
+        while True:
+            batch = [commands.get()]
+            while len(batch) < self.__batch_size and batch[-1] is not _STOP:
+                try:
+                    batch.append(commands.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            if batch:
+                try:
+                    self._apply(batch)
+                except BaseException as e:
+                    self.__error = e
+                    self._fail(future for future, _, _, _ in batch)
+                    self._fail_queued()
+                    return
+            if stop:
+                return
+
+    def _apply(self, batch):
+        """Run one batch in order, publish the new state, then complete the futures"""
+        bank = self.__bank
+        first_position = bank._transaction_count()
+        first_event = bank._account_event_count()
+        outcomes = []
+        for future, operation, args, kwargs in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if callable(operation):
+                    outcomes.append((future, True, operation(bank, *args, **kwargs)))
+                else:
+                    outcomes.append((future, True, getattr(bank, operation)(*args, **kwargs)))
+            except Exception as e:
+                outcomes.append((future, False, e))
+        self._publish(first_position, first_event)
+        self.__applied += len(outcomes)
+        # Callers see their result only once the state that includes it is published
+        for future, succeeded, value in outcomes:
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _fail(self, futures):
+        """Fail every unfinished future with the error that stopped the writer"""
+        for future in futures:
+            if future.done():
+                continue
+            error = RuntimeError("BankWriter has failed")
+            error.__cause__ = self.__error
+            try:
+                future.set_exception(error)
+            except InvalidStateError:
+                pass  # cancelled meanwhile
+
+    def _fail_queued(self):
+        """Fail every operation still on the queue (any thread may call this after a failure)"""
+        queued = []
+        while True:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                queued.append(item[0])
+        self._fail(queued)
+
+    def _publish(self, first_position, first_event):
+        """Publish every account with a ledger entry or account event since the batch began"""
+        bank = self.__bank
+        state = self.__state
+        balances = state.get_balances()
+        accounts = state.get_accounts()
+        changes = {}
+        info_changes = {}
+        removed = []
+        username_changes = {}
+        total = state.get_total_balance()
+        for account_number in bank._accounts_changed_since(first_position, first_event):
+            account = bank.get_account_by_number(account_number)
+            previous = balances.get(account_number, 0)
+            previous_info = accounts.get(account_number)
+            info = None if account is None else _account_info(account)
+            if account is None:
+                removed.append(account_number)
+                total -= previous
+            else:
+                changes[account_number] = account.get_balance()
+                total += account.get_balance() - previous
+                if info != previous_info:
+                    info_changes[account_number] = info
+            if previous_info is not None and (info is None or info[0] != previous_info[0]):
+                username = previous_info[0]
+                numbers = username_changes.get(username, state.get_account_numbers(username))
+                username_changes[username] = tuple(n for n in numbers if n != account_number)
+            if info is not None and (previous_info is None or info[0] != previous_info[0]):
+                username = info[0]
+                numbers = username_changes.get(username, state.get_account_numbers(username))
+                username_changes[username] = numbers + (account_number,)
+        emptied = [username for username, numbers in username_changes.items() if not numbers]
+        for username in emptied:
+            del username_changes[username]
+        self.__batches += 1
+        self.__state = PublishedState(state.get_version() + 1, balances.updated(changes, removed),
+                                      accounts.updated(info_changes, removed),
+                                      state.get_usernames().updated(username_changes, emptied),
+                                      total, bank._transaction_count(), bank.get_clock().now())
+
+
+def _account_info(account):
+    """Published (username, account type) of an account"""
+    return account.get_username(), account.get_account_type()